@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import threading
+from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any
 from uuid import uuid4
 
 from loguru import logger
 
+from app.utils import atomic_write_bytes, json_dumps_bytes, json_loads
+
 _instance: "Config | None" = None
+_instance_lock = threading.Lock()
 
 # Default data directory
 _DEFAULT_DATA_DIR = Path.home() / "Documents" / "EmulatorManager"
@@ -20,19 +26,74 @@ _DEFAULT_DATA_DIR = Path.home() / "Documents" / "EmulatorManager"
 def get_config() -> Config:
     """Module-level factory — single global Config instance."""
     global _instance
-    if _instance is None:
-        _instance = Config()
-    return _instance
+    inst = _instance
+    if inst is None:
+        with _instance_lock:
+            inst = _instance
+            if inst is None:
+                inst = Config()
+                _instance = inst
+    return inst
 
 
 def reset_config() -> None:
     """Reset the global config instance (for testing)."""
     global _instance
-    _instance = None
+    with _instance_lock:
+        _instance = None
+
+
+@dataclass(frozen=True, slots=True)
+class _ConfigView:
+    """Pre-parsed typed fields, rebuilt whenever the config snapshot changes."""
+
+    language: str
+    theme: str
+    backup_path: Path | None
+    sync_folder: Path | None
+    max_backups: int
+    machine_id: str
+    auto_scan_on_start: bool
+    auto_sync_on_start: bool
+    rom_directories: dict[str, list[str]]
+    emulators: dict[str, dict[str, Any]]
+    scraper_config: dict[str, Any]
+    rename_config: dict[str, Any]
+    artwork_dir: Path
+    field_priority: dict[str, list[str]]
+
+
+def _build_view(data: dict[str, Any], data_dir: Path) -> _ConfigView:
+    backup_raw = data.get("backup_path", "")
+    sync_raw = data.get("sync_folder", "")
+    scraper = data.get("scraper", {})
+    artwork_raw = scraper.get("artwork_dir", "")
+    return _ConfigView(
+        language=data.get("language", "zh_CN"),
+        theme=data.get("theme", "auto"),
+        backup_path=Path(backup_raw) if backup_raw else None,
+        sync_folder=Path(sync_raw) if sync_raw else None,
+        max_backups=int(data.get("max_backups", 5)),
+        machine_id=data.get("machine_id", ""),
+        auto_scan_on_start=bool(data.get("auto_scan_on_start", False)),
+        auto_sync_on_start=bool(data.get("auto_sync_on_start", False)),
+        rom_directories=data.get("rom_directories", {}),
+        emulators=data.get("emulators", {}),
+        scraper_config=scraper,
+        rename_config=data.get("rename", {}),
+        artwork_dir=Path(artwork_raw) if artwork_raw else data_dir / "artwork",
+        field_priority=scraper.get("field_priority", {}),
+    )
 
 
 class Config:
-    """JSON-based application configuration with file locking."""
+    """JSON-based application configuration with file locking.
+
+    ``_data`` is treated as an immutable snapshot: writers build a new dict
+    along the changed key path and swap the reference under ``_lock``, so
+    readers take one reference load and never need the lock.  Typed
+    properties read from ``_view``, a parsed struct rebuilt on every swap.
+    """
 
     _DEFAULTS: dict[str, Any] = {
         "language": "zh_CN",
@@ -46,6 +107,8 @@ class Config:
         "auto_sync_on_start": False,
         # ROM management
         "rom_directories": {},
+        "scan_workers": 0,  # 0 = one per CPU; 1 = sequential (e.g. spinning disks)
+        "eager_crc32": True,  # False: hash ROMs on demand instead of during scan
         # Scraper
         "scraper": {
             "proxy_protocol": "http",
@@ -93,26 +156,29 @@ class Config:
 
     def __init__(self, config_dir: Path | None = None) -> None:
         self._data: dict[str, Any] = {}
+        self._view: _ConfigView
         self._dir = config_dir or _DEFAULT_DATA_DIR
         self._path = self._dir / "config.json"
         self._lock = threading.Lock()
-        self._defer_save = False
+        self._batch_depth = 0
         self._load()
 
     def _load(self) -> None:
         """Load config from disk, merging with defaults."""
-        self._data = json.loads(json.dumps(self._DEFAULTS))  # deep copy defaults
+        data = copy.deepcopy(self._DEFAULTS)
         if self._path.exists():
             try:
-                with open(self._path, encoding="utf-8") as f:
-                    user_data = json.load(f)
-                self._deep_merge(self._data, user_data)
+                user_data = json_loads(self._path.read_bytes())
+                self._deep_merge(data, user_data)
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(f"Failed to load config, using defaults: {e}")
 
         # Ensure machine_id
-        if not self._data.get("machine_id"):
-            self._data["machine_id"] = uuid4().hex[:12]
+        needs_save = not data.get("machine_id")
+        if needs_save:
+            data["machine_id"] = uuid4().hex[:12]
+        self._swap(data)
+        if needs_save:
             self._save()
 
     def _deep_merge(self, base: dict, override: dict) -> None:
@@ -125,29 +191,30 @@ class Config:
 
     def _save(self) -> None:
         """Persist config to disk with file locking."""
-        if self._defer_save:
+        if self._batch_depth:
             return
         with self._lock:
             self._dir.mkdir(parents=True, exist_ok=True)
-            tmp_path = self._path.with_suffix(".tmp")
+            payload = json_dumps_bytes(self._data)
             try:
-                with open(tmp_path, "w", encoding="utf-8") as f:
-                    json.dump(self._data, f, ensure_ascii=False, indent=2)
-                tmp_path.replace(self._path)
+                atomic_write_bytes(self._path, payload)
             except OSError as e:
                 logger.error(f"Failed to save config: {e}")
-                if tmp_path.exists():
-                    tmp_path.unlink(missing_ok=True)
 
     @contextmanager
     def batch_update(self) -> Iterator[None]:
-        """Context manager for batching multiple config changes into a single write."""
-        self._defer_save = True
+        """Context manager for batching multiple config changes into a single write.
+
+        Preferred entry point whenever more than one key changes.  Nested
+        batches are folded into the outermost one.
+        """
+        self._batch_depth += 1
         try:
             yield
         finally:
-            self._defer_save = False
-            self._save()
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._save()
 
     # ── Generic access ──
 
@@ -164,14 +231,37 @@ class Config:
 
     def set(self, key: str, value: Any) -> None:
         """Set a config value by dot-separated key path."""
+        with self._lock:
+            self._swap(self._with_path(self._data, key, value))
+        self._save()
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Set several dot-separated key paths with a single write."""
+        with self._lock:
+            data = self._data
+            for key, value in items.items():
+                data = self._with_path(data, key, value)
+            self._swap(data)
+        self._save()
+
+    def _swap(self, data: dict[str, Any]) -> None:
+        """Publish a new snapshot and its typed view."""
+        self._view = _build_view(data, self._dir)
+        self._data = data
+
+    @staticmethod
+    def _with_path(root: dict[str, Any], key: str, value: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Return a copy of *root* with *key* set; only dicts on the path are copied."""
         parts = key.split(".")
-        node = self._data
+        new_root = dict(root)
+        node = new_root
         for part in parts[:-1]:
-            if part not in node or not isinstance(node[part], dict):
-                node[part] = {}
-            node = node[part]
+            child = node.get(part)
+            child = dict(child) if isinstance(child, dict) else {}
+            node[part] = child
+            node = child
         node[parts[-1]] = value
-        self._save()
+        return new_root
 
     # ── Typed properties ──
 
@@ -181,7 +271,7 @@ class Config:
 
     @property
     def language(self) -> str:
-        return self._data.get("language", "zh_CN")
+        return self._view.language
 
     @language.setter
     def language(self, value: str) -> None:
@@ -189,7 +279,7 @@ class Config:
 
     @property
     def theme(self) -> str:
-        return self._data.get("theme", "auto")
+        return self._view.theme
 
     @theme.setter
     def theme(self, value: str) -> None:
@@ -197,8 +287,7 @@ class Config:
 
     @property
     def backup_path(self) -> Path | None:
-        raw = self._data.get("backup_path", "")
-        return Path(raw) if raw else None
+        return self._view.backup_path
 
     @backup_path.setter
     def backup_path(self, value: Path | None) -> None:
@@ -206,8 +295,7 @@ class Config:
 
     @property
     def sync_folder(self) -> Path | None:
-        raw = self._data.get("sync_folder", "")
-        return Path(raw) if raw else None
+        return self._view.sync_folder
 
     @sync_folder.setter
     def sync_folder(self, value: Path | None) -> None:
@@ -215,7 +303,7 @@ class Config:
 
     @property
     def max_backups(self) -> int:
-        return int(self._data.get("max_backups", 5))
+        return self._view.max_backups
 
     @max_backups.setter
     def max_backups(self, value: int) -> None:
@@ -223,11 +311,11 @@ class Config:
 
     @property
     def machine_id(self) -> str:
-        return self._data.get("machine_id", "")
+        return self._view.machine_id
 
     @property
     def auto_scan_on_start(self) -> bool:
-        return bool(self._data.get("auto_scan_on_start", False))
+        return self._view.auto_scan_on_start
 
     @auto_scan_on_start.setter
     def auto_scan_on_start(self, value: bool) -> None:
@@ -235,7 +323,7 @@ class Config:
 
     @property
     def auto_sync_on_start(self) -> bool:
-        return bool(self._data.get("auto_sync_on_start", False))
+        return self._view.auto_sync_on_start
 
     @auto_sync_on_start.setter
     def auto_sync_on_start(self, value: bool) -> None:
@@ -243,7 +331,7 @@ class Config:
 
     @property
     def rom_directories(self) -> dict[str, list[str]]:
-        return self._data.get("rom_directories", {})
+        return self._view.rom_directories
 
     @rom_directories.setter
     def rom_directories(self, value: dict[str, list[str]]) -> None:
@@ -251,23 +339,20 @@ class Config:
 
     @property
     def emulators(self) -> dict[str, dict[str, Any]]:
-        return self._data.get("emulators", {})
+        return self._view.emulators
 
     @property
     def scraper_config(self) -> dict[str, Any]:
-        return self._data.get("scraper", {})
+        return self._view.scraper_config
 
     @property
     def rename_config(self) -> dict[str, Any]:
-        return self._data.get("rename", {})
+        return self._view.rename_config
 
     @property
     def artwork_dir(self) -> Path:
-        raw = self.scraper_config.get("artwork_dir", "")
-        if raw:
-            return Path(raw)
-        return self._dir / "artwork"
+        return self._view.artwork_dir
 
     @property
     def field_priority(self) -> dict[str, list[str]]:
-        return self.scraper_config.get("field_priority", {})
+        return self._view.field_priority
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+import os
+import shutil
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -13,6 +18,7 @@ from loguru import logger
 
 from app.core.path_resolver import to_portable_path
 from app.models.backup_record import BackupInfo, BackupPathInfo, BackupRecord
+from app.utils import atomic_write_bytes, json_dumps_bytes, json_loads
 
 if TYPE_CHECKING:
     from app.config import Config
@@ -40,22 +46,27 @@ class BackupManager:
     def backup_root(self) -> Path | None:
         return self._config.backup_path
 
+    def _resolved_backup_root(self) -> Path:
+        return self.backup_root or self._config.data_dir / "backups"
+
     def _ensure_backup_root(self) -> Path:
-        root = self.backup_root
-        if not root:
-            root = self._config.data_dir / "backups"
+        root = self._resolved_backup_root()
         root.mkdir(parents=True, exist_ok=True)
         return root
 
-    def _game_backup_dir(self, emulator: str, game_id: str) -> Path:
-        root = self._ensure_backup_root()
-        d = root / emulator / game_id
+    def _game_backup_dir_read(self, emulator: str, game_id: str) -> Path:
+        """Backup directory for a game — read path, never creates it."""
+        return self._resolved_backup_root() / emulator / game_id
+
+    def _game_backup_dir_write(self, emulator: str, game_id: str) -> Path:
+        """Backup directory for a game — created on demand."""
+        d = self._ensure_backup_root() / emulator / game_id
         d.mkdir(parents=True, exist_ok=True)
         return d
 
     def create_backup(self, game_save: GameSave) -> BackupRecord:
         """Create a versioned ZIP backup for a game save."""
-        backup_dir = self._game_backup_dir(game_save.emulator, game_save.game_id)
+        backup_dir = self._game_backup_dir_write(game_save.emulator, game_save.game_id)
         timestamp = datetime.now(tz=timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
 
         zip_path = backup_dir / f"{timestamp}.zip"
@@ -81,39 +92,105 @@ class BackupManager:
         logger.info(f"Created backup: {zip_path.name} for {game_save.game_name}")
         return record
 
+    _COPY_BUFSIZE = 1 << 20  # 1 MiB
+    _PARALLEL_MIN_FILES = 8  # below this, a thread pool costs more than it saves
+    _PREFETCH_MAX_SIZE = 8 << 20  # larger files are streamed instead of read whole
+
     def _write_zip(self, game_save: GameSave, zip_path: Path) -> list[BackupPathInfo]:
         """Write save files into a ZIP archive."""
+        entries, backup_paths = self._collect_entries(game_save)
+
+        with (
+            open(zip_path, "wb", buffering=self._COPY_BUFSIZE) as raw,
+            zipfile.ZipFile(raw, "w", zipfile.ZIP_DEFLATED, compresslevel=6) as zf,
+        ):
+            if len(entries) < self._PARALLEL_MIN_FILES:
+                for source, arcname in entries:
+                    self._add_file(zf, source, arcname)
+            else:
+                self._add_files_parallel(zf, entries)
+
+        return backup_paths
+
+    @staticmethod
+    def _collect_entries(
+        game_save: GameSave,
+    ) -> tuple[list[tuple[Path, str]], list[BackupPathInfo]]:
+        """Enumerate ``(source, arcname)`` pairs and the sidecar path info for a save."""
+        entries: list[tuple[Path, str]] = []
         backup_paths: list[BackupPathInfo] = []
 
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for save_file in game_save.files:
-                source = Path(save_file.path)
-                if source.is_dir():
-                    for child in source.rglob("*"):
-                        if child.is_file():
-                            zip_entry = f"{save_file.save_type}/{source.name}/{child.relative_to(source)}"
-                            zf.write(child, zip_entry)
-                    backup_paths.append(
-                        BackupPathInfo(
-                            source=to_portable_path(source),
-                            save_type=save_file.save_type,
-                            zip_path=f"{save_file.save_type}/{source.name}",
-                            is_dir=True,
-                        )
+        for save_file in game_save.files:
+            source = Path(save_file.path)
+            if source.is_dir():
+                for child in source.rglob("*"):
+                    if child.is_file():
+                        rel = child.relative_to(source)
+                        zip_entry = f"{save_file.save_type}/{source.name}/{rel}"
+                        entries.append((child, zip_entry))
+                backup_paths.append(
+                    BackupPathInfo(
+                        source=to_portable_path(source),
+                        save_type=save_file.save_type,
+                        zip_path=f"{save_file.save_type}/{source.name}",
+                        is_dir=True,
                     )
-                elif source.is_file():
-                    zip_entry = f"{save_file.save_type}/{source.name}"
-                    zf.write(source, zip_entry)
-                    backup_paths.append(
-                        BackupPathInfo(
-                            source=to_portable_path(source),
-                            save_type=save_file.save_type,
-                            zip_path=zip_entry,
-                            is_dir=False,
-                        )
+                )
+            elif source.is_file():
+                zip_entry = f"{save_file.save_type}/{source.name}"
+                entries.append((source, zip_entry))
+                backup_paths.append(
+                    BackupPathInfo(
+                        source=to_portable_path(source),
+                        save_type=save_file.save_type,
+                        zip_path=zip_entry,
+                        is_dir=False,
                     )
+                )
 
-        return backup_paths
+        return entries, backup_paths
+
+    @classmethod
+    def _add_file(cls, zf: zipfile.ZipFile, source: Path, arcname: str) -> None:
+        """Stream *source* into *zf* in large chunks."""
+        zinfo = zipfile.ZipInfo.from_file(source, arcname)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        with open(source, "rb", buffering=0) as src, zf.open(zinfo, "w", force_zip64=True) as dst:
+            shutil.copyfileobj(src, dst, cls._COPY_BUFSIZE)
+
+    @classmethod
+    def _prefetch(cls, source: Path, arcname: str) -> tuple[zipfile.ZipInfo, bytes | None]:
+        """Stat and read a small file on a worker thread (``None`` = too big, stream it)."""
+        zinfo = zipfile.ZipInfo.from_file(source, arcname)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        if zinfo.file_size > cls._PREFETCH_MAX_SIZE:
+            return zinfo, None
+        with open(source, "rb", buffering=0) as f:
+            return zinfo, f.read()
+
+    @classmethod
+    def _add_files_parallel(cls, zf: zipfile.ZipFile, entries: list[tuple[Path, str]]) -> None:
+        """Read files ahead on a thread pool while the ZIP is written in order."""
+        workers = min(8, os.cpu_count() or 1)
+        pending: deque[tuple[Path, str, Future[tuple[zipfile.ZipInfo, bytes | None]]]] = deque()
+        it = iter(entries)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Bounded read-ahead window keeps memory flat on huge saves
+            for source, arcname in itertools.islice(it, workers * 2):
+                pending.append((source, arcname, pool.submit(cls._prefetch, source, arcname)))
+
+            while pending:
+                source, arcname, future = pending.popleft()
+                nxt = next(it, None)
+                if nxt is not None:
+                    pending.append((*nxt, pool.submit(cls._prefetch, *nxt)))
+
+                zinfo, data = future.result()
+                if data is None:
+                    cls._add_file(zf, source, arcname)
+                else:
+                    zf.writestr(zinfo, data)
 
     def _write_sidecar(
         self,
@@ -131,13 +208,22 @@ class BackupManager:
             source_machine=self._config.machine_id,
             backup_paths=backup_paths,
         )
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(asdict(info), f, ensure_ascii=False, indent=2)
+        atomic_write_bytes(meta_path, json_dumps_bytes(asdict(info)))
 
     def _rotate_backups(self, emulator: str, game_id: str) -> None:
         """Remove oldest non-pinned backups exceeding max_backups."""
-        records = self.list_backups(emulator, game_id)
         max_backups = self._config.max_backups
+
+        # Fast path: nothing to rotate, skip parsing every sidecar
+        try:
+            with os.scandir(self._game_backup_dir_read(emulator, game_id)) as it:
+                count = sum(1 for e in it if e.name.endswith(".json"))
+        except OSError:
+            return
+        if count <= max_backups:
+            return
+
+        records = self.list_backups(emulator, game_id)
         unpinned = [r for r in records if not r.is_pinned]
 
         while len(unpinned) > max_backups:
@@ -151,32 +237,43 @@ class BackupManager:
 
     def list_backups(self, emulator: str, game_id: str) -> list[BackupRecord]:
         """List all backups for a game, newest first, with version numbers assigned."""
-        backup_dir = self._game_backup_dir(emulator, game_id)
-        if not backup_dir.exists():
+        backup_dir = self._game_backup_dir_read(emulator, game_id)
+        return self._read_backup_dir(backup_dir, emulator, game_id)
+
+    def _read_backup_dir(
+        self, backup_dir: str | Path, emulator: str, game_id: str
+    ) -> list[BackupRecord]:
+        """Parse every sidecar in *backup_dir* once; newest first, versions assigned."""
+        try:
+            with os.scandir(backup_dir) as it:
+                files = {entry.name: entry for entry in it if entry.is_file()}
+        except OSError:
             return []
 
+        # Timestamped names (YYYY-MM-DD_HH-MM-SS) sort chronologically as strings
+        meta_names = sorted((n for n in files if n.endswith(".json")), reverse=True)
+
         records: list[BackupRecord] = []
-        for meta_file in sorted(backup_dir.glob("*.json"), reverse=True):
-            zip_file = meta_file.with_suffix(".zip")
-            if not zip_file.exists():
+        for meta_name in meta_names:
+            zip_entry = files.get(meta_name[: -len(".json")] + ".zip")
+            if zip_entry is None:
                 continue
+            meta_path = files[meta_name].path
             try:
-                with open(meta_file, encoding="utf-8") as f:
-                    meta = json.load(f)
-                record = BackupRecord(
-                    zip_path=str(zip_file),
-                    meta_path=str(meta_file),
-                    emulator=meta.get("emulator", emulator),
-                    game_id=meta.get("game_id", game_id),
-                    game_name=meta.get("game_name", ""),
-                    platform=meta.get("platform", ""),
-                    crc32=meta.get("crc32", ""),
-                    size=zip_file.stat().st_size,
-                    source_machine=meta.get("source_machine", ""),
+                with open(meta_path, "rb") as f:
+                    meta = json_loads(f.read())
+                records.append(
+                    BackupRecord.from_meta(
+                        meta,
+                        zip_path=zip_entry.path,
+                        meta_path=meta_path,
+                        size=zip_entry.stat().st_size,
+                        emulator=emulator,
+                        game_id=game_id,
+                    )
                 )
-                records.append(record)
             except (json.JSONDecodeError, OSError) as e:
-                logger.warning(f"Skipping malformed backup metadata: {meta_file}: {e}")
+                logger.warning(f"Skipping malformed backup metadata: {meta_path}: {e}")
 
         # Assign version numbers: oldest=1, newest=N
         for i, record in enumerate(reversed(records), start=1):
@@ -186,21 +283,26 @@ class BackupManager:
 
     def list_all_backups(self) -> dict[str, dict[str, list[BackupRecord]]]:
         """List all backups grouped by emulator → game_id."""
-        root = self._ensure_backup_root()
+        root = self._resolved_backup_root()
         result: dict[str, dict[str, list[BackupRecord]]] = {}
-        if not root.exists():
+
+        try:
+            with os.scandir(root) as emu_it:
+                emu_dirs = [e for e in emu_it if e.is_dir()]
+        except OSError:
             return result
 
-        for emu_dir in root.iterdir():
-            if not emu_dir.is_dir():
-                continue
-            emu_name = emu_dir.name
+        for emu_entry in emu_dirs:
+            emu_name = emu_entry.name
             result[emu_name] = {}
-            for game_dir in emu_dir.iterdir():
-                if not game_dir.is_dir():
-                    continue
-                game_id = game_dir.name
-                records = self.list_backups(emu_name, game_id)
+            try:
+                with os.scandir(emu_entry.path) as game_it:
+                    game_dirs = [g for g in game_it if g.is_dir()]
+            except OSError:
+                continue
+            for game_entry in game_dirs:
+                game_id = game_entry.name
+                records = self._read_backup_dir(game_entry.path, emu_name, game_id)
                 if records:
                     result[emu_name][game_id] = records
 
@@ -211,12 +313,10 @@ class BackupManager:
         meta_path = Path(record.meta_path)
         if meta_path.exists():
             try:
-                with open(meta_path, encoding="utf-8") as f:
-                    meta = json.load(f)
+                meta = json_loads(meta_path.read_bytes())
                 meta["is_pinned"] = True
                 meta["pin_label"] = label
-                with open(meta_path, "w", encoding="utf-8") as f:
-                    json.dump(meta, f, ensure_ascii=False, indent=2)
+                atomic_write_bytes(meta_path, json_dumps_bytes(meta))
                 record.is_pinned = True
                 record.pin_label = label
             except (json.JSONDecodeError, OSError) as e:
@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
+if TYPE_CHECKING:
+    import httpx
+
 # Type alias for cover art resolvers
 CoverResolver = Callable[[str], list[str] | None]
 
+# Concurrent cover downloads; each is a mostly idle HTTP round trip
+_DOWNLOAD_WORKERS = 16
+
+# Cached icon file names, in lookup priority order
+_ICON_NAMES = tuple(f"icon{ext}" for ext in (".jpg", ".png", ".jpeg", ".webp"))
+
 
 class GameIconProvider:
     """Downloads and caches game cover art/icons."""
@@ -17,6 +30,8 @@ class GameIconProvider:
     def __init__(self, cache_dir: Path | None = None) -> None:
         self._cache_dir = cache_dir
         self._resolvers: dict[str, CoverResolver] = {}
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
 
     def register_resolver(self, platform: str, resolver: CoverResolver) -> None:
         """Register a cover art resolver for a platform."""
@@ -27,19 +42,45 @@ class GameIconProvider:
         if self._cache_dir is None:
             return None
         icon_dir = self._cache_dir / platform / game_id
-        for ext in (".jpg", ".png", ".jpeg", ".webp"):
-            icon = icon_dir / f"icon{ext}"
-            if icon.exists():
-                return icon
+        try:
+            with os.scandir(icon_dir) as it:
+                names = {entry.name for entry in it if entry.name.startswith("icon")}
+        except OSError:
+            return None
+        for name in _ICON_NAMES:
+            if name in names:
+                return icon_dir / name
         return None
 
+    def _get_client(self) -> httpx.Client:
+        """Shared pooled HTTP client, created on first use."""
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    import httpx
+
+                    client = httpx.Client(
+                        timeout=30,
+                        follow_redirects=True,
+                        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                    )
+                    self._client = client
+        return client
+
+    def close(self) -> None:
+        """Close the pooled HTTP client (a new one is created on next download)."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
     def download_icon(self, platform: str, game_id: str, url: str) -> Path | None:
         """Download an icon from a URL and cache it locally."""
         if self._cache_dir is None:
             return None
 
-        import httpx
-
         icon_dir = self._cache_dir / platform / game_id
         icon_dir.mkdir(parents=True, exist_ok=True)
 
@@ -51,11 +92,21 @@ class GameIconProvider:
             return icon_path
 
         try:
-            with httpx.Client(timeout=30, follow_redirects=True) as client:
-                resp = client.get(url)
-                resp.raise_for_status()
-                icon_path.write_bytes(resp.content)
+            resp = self._get_client().get(url)
+            resp.raise_for_status()
+            icon_path.write_bytes(resp.content)
             return icon_path
         except Exception as e:
             logger.warning(f"Failed to download icon for {platform}:{game_id}: {e}")
             return None
+
+    def download_icons(self, items: Iterable[tuple[str, str, str]]) -> list[Path | None]:
+        """Download many ``(platform, game_id, url)`` icons concurrently.
+
+        Results are returned in input order; failed downloads yield ``None``.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [self.download_icon(*item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(_DOWNLOAD_WORKERS, len(items))) as pool:
+            return list(pool.map(lambda item: self.download_icon(*item), items))
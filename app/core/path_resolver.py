@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 from pathlib import Path
@@ -30,6 +31,7 @@ def _get_documents_path() -> Path:
     return Path.home() / "Documents"
 
 
+@functools.cache
 def _resolve_placeholders() -> dict[str, Path]:
     """Build the placeholder-to-path mapping for the current system."""
     return {
@@ -42,23 +44,37 @@ def _resolve_placeholders() -> dict[str, Path]:
     }
 
 
+@functools.cache
+def _sorted_placeholders() -> tuple[tuple[str, str, int], ...]:
+    """``(placeholder, normcased_resolved, len)`` tuples, longest path first."""
+    items = [
+        (ph, os.path.normcase(str(resolved))) for ph, resolved in _resolve_placeholders().items()
+    ]
+    # Sort by longest path first to get the most specific match
+    items.sort(key=lambda x: len(x[1]), reverse=True)
+    return tuple((ph, resolved_norm, len(resolved_norm)) for ph, resolved_norm in items)
+
+
+def invalidate_cache() -> None:
+    """Drop the cached placeholder mapping (e.g. after changing ``os.environ``)."""
+    _resolve_placeholders.cache_clear()
+    _sorted_placeholders.cache_clear()
+
+
 def to_portable_path(path: str | Path) -> str:
     """Convert an absolute path to a portable path string with placeholders."""
     path_str = str(Path(path).resolve())
-    mapping = _resolve_placeholders()
-    # Sort by longest path first to get the most specific match
-    sorted_items = sorted(mapping.items(), key=lambda x: len(str(x[1])), reverse=True)
-    for placeholder, resolved in sorted_items:
-        resolved_str = str(resolved)
-        if path_str.startswith(resolved_str):
-            return placeholder + path_str[len(resolved_str) :]
+    # Windows paths compare case-insensitively; keep the original casing in the tail
+    path_norm = os.path.normcase(path_str)
+    for placeholder, resolved_norm, resolved_len in _sorted_placeholders():
+        if path_norm.startswith(resolved_norm):
+            return placeholder + path_str[resolved_len:]
     return path_str
 
 
 def from_portable_path(portable: str) -> Path:
     """Convert a portable path string back to an absolute Path."""
-    mapping = _resolve_placeholders()
-    for placeholder, resolved in mapping.items():
+    for placeholder, resolved in _resolve_placeholders().items():
         if portable.startswith(placeholder):
             return resolved / portable[len(placeholder) :].lstrip("/\\")
     return Path(portable)
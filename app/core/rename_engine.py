@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 
 from app.utils import sanitize_filename
@@ -40,12 +41,150 @@ BUILTIN_TOKENS: dict[str, str] = {
 }
 
 # Regex patterns for template parsing
-_VAR_PATTERN = re.compile(r"\{([^}]+)\}")
 _FALLBACK_PATTERN = re.compile(r"^([\w]+(?:\|[\w]+)+)$")
-_CONDITIONAL_PATTERN = re.compile(r"^\?(\w+):(.+)$")
+_CONDITIONAL_PATTERN = re.compile(r"^\?(\w+):(.+)$", re.DOTALL)
 _SEQ_PATTERN = re.compile(r"^seq(?::(\d+))?$")
 
 
+# ── Compiled template ops ──
+
+
+@dataclass(frozen=True, slots=True)
+class _Literal:
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Var:
+    key: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Fallback:
+    keys: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Cond:
+    key: str
+    body: tuple[_Op, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Seq:
+    width: int
+
+
+_Op = _Literal | _Var | _Fallback | _Cond | _Seq
+
+
+def _compile_expr(expr: str) -> _Op:
+    """Classify the contents of one ``{…}`` group."""
+    # Sequence: {seq} or {seq:3}
+    seq_m = _SEQ_PATTERN.match(expr)
+    if seq_m:
+        return _Seq(int(seq_m.group(1)) if seq_m.group(1) else 1)
+
+    # Conditional: {?version:v{version}}
+    cond_m = _CONDITIONAL_PATTERN.match(expr)
+    if cond_m:
+        return _Cond(cond_m.group(1), _compile_template(cond_m.group(2)))
+
+    # Fallback: {title_zh|title_en|title_ja}
+    if _FALLBACK_PATTERN.match(expr):
+        return _Fallback(tuple(expr.split("|")))
+
+    # Simple variable
+    return _Var(expr)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(template: str) -> tuple[_Op, ...]:
+    """Parse *template* once into a flat op list; ``{…}`` groups may nest."""
+    ops: list[_Op] = []
+    literal: list[str] = []
+    i = 0
+    n = len(template)
+    while i < n:
+        ch = template[i]
+        if ch != "{":
+            literal.append(ch)
+            i += 1
+            continue
+
+        # Find the matching close brace
+        depth = 0
+        end = -1
+        for j in range(i, n):
+            if template[j] == "{":
+                depth += 1
+            elif template[j] == "}":
+                depth -= 1
+                if depth == 0:
+                    end = j
+                    break
+
+        if end == -1 or end == i + 1:
+            # Unbalanced or empty "{}" — keep as literal text
+            literal.append(ch)
+            i += 1
+            continue
+
+        if literal:
+            ops.append(_Literal("".join(literal)))
+            literal.clear()
+        ops.append(_compile_expr(template[i + 1 : end]))
+        i = end + 1
+
+    if literal:
+        ops.append(_Literal("".join(literal)))
+    return tuple(ops)
+
+
+@functools.lru_cache(maxsize=64)
+def _referenced_keys(template: str) -> frozenset[str]:
+    """Every context key *template* can read, including inside conditionals."""
+    keys: set[str] = set()
+    stack = list(_compile_template(template))
+    while stack:
+        match stack.pop():
+            case _Var(key):
+                keys.add(key)
+            case _Fallback(fallback_keys):
+                keys.update(fallback_keys)
+            case _Cond(key, body):
+                keys.add(key)
+                stack.extend(body)
+    return frozenset(keys)
+
+
+def _execute(ops: tuple[_Op, ...], context: dict[str, str], seq: int) -> str:
+    """Render compiled *ops* against *context* (unsanitized)."""
+    parts: list[str] = []
+    for op in ops:
+        match op:
+            case _Literal(text):
+                parts.append(text)
+            case _Var(key):
+                parts.append(context.get(key, ""))
+            case _Fallback(keys):
+                for key in keys:
+                    val = context.get(key, "")
+                    if val:
+                        parts.append(str(val))
+                        break
+            case _Cond(key, body):
+                if context.get(key):
+                    parts.append(_execute(body, context, seq))
+            case _Seq(width):
+                parts.append(str(seq).zfill(width))
+    return "".join(parts)
+
+
+def _render(ops: tuple[_Op, ...], context: dict[str, str], seq: int = 0) -> str:
+    return sanitize_filename(_execute(ops, context, seq))
+
+
 class RenameEngine:
     """
     Template-based rename engine.
@@ -71,10 +210,23 @@ class RenameEngine:
         """Register a custom variable."""
         self._custom_tokens[token.key] = token
 
+    @staticmethod
+    def referenced_keys(template: str) -> frozenset[str]:
+        """Context keys *template* uses — callers need not build the others."""
+        return _referenced_keys(template)
+
     def preview(self, template: str, context: dict[str, str], seq: int = 0) -> str:
         """Preview a single rename result."""
         return self._resolve_template(template, context, seq)
 
+    @staticmethod
+    def compile(template: str) -> functools.partial[str]:
+        """Bind *template* once for loops with a fixed template.
+
+        ``engine.compile(t)(context, seq)`` equals ``engine.preview(t, context, seq)``.
+        """
+        return functools.partial(_render, _compile_template(template))
+
     def batch_preview(
         self,
         template: str,
@@ -85,10 +237,11 @@ class RenameEngine:
 
         Returns: [(original_filename, new_filename), ...]
         """
+        ops = _compile_template(template)
         results: list[tuple[str, str]] = []
         for i, ctx in enumerate(items):
             original = Path(ctx.get("_rom_path", "")).name if "_rom_path" in ctx else ""
-            new_name = self._resolve_template(template, ctx, seq=i + 1)
+            new_name = _render(ops, ctx, i + 1)
             results.append((original, new_name))
         return results
 
@@ -112,38 +265,4 @@ class RenameEngine:
 
     def _resolve_template(self, template: str, context: dict[str, str], seq: int = 0) -> str:
         """Core template resolution logic."""
-
-        def replace_match(match: re.Match[str]) -> str:
-            expr = match.group(1)
-
-            # Sequence: {seq} or {seq:3}
-            seq_m = _SEQ_PATTERN.match(expr)
-            if seq_m:
-                width = int(seq_m.group(1)) if seq_m.group(1) else 1
-                return str(seq).zfill(width)
-
-            # Conditional: {?version:v{version}}
-            cond_m = _CONDITIONAL_PATTERN.match(expr)
-            if cond_m:
-                cond_key = cond_m.group(1)
-                cond_body = cond_m.group(2)
-                if context.get(cond_key):
-                    # Recursively resolve the body
-                    return self._resolve_template(cond_body, context, seq)
-                return ""
-
-            # Fallback: {title_zh|title_en|title_ja}
-            fallback_m = _FALLBACK_PATTERN.match(expr)
-            if fallback_m:
-                keys = expr.split("|")
-                for key in keys:
-                    val = context.get(key, "")
-                    if val:
-                        return str(val)
-                return ""
-
-            # Simple variable
-            return context.get(expr, "")
-
-        result = _VAR_PATTERN.sub(replace_match, template)
-        return sanitize_filename(result)
+        return _render(_compile_template(template), context, seq)
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import errno
+import os
+import posixpath
 import shutil
+import stat
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from loguru import logger
 
 from app.core.path_resolver import from_portable_path
 from app.models.backup_record import BackupRecord
+from app.utils import json_loads
 
 
 @dataclass
@@ -21,8 +28,8 @@ class FileChange:
     source_zip_path: str
     destination: Path
     exists_locally: bool = False
-    local_modified: float = 0.0
-    backup_modified: float = 0.0
+    local_modified: int = 0  # st_mtime_ns
+    backup_modified: int = 0  # ns since the epoch
     is_newer_locally: bool = False
 
 
@@ -37,8 +44,44 @@ class RestoreResult:
     error: str = ""
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _timestamp_ns(dt: datetime) -> int:
+    """Exact ``st_mtime_ns``-comparable form of *dt* (naive means local time)."""
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1_000
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """One ``stat`` covering what ``exists()``/``is_file()``/``stat()`` would each do."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+_STAGING_PREFIX = ".emu_restore_"
+
+
 class RestoreManager:
-    """Restore saves from backup ZIPs with preview and atomic operations."""
+    """Restore saves from backup ZIPs with preview and atomic operations.
+
+    Backups are extracted under *staging_root* (an app-owned directory) and
+    then moved into place, so nothing is ever staged inside a save folder.
+    """
+
+    def __init__(self, staging_root: Path | None = None) -> None:
+        self._staging_root = staging_root
+
+    def cleanup_staging(self) -> None:
+        """Remove staging directories left behind by an interrupted restore."""
+        if self._staging_root is None or not self._staging_root.is_dir():
+            return
+        for stale in self._staging_root.glob(f"{_STAGING_PREFIX}*"):
+            logger.info(f"Removing stale restore staging: {stale}")
+            shutil.rmtree(stale, ignore_errors=True)
 
     def preview_restore(self, record: BackupRecord) -> list[FileChange]:
         """Preview what files will be restored and check for conflicts."""
@@ -49,21 +92,20 @@ class RestoreManager:
         if not zip_path.exists() or not meta_path.exists():
             return changes
 
-        import json
-
-        with open(meta_path, encoding="utf-8") as f:
-            meta = json.load(f)
+        meta = json_loads(meta_path.read_bytes())
+        backup_ns = _timestamp_ns(record.created_at)
 
         for bp in meta.get("backup_paths", []):
             dest = from_portable_path(bp["source"])
+            st = _stat_or_none(dest)
             change = FileChange(
                 source_zip_path=bp["zip_path"],
                 destination=dest,
-                exists_locally=dest.exists(),
+                exists_locally=st is not None,
             )
-            if dest.exists() and dest.is_file():
-                change.local_modified = dest.stat().st_mtime
-                change.backup_modified = record.created_at.timestamp()
+            if st is not None and stat.S_ISREG(st.st_mode):
+                change.local_modified = st.st_mtime_ns
+                change.backup_modified = backup_ns
                 change.is_newer_locally = change.local_modified > change.backup_modified
             changes.append(change)
 
@@ -94,27 +136,27 @@ class RestoreManager:
             result.error = f"Backup metadata not found: {meta_path}"
             return result
 
-        import json
-
-        with open(meta_path, encoding="utf-8") as f:
-            meta = json.load(f)
+        meta = json_loads(meta_path.read_bytes())
 
         backup_paths = meta.get("backup_paths", [])
-
-        # Phase 1: Extract to temporary directory
-        with tempfile.TemporaryDirectory(prefix="emu_restore_") as tmp_dir:
+        dests = [from_portable_path(bp["source"]) for bp in backup_paths]
+        backup_ns = _timestamp_ns(record.created_at)
+
+        # Phase 1: Extract to a temporary directory — in the app's staging
+        # root when it shares the destination's volume, so Phase 2 is a
+        # rename instead of a copy.
+        staging = self._staging_dir(dests)
+        with tempfile.TemporaryDirectory(prefix=_STAGING_PREFIX, dir=staging) as tmp_dir:
             tmp = Path(tmp_dir)
             try:
-                with zipfile.ZipFile(zip_path, "r") as zf:
-                    zf.extractall(tmp)
+                self._extract_all(zip_path, tmp)
             except zipfile.BadZipFile as e:
                 result.success = False
                 result.error = f"Corrupt backup ZIP: {e}"
                 return result
 
             # Phase 2: Move files to destinations
-            for bp in backup_paths:
-                dest = from_portable_path(bp["source"])
+            for bp, dest in zip(backup_paths, dests, strict=True):
                 extracted = tmp / bp["zip_path"]
 
                 if not extracted.exists():
@@ -122,25 +164,20 @@ class RestoreManager:
                     continue
 
                 # Check force flag
-                if not force and dest.exists():
-                    if dest.is_file():
-                        local_mtime = dest.stat().st_mtime
-                        backup_mtime = record.created_at.timestamp()
-                        if local_mtime > backup_mtime:
-                            result.skipped_files.append(str(dest))
-                            result.warnings.append(
-                                f"Skipped (local is newer): {dest.name}"
-                            )
-                            continue
+                if not force:
+                    st = _stat_or_none(dest)
+                    if (
+                        st is not None
+                        and stat.S_ISREG(st.st_mode)
+                        and st.st_mtime_ns > backup_ns
+                    ):
+                        result.skipped_files.append(str(dest))
+                        result.warnings.append(f"Skipped (local is newer): {dest.name}")
+                        continue
 
                 try:
                     dest.parent.mkdir(parents=True, exist_ok=True)
-                    if bp.get("is_dir", False):
-                        if dest.exists():
-                            shutil.rmtree(dest)
-                        shutil.copytree(extracted, dest)
-                    else:
-                        shutil.copy2(extracted, dest)
+                    self._move_into_place(extracted, dest, is_dir=bp.get("is_dir", False))
                     result.restored_files.append(str(dest))
                 except OSError as e:
                     result.warnings.append(f"Failed to restore {dest.name}: {e}")
@@ -158,3 +195,77 @@ class RestoreManager:
             f"{len(result.skipped_files)} skipped"
         )
         return result
+
+    def _staging_dir(self, dests: list[Path]) -> str | None:
+        """The staging root if it is on the first destination's volume, else None (system temp)."""
+        if self._staging_root is None or not dests:
+            return None
+        parent = dests[0].parent
+        while not parent.is_dir() and parent != parent.parent:
+            parent = parent.parent
+        try:
+            self._staging_root.mkdir(parents=True, exist_ok=True)
+            same_volume = os.stat(parent).st_dev == os.stat(self._staging_root).st_dev
+        except OSError:
+            return None
+        return str(self._staging_root) if same_volume else None
+
+    @staticmethod
+    def _move_into_place(extracted: Path, dest: Path, *, is_dir: bool) -> None:
+        """Move an extracted file or directory to *dest*, replacing it.
+
+        A rename when both sides share a filesystem; otherwise a copy, which
+        ``shutil`` already does in-kernel (``sendfile``) on Linux.
+        """
+        if is_dir:
+            if dest.exists():
+                shutil.rmtree(dest)
+            try:
+                os.rename(extracted, dest)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copytree(extracted, dest)
+        else:
+            try:
+                os.replace(extracted, dest)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copy2(extracted, dest)
+
+    _EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+    _PARALLEL_MIN_FILES = 8  # below this, a thread pool costs more than it saves
+
+    def _extract_all(self, zip_path: Path, dest: Path) -> None:
+        """Extract *zip_path* into *dest*, spreading file entries over threads.
+
+        ``ZipFile`` handles are not thread-safe, so each worker opens its own.
+        Every parent directory is created up front so workers never race on
+        ``mkdir``.
+        """
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            infos = zf.infolist()
+            files = [info for info in infos if not info.is_dir()]
+            if len(files) < self._PARALLEL_MIN_FILES or self._EXTRACT_WORKERS < 2:
+                zf.extractall(dest)
+                return
+            for info in infos:
+                if info.is_dir():
+                    zf.extract(info, dest)
+            # Synthetic directory entries reuse zipfile's path sanitizing.
+            for parent in sorted({posixpath.dirname(info.filename) for info in files} - {""}):
+                zf.extract(zipfile.ZipInfo(parent + "/"), dest)
+
+        # Interleave so each worker gets a similar mix of large and small files.
+        n = self._EXTRACT_WORKERS
+        shares = [files[i::n] for i in range(n)]
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            for _ in pool.map(lambda share: self._extract_share(zip_path, share, dest), shares):
+                pass
+
+    @staticmethod
+    def _extract_share(zip_path: Path, infos: list[zipfile.ZipInfo], dest: Path) -> None:
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            for info in infos:
+                zf.extract(info, dest)
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-import hashlib
+import functools
+import io
+import os
 import re
+import struct
 import tempfile
 import zipfile
-import zlib
-from datetime import datetime, timezone
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections.abc import Set as AbstractSet
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 from loguru import logger
 
@@ -18,6 +23,116 @@ from app.data.rom_library import RomLibrary
 from app.models.rom_entry import RomEntry
 from app.plugins.base import GamePlugin
 from app.plugins.plugin_manager import PluginManager
+from app.utils import (
+    crc32_bytes,
+    crc32_file,
+    crc32_memo,
+    memoized_crc32,
+    prime_crc32,
+    sha256_file,
+)
+
+# Scans are I/O-bound (stat, header reads, CRC); overlap them across files.
+_SCAN_WORKERS = os.cpu_count() or 4
+
+# No-Intro filename tags
+_BETA_RE = re.compile(r"\(Beta(?:\s+(\d+))?\)", re.IGNORECASE)
+_VC_RE = re.compile(r"\(Virtual Console\)", re.IGNORECASE)
+_SAMPLE_RE = re.compile(r"\(Sample\)", re.IGNORECASE)
+_REV_RE = re.compile(r"\(Rev\s+([\d.]+)\)", re.IGNORECASE)
+_BRACKET_VER_RE = re.compile(r"\[1\.(\d+)\]")
+
+_COPY_BUFSIZE = 1 << 20
+_LOCAL_HEADER_SIZE = 30
+_FLAG_DATA_DESCRIPTOR = 0x08
+
+
+def _fresh_zipinfo(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Copy *info*'s name, timestamp and attributes into a new ZipInfo."""
+    out = zipfile.ZipInfo(info.filename, info.date_time)
+    out.compress_type = info.compress_type
+    out.comment = info.comment
+    out.create_system = info.create_system
+    out.internal_attr = info.internal_attr
+    out.external_attr = info.external_attr
+    return out
+
+
+def _copy_raw_zip_entry(
+    src: io.BufferedReader, info: zipfile.ZipInfo, dst: zipfile.ZipFile
+) -> None:
+    """Append *info*'s compressed payload from *src* to *dst* as-is.
+
+    ``zipfile`` has no public API for this, so the local header is written
+    here and the entry registered the same way ``ZipFile.writestr`` does.
+    """
+    src.seek(info.header_offset)
+    header = src.read(_LOCAL_HEADER_SIZE)
+    if len(header) != _LOCAL_HEADER_SIZE or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename!r}")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    src.seek(name_len + extra_len, os.SEEK_CUR)
+
+    out = _fresh_zipinfo(info)
+    # Sizes and CRC are known up front, so no trailing data descriptor.
+    out.flag_bits = info.flag_bits & ~_FLAG_DATA_DESCRIPTOR
+    out.CRC = info.CRC
+    out.compress_size = info.compress_size
+    out.file_size = info.file_size
+
+    dst._writecheck(out)
+    dst._didModify = True
+    out.header_offset = dst.fp.tell()
+    dst.fp.write(out.FileHeader())
+    buf = memoryview(bytearray(min(info.compress_size, _COPY_BUFSIZE)))
+    remaining = info.compress_size
+    while remaining:
+        n = src.readinto(buf[: min(remaining, len(buf))])
+        if not n:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename!r}")
+        dst.fp.write(buf[:n])
+        remaining -= n
+    dst.filelist.append(out)
+    dst.NameToInfo[out.filename] = out
+    dst.start_dir = dst.fp.tell()
+
+
+@functools.lru_cache(maxsize=64)
+def _plugin_extensions(plugin: GamePlugin) -> frozenset[str]:
+    """Lowercased ROM extensions claimed by *plugin* (plugins hash by identity)."""
+    return frozenset(ext.lower() for ext in plugin.get_rom_extensions())
+
+
+@functools.lru_cache(maxsize=64)
+def _plugin_rom_extensions(plugin: GamePlugin) -> frozenset[str]:
+    """Like :func:`_plugin_extensions` minus ``.zip`` — what to look for inside a ZIP."""
+    return _plugin_extensions(plugin) - {".zip"}
+
+
+@functools.lru_cache(maxsize=8)
+def _auto_ext_map(plugins: tuple[GamePlugin, ...]) -> Mapping[str, GamePlugin]:
+    """Extension → plugin for auto-detect scans, built once per plugin set.
+
+    When two plugins claim an extension the later one wins, as before, but
+    the clash is logged instead of passing silently.
+    """
+    ext_map: dict[str, GamePlugin] = {}
+    for gp in plugins:
+        for ext in _plugin_extensions(gp):
+            prev = ext_map.get(ext)
+            if prev is not None and prev is not gp:
+                logger.warning(
+                    f"Extension '{ext}' claimed by both {prev.name} and {gp.name}; "
+                    f"auto-detect uses {gp.name}"
+                )
+            ext_map[ext] = gp
+    return MappingProxyType(ext_map)
+
+
+def _suffix(name: str) -> str:
+    """Lowercase extension of *name* (``Path.suffix`` semantics, no Path allocation)."""
+    stem, _, ext = name.rpartition(".")
+    return f".{ext.lower()}" if stem and ext else ""
 
 
 class RomManager:
@@ -40,6 +155,9 @@ class RomManager:
         self._library = rom_library
         self._plugins = plugin_manager
         self._rename = rename_engine
+        # path → (size, mtime_ns) of files ensure_crc32() could not hash
+        # (unreadable or over the size cap); not retried until they change
+        self._crc_failed: dict[str, tuple[int, int]] = {}
 
     # ── Scanning ──
 
@@ -67,6 +185,7 @@ class RomManager:
             logger.warning(f"Unexpected rom_directories type: {type(raw)}")
 
         logger.info(f"Scan complete — {len(entries)} ROM(s) indexed")
+        self._library.prune_crc_cache({e.rom_path for e in entries})
         self._library.save()
         return entries
 
@@ -77,75 +196,129 @@ class RomManager:
         entries: list[RomEntry],
     ) -> None:
         """Scan directories using a specific game plugin."""
-        extensions = set(game_plugin.get_rom_extensions())
-        for dir_path in dirs:
-            dir_p = Path(dir_path)
-            if not dir_p.is_dir():
-                logger.debug(f"ROM directory does not exist: {dir_path}")
-                continue
+        wanted = _plugin_extensions(game_plugin) | {".zip"}
 
-            for file in dir_p.rglob("*"):
-                if not file.is_file():
-                    continue
-                suffix = file.suffix.lower()
-                if suffix == ".zip":
-                    entry = self._create_entry_from_zip(file, game_plugin)
-                elif suffix in extensions:
-                    entry = self._create_entry(file, game_plugin)
-                else:
-                    continue
-                if entry is None:
-                    continue
+        def process(file: Path, suffix: str) -> RomEntry | None:
+            if suffix == ".zip":
+                return self._create_entry_from_zip(file, game_plugin)
+            return self._create_entry(file, game_plugin)
 
-                self._library.add(entry)
-                entries.append(entry)
-                logger.debug(f"Indexed ROM: {file.name} → {entry.game_id}")
+        self._run_scan(self._walk_files(dirs, wanted), process, entries)
 
     def _scan_dirs_auto(
         self, dirs: list[str], entries: list[RomEntry]
     ) -> None:
         """Scan directories, auto-detecting platform by file extension."""
-        # Build extension → GamePlugin lookup
-        ext_map: dict[str, GamePlugin] = {}
-        for gp in self._plugins.game_plugins:
-            for ext in gp.get_rom_extensions():
-                ext_map[ext.lower()] = gp
+        ext_map = _auto_ext_map(tuple(self._plugins.game_plugins))
+
+        def process(file: Path, suffix: str) -> RomEntry | None:
+            if suffix == ".zip":
+                # Peek inside zip to determine plugin
+                return self._create_entry_from_zip_auto(file, ext_map)
+            return self._create_entry(file, ext_map[suffix])
 
+        self._run_scan(self._walk_files(dirs, ext_map.keys() | {".zip"}), process, entries)
+
+    @staticmethod
+    def _walk_files(
+        dirs: list[str], suffixes: AbstractSet[str]
+    ) -> Iterator[tuple[str, str]]:
+        """Yield ``(path, lowercase_suffix)`` for regular files under *dirs*
+        whose suffix is in *suffixes*.
+
+        Uses an explicit ``os.scandir`` stack so file/dir checks come from the
+        dirent type instead of a ``stat()`` per entry; the suffix is checked
+        first, so files that could need one (symlinks, filesystems without a
+        dirent type) are only stat'd when wanted.  Like ``Path.rglob``,
+        symlinked directories are not descended into.
+        """
         for dir_path in dirs:
-            dir_p = Path(dir_path)
-            if not dir_p.is_dir():
+            if not os.path.isdir(dir_path):
                 logger.debug(f"ROM directory does not exist: {dir_path}")
                 continue
-
-            for file in dir_p.rglob("*"):
-                if not file.is_file():
+            stack = [dir_path]
+            while stack:
+                try:
+                    it = os.scandir(stack.pop())
+                except OSError as e:
+                    logger.debug(f"Cannot list '{e.filename}': {e.strerror}")
                     continue
-                suffix = file.suffix.lower()
+                with it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                            suffix = _suffix(entry.name)
+                            if suffix in suffixes and entry.is_file():
+                                yield entry.path, suffix
+                        except OSError:
+                            continue
+
+    def _run_scan(
+        self,
+        files: Iterator[tuple[str, str]],
+        process: Callable[[Path, str], RomEntry | None],
+        entries: list[RomEntry],
+    ) -> None:
+        """Run *process* over the walked *files* on a thread pool.
 
-                if suffix == ".zip":
-                    # Peek inside zip to determine plugin
-                    entry = self._create_entry_from_zip_auto(file, ext_map)
-                else:
-                    game_plugin = ext_map.get(suffix)
-                    if game_plugin is None:
-                        continue
-                    entry = self._create_entry(file, game_plugin)
+        Workers read files and build entries; the only shared state they
+        write is the library's CRC cache, which locks internally.  Entries
+        are added to the library here on the calling thread, in walk order.
+        The ``scan_workers`` setting caps the pool (0 = one per CPU).
+        """
+        wanted = [(Path(path), suffix) for path, suffix in files]
+        workers = int(self._config.get("scan_workers", 0) or _SCAN_WORKERS)
+        start = len(entries)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(lambda item: process(*item), wanted)
+            for (file, _), entry in zip(wanted, results, strict=True):
                 if entry is None:
                     continue
-
-                self._library.add(entry)
                 entries.append(entry)
                 logger.debug(f"Indexed ROM: {file.name} → {entry.game_id}")
+        self._library.add_many(entries[start:])
 
     # ── Entry creation ──
 
-    def _create_entry(self, rom_path: Path, game_plugin: GamePlugin) -> RomEntry | None:
-        try:
-            rom_info = game_plugin.parse_rom_info(rom_path)
-            game_id = game_plugin.extract_game_id(rom_path)
-        except Exception as e:
-            logger.warning(f"Plugin error parsing '{rom_path.name}': {e}")
-            return None
+    def _create_entry(
+        self,
+        rom_path: Path,
+        game_plugin: GamePlugin,
+        *,
+        use_crc_cache: bool = True,
+        data: bytes | None = None,
+    ) -> RomEntry | None:
+        """Parse *rom_path* with *game_plugin* into an entry.
+
+        *data* is the file's content when the caller already holds it (e.g.
+        just extracted from a ZIP); it is hashed in memory instead of
+        re-reading the file.
+        """
+        # One CRC pass per ROM, shared with the plugin's own hashing; a
+        # library-cache hit means nobody hashes the file at all.  With
+        # eager_crc32 off, a CRC nobody needed yet is left for
+        # ensure_crc32() to compute on demand.
+        eager = bool(self._config.get("eager_crc32", True))
+        with crc32_memo():
+            if data is not None:
+                prime_crc32(rom_path, len(data), crc32_bytes(data))
+            elif use_crc_cache:
+                self._prime_crc32(rom_path)
+            try:
+                rom_info = game_plugin.parse_rom_info(rom_path)
+                game_id = game_plugin.extract_game_id(rom_path)
+            except Exception as e:
+                logger.warning(f"Plugin error parsing '{rom_path.name}': {e}")
+                return None
+            st = rom_path.stat()
+            if not eager and memoized_crc32(rom_path) is None:
+                raw_crc = ""
+            elif use_crc_cache:
+                raw_crc = self._cached_crc32(rom_path, st)
+            else:
+                raw_crc = self._compute_crc32(rom_path)
 
         # Resolve display name
         display_name = ""
@@ -156,7 +329,6 @@ class RomManager:
             if resolved:
                 display_name = resolved
 
-        raw_crc = self._compute_crc32(rom_path)
         # If the plugin matched via DAT (e.g. NES header normalization),
         # use the DAT CRC so the UI can show a verified match.
         if rom_info and rom_info.dat_crc32:
@@ -164,14 +336,15 @@ class RomManager:
         else:
             hash_crc = raw_crc
 
+        # added_at is left unset: RomLibrary.add_many stamps the whole batch
+        # with one timestamp instead of formatting one per file
         entry = RomEntry(
             rom_path=str(rom_path),
             platform=game_plugin.platform,
             emulator="",  # ROM entries are platform-scoped, not emulator-scoped
             game_id=game_id,
-            file_size=rom_path.stat().st_size,
+            file_size=st.st_size,
             hash_crc32=hash_crc,
-            added_at=datetime.now(timezone.utc).isoformat(),
             rom_info=rom_info,
         )
 
@@ -181,50 +354,79 @@ class RomManager:
         self, zip_path: Path, game_plugin: GamePlugin
     ) -> RomEntry | None:
         """Extract ROM from zip, parse with *game_plugin*, return entry."""
-        real_exts = {e for e in game_plugin.get_rom_extensions() if e != ".zip"}
-        return self._process_zip(zip_path, real_exts, game_plugin)
+        return self._process_zip(zip_path, game_plugin)
 
     def _create_entry_from_zip_auto(
-        self, zip_path: Path, ext_map: dict[str, GamePlugin]
+        self, zip_path: Path, ext_map: Mapping[str, GamePlugin]
     ) -> RomEntry | None:
-        """Open zip, detect plugin from inner file extension, parse ROM."""
+        """Open zip, detect plugin from inner file extension, parse ROM.
+
+        The archive is opened once: the same ``ZipFile`` that picked the
+        plugin is used to read the ROM, so the central directory is parsed
+        a single time.
+        """
         try:
             with zipfile.ZipFile(zip_path) as zf:
-                for name in zf.namelist():
-                    inner_ext = Path(name).suffix.lower()
-                    plugin = ext_map.get(inner_ext)
+                for info in zf.infolist():
+                    plugin = ext_map.get(_suffix(info.filename))
                     if plugin is not None:
-                        real_exts = {e for e in plugin.get_rom_extensions() if e != ".zip"}
-                        return self._process_zip(zip_path, real_exts, plugin)
-        except (zipfile.BadZipFile, OSError) as e:
+                        member = self._read_zip_rom(zf, plugin)
+                        break
+                else:
+                    return None
+        except (zipfile.BadZipFile, OSError, KeyError) as e:
             logger.debug(f"Cannot open zip '{zip_path.name}': {e}")
-        return None
+            return None
+        if member is None:
+            return None
+        return self._process_zip_rom(zip_path, plugin, *member)
 
     def _process_zip(
-        self, zip_path: Path, rom_exts: set[str], game_plugin: GamePlugin
+        self, zip_path: Path, game_plugin: GamePlugin
     ) -> RomEntry | None:
         """Core zip processing: extract first matching ROM to a temp file."""
         try:
             with zipfile.ZipFile(zip_path) as zf:
-                rom_name: str | None = None
-                for name in zf.namelist():
-                    if Path(name).suffix.lower() in rom_exts:
-                        rom_name = name
-                        break
-                if rom_name is None:
-                    return None
-
-                original_data = zf.read(rom_name)
-                suffix = Path(rom_name).suffix
-                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                    tmp.write(original_data)
-                    tmp_path = Path(tmp.name)
+                member = self._read_zip_rom(zf, game_plugin)
         except (zipfile.BadZipFile, OSError, KeyError) as e:
             logger.debug(f"Failed to extract from zip '{zip_path.name}': {e}")
             return None
+        if member is None:
+            return None
+        return self._process_zip_rom(zip_path, game_plugin, *member)
+
+    @staticmethod
+    def _read_zip_rom(
+        zf: zipfile.ZipFile, game_plugin: GamePlugin
+    ) -> tuple[str, bytes] | None:
+        """Name and bytes of the first member of *zf* that *game_plugin* handles."""
+        rom_exts = _plugin_rom_extensions(game_plugin)
+        for info in zf.infolist():
+            if _suffix(info.filename) in rom_exts:
+                return info.filename, zf.read(info)
+        return None
+
+    def _process_zip_rom(
+        self, zip_path: Path, game_plugin: GamePlugin, rom_name: str, original_data: bytes
+    ) -> RomEntry | None:
+        """Parse *original_data* (member *rom_name* of *zip_path*) via a temp file.
+
+        Runs after the archive is closed, so a plugin fix-up can rewrite it.
+        """
+        try:
+            with tempfile.NamedTemporaryFile(
+                suffix=Path(rom_name).suffix, delete=False
+            ) as tmp:
+                tmp.write(original_data)
+                tmp_path = Path(tmp.name)
+        except OSError as e:
+            logger.debug(f"Failed to extract from zip '{zip_path.name}': {e}")
+            return None
 
         try:
-            entry = self._create_entry(tmp_path, game_plugin)
+            entry = self._create_entry(
+                tmp_path, game_plugin, use_crc_cache=False, data=original_data
+            )
             if entry is not None:
                 # If the plugin modified the ROM (e.g. NES header fix),
                 # propagate the change back into the ZIP archive.
@@ -266,21 +468,21 @@ class RomManager:
         - No match → ``""``
         """
         # Special versions take priority — ignore numeric version
-        beta_m = re.search(r"\(Beta(?:\s+(\d+))?\)", stem, re.IGNORECASE)
+        beta_m = _BETA_RE.search(stem)
         if beta_m:
             return f"beta {beta_m.group(1)}" if beta_m.group(1) else "beta"
-        if re.search(r"\(Virtual Console\)", stem, re.IGNORECASE):
+        if _VC_RE.search(stem):
             return "vc"
-        if re.search(r"\(Sample\)", stem, re.IGNORECASE):
+        if _SAMPLE_RE.search(stem):
             return "sample"
 
         # Match (Rev N) or (Rev X.Y)
-        m = re.search(r"\(Rev\s+([\d.]+)\)", stem, re.IGNORECASE)
+        m = _REV_RE.search(stem)
         if m:
             return m.group(1)
 
         # Match [1.N]
-        m = re.search(r"\[1\.(\d+)\]", stem)
+        m = _BRACKET_VER_RE.search(stem)
         if m:
             return m.group(1)
 
@@ -313,73 +515,130 @@ class RomManager:
         "W": "World",
         "J": "Japan", "E": "Europe",
     }
+    # One left-to-right pass: step over plain text, whole bracket groups and
+    # stray openers until the first group with a comma-separated part that is
+    # exactly a tag.  Same result as splitting every group on commas.
+    _REGION_RE = re.compile(
+        r"(?:[^(\[]|[(\[][^)\]]+[)\]]|[(\[](?![^)\]]+[)\]]))*?"
+        r"[(\[](?:[^)\],]*,)*?\s*(" + "|".join(map(re.escape, _REGION_TAGS)) + r")\s*"
+        r"(?=[,)\]])[^)\]]*[)\]]"
+    )
 
     @staticmethod
     def _extract_region_from_filename(stem: str) -> str:
         """Extract region from filename brackets, e.g. '(USA)', '(Japan, USA)', or '[US]'."""
-        for m in re.finditer(r"[\(\[]([^)\]]+)[\)\]]", stem):
-            parts = [p.strip() for p in m.group(1).split(",")]
-            for part in parts:
-                if part in RomManager._REGION_TAGS:
-                    return RomManager._REGION_TAGS[part]
-        return ""
+        m = RomManager._REGION_RE.match(stem)
+        return RomManager._REGION_TAGS[m.group(1)] if m else ""
 
     @staticmethod
     def _update_rom_in_zip(
         zip_path: Path, rom_name: str, fixed_data: bytes
     ) -> None:
-        """Rewrite a ZIP archive with updated ROM data; backup first."""
-        import shutil
+        """Rewrite a ZIP archive with updated ROM data; backup first.
 
-        other_entries: list[tuple[str, bytes]] = []
-        with zipfile.ZipFile(zip_path) as zf:
-            for name in zf.namelist():
-                if name != rom_name:
-                    other_entries.append((name, zf.read(name)))
+        Only *rom_name* is recompressed — every other entry's compressed
+        bytes are copied verbatim.  The new archive is written next to the
+        old one and swapped in with ``os.replace``.
+        """
+        import shutil
 
         bak = zip_path.with_suffix(zip_path.suffix + ".bak")
         if not bak.exists():
             shutil.copy2(zip_path, bak)
             logger.info(f"Backup: {zip_path.name} → {bak.name}")
 
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr(rom_name, fixed_data)
-            for name, data in other_entries:
-                zf.writestr(name, data)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{zip_path.name}.", suffix=".tmp", dir=zip_path.parent
+        )
+        try:
+            with (
+                os.fdopen(fd, "wb") as out,
+                open(zip_path, "rb") as src,
+                zipfile.ZipFile(src) as zin,
+                zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zout,
+            ):
+                for info in zin.infolist():
+                    if info.filename == rom_name:
+                        zout.writestr(
+                            _fresh_zipinfo(info), fixed_data, zipfile.ZIP_DEFLATED
+                        )
+                    else:
+                        _copy_raw_zip_entry(src, info, zout)
+            os.replace(tmp_name, zip_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
         logger.info(f"Updated ROM in ZIP: {zip_path.name}/{rom_name}")
 
     # ── Hashing ──
 
-    @staticmethod
-    def _compute_crc32(path: Path, max_size: int = 1024 * 1024 * 1024) -> str:
-        """Compute CRC32 of a ROM file (skip files > *max_size*)."""
+    def _prime_crc32(self, path: Path) -> None:
+        """Seed the active CRC memo from the library cache if *path* is unchanged."""
         try:
-            if path.stat().st_size > max_size:
-                return ""
-            crc = 0
-            with open(path, "rb") as f:
-                while True:
-                    chunk = f.read(65536)
-                    if not chunk:
-                        break
-                    crc = zlib.crc32(chunk, crc)
-            return f"{crc & 0xFFFFFFFF:08X}"
+            st = path.stat()
+        except OSError:
+            return
+        crc = self._library.cached_crc(str(path), st.st_size, st.st_mtime_ns)
+        if crc is not None:
+            prime_crc32(path, st.st_size, crc)
+
+    def _cached_crc32(self, path: Path, st: os.stat_result) -> str:
+        """CRC32 from the library cache when size+mtime match, else compute and store."""
+        key = str(path)
+        crc = self._library.cached_crc(key, st.st_size, st.st_mtime_ns)
+        if crc is None:
+            crc = self._compute_crc32(path)
+            if crc:
+                self._library.store_crc(key, st.st_size, st.st_mtime_ns, crc)
+        return crc
+
+    def ensure_crc32(self, entry: RomEntry) -> str:
+        """Return *entry*'s CRC32, hashing the file now if the scan skipped it."""
+        if entry.hash_crc32 or _suffix(entry.rom_path) == ".zip":
+            # Zipped entries are always hashed from the extracted ROM
+            return entry.hash_crc32
+        path = Path(entry.rom_path)
+        try:
+            st = path.stat()
         except OSError:
             return ""
+        stamp = (st.st_size, st.st_mtime_ns)
+        if self._crc_failed.get(entry.rom_path) == stamp:
+            return ""
+        crc = self._cached_crc32(path, st)
+        if crc:
+            self._library.set_crc32(entry, crc)
+            self._library.save()
+        else:
+            self._crc_failed[entry.rom_path] = stamp
+        return crc
+
+    def ensure_crc32_many(self, entries: Iterable[RomEntry]) -> None:
+        """Fill in every CRC32 the scan skipped among *entries*, with one library write."""
+        with self._library.batched():
+            for entry in entries:
+                if not entry.hash_crc32:
+                    self.ensure_crc32(entry)
+
+    def find_duplicates(self) -> list[list[RomEntry]]:
+        """:meth:`RomLibrary.find_duplicates`, hashing any ROM the scan skipped first."""
+        self.ensure_crc32_many(self._library.all_entries())
+        return self._library.find_duplicates()
+
+    def find_by_hash(self, crc32: str) -> list[RomEntry]:
+        """:meth:`RomLibrary.find_by_hash`, hashing any ROM the scan skipped first."""
+        self.ensure_crc32_many(self._library.all_entries())
+        return self._library.find_by_hash(crc32)
+
+    @staticmethod
+    def _compute_crc32(path: Path, max_size: int = 1024 * 1024 * 1024) -> str:
+        """Compute CRC32 of a ROM file (skip files > *max_size*)."""
+        return crc32_file(path, max_size)
 
     @staticmethod
     def _compute_hash(path: Path, max_bytes: int = 16 * 1024 * 1024) -> str:
         """SHA-256 of the first ``max_bytes`` of a file."""
-        sha = hashlib.sha256()
-        with open(path, "rb") as f:
-            remaining = max_bytes
-            while remaining > 0:
-                chunk = f.read(min(remaining, 65536))
-                if not chunk:
-                    break
-                sha.update(chunk)
-                remaining -= len(chunk)
-        return sha.hexdigest()
+        return sha256_file(path, max_bytes)
 
     # ── Renaming ──
 
@@ -401,7 +660,9 @@ class RomManager:
             logger.warning(f"ROM file missing: {old_path}")
             return None
 
-        tokens = self._build_rename_tokens(entry)
+        tokens = self._build_rename_tokens(
+            entry, self._rename.referenced_keys(template), old_path=old_path
+        )
         new_name = self._rename.preview(template, tokens)
 
         new_path = old_path.parent / new_name
@@ -414,7 +675,7 @@ class RomManager:
 
         try:
             old_path.rename(new_path)
-            entry.rom_path = str(new_path)
+            self._library.update_path(str(old_path), str(new_path))
             self._library.save()
             logger.info(f"Renamed: {old_path.name} → {new_path.name}")
             return new_path
@@ -440,45 +701,48 @@ class RomManager:
         from app.models.rom_entry import RomEntry
 
         results: list[tuple[str, str]] = []
-        for item in entries:
-            if isinstance(item, RomEntry):
-                entry = item
-            else:
-                platform, game_id = item
-                entry = self._library.get(platform, game_id)
-                if entry is None:
-                    continue
+        needed = self._rename.referenced_keys(template)
+        render = self._rename.compile(template)
+        # Saves after each rename are coalesced into one write at the end.
+        with self._library.batched():
+            for item in entries:
+                if isinstance(item, RomEntry):
+                    entry = item
+                else:
+                    platform, game_id = item
+                    entry = self._library.get(platform, game_id)
+                    if entry is None:
+                        continue
 
-            old_path = Path(entry.rom_path)
-            old_name = old_path.name
+                old_path = Path(entry.rom_path)
+                old_name = old_path.name
+                suffix = old_path.suffix
 
-            tokens = self._build_rename_tokens(entry)
-            new_stem = self._rename.preview(template, tokens)
-            # Preserve original extension
-            new_name = new_stem + old_path.suffix if not new_stem.endswith(old_path.suffix) else new_stem
+                tokens = self._build_rename_tokens(entry, needed, old_path=old_path)
+                new_stem = render(tokens)
+                # Preserve original extension
+                new_name = new_stem if new_stem.endswith(suffix) else new_stem + suffix
 
-            if dry_run:
-                results.append((old_name, new_name))
-            else:
-                new_path = old_path.parent / new_name
-                if new_path == old_path:
-                    results.append((old_name, new_name))
-                    continue
-                if new_path.exists():
-                    logger.warning(f"Target already exists: {new_path}")
-                    results.append((old_name, old_name))
-                    continue
-                try:
-                    old_path.rename(new_path)
-                    entry.rom_path = str(new_path)
-                    logger.info(f"Renamed: {old_name} → {new_name}")
+                if dry_run:
                     results.append((old_name, new_name))
-                except OSError as e:
-                    logger.error(f"Rename failed: {e}")
-                    results.append((old_name, old_name))
-
-        if not dry_run and any(old != new for old, new in results):
-            self._library.save()
+                else:
+                    new_path = old_path.parent / new_name
+                    if new_path == old_path:
+                        results.append((old_name, new_name))
+                        continue
+                    if new_path.exists():
+                        logger.warning(f"Target already exists: {new_path}")
+                        results.append((old_name, old_name))
+                        continue
+                    try:
+                        old_path.rename(new_path)
+                        self._library.update_path(str(old_path), str(new_path))
+                        self._library.save()
+                        logger.info(f"Renamed: {old_name} → {new_name}")
+                        results.append((old_name, new_name))
+                    except OSError as e:
+                        logger.error(f"Rename failed: {e}")
+                        results.append((old_name, old_name))
 
         return results
 
@@ -511,15 +775,28 @@ class RomManager:
         "pal": "EU",
     }
 
-    def _build_rename_tokens(self, entry: RomEntry) -> dict[str, str]:
-        """Build template variable values from a RomEntry."""
+    def _build_rename_tokens(
+        self,
+        entry: RomEntry,
+        needed: AbstractSet[str] | None = None,
+        *,
+        old_path: Path | None = None,
+    ) -> dict[str, str]:
+        """Build template variable values from a RomEntry.
+
+        *needed* (see :meth:`RenameEngine.referenced_keys`) limits the work
+        to the tokens a template actually uses; ``None`` builds them all.
+        *old_path* is ``Path(entry.rom_path)`` when the caller already has it.
+        """
         info = entry.rom_info
         tokens: dict[str, str] = {
             "platform": entry.platform,
-            "ext": Path(entry.rom_path).suffix.lstrip("."),
-            "crc32": entry.hash_crc32 or "",
             "id": str(info.dat_id) if info and info.dat_id >= 0 else "",
         }
+        if needed is None or "crc32" in needed:
+            tokens["crc32"] = self.ensure_crc32(entry)
+        if needed is None or "ext" in needed:
+            tokens["ext"] = (old_path or Path(entry.rom_path)).suffix.lstrip(".")
 
         if info:
             tokens.update(
@@ -529,7 +806,6 @@ class RomManager:
                     "title_ja": info.title_name_ja,
                     "title_rom": info.title_name,
                     "title_id": info.title_id,
-                    "region": self._REGION_SHORT.get(info.region.lower(), info.region) if info.region else "",
                     "languages": info.languages,
                     "version": info.version,
                     "file_type": info.file_type,
@@ -537,12 +813,19 @@ class RomManager:
                     "publisher": info.publisher,
                 }
             )
+            if info.region and (needed is None or "region" in needed):
+                tokens["region"] = self._REGION_SHORT.get(info.region.lower(), info.region)
 
         # {title} — pick best name based on app language
-        tokens["title"] = entry.display_name
+        if needed is None or "title" in needed:
+            tokens["title"] = entry.display_name
 
         # Fill game name from game plugin if we have a title_id but no zh name
-        if not tokens.get("title_zh") and entry.game_id:
+        if (
+            (needed is None or "title_zh" in needed)
+            and not tokens.get("title_zh")
+            and entry.game_id
+        ):
             plugin = self._plugins.get_game_plugin(entry.platform)
             if plugin:
                 resolved = plugin.resolve_game_name(entry.game_id)
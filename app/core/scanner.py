@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
 from loguru import logger
 
 from app.config import Config
@@ -20,6 +24,8 @@ class Scanner:
     corresponding *GamePlugin* for each emulator's platform.
     """
 
+    _SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
     def __init__(self, plugin_manager: PluginManager, config: Config) -> None:
         self._plugins = plugin_manager
         self._config = config
@@ -56,27 +62,34 @@ class Scanner:
         if detected is None:
             detected = self.detect_all_emulators()
 
-        all_saves: list[GameSave] = []
-
+        tasks: list[tuple[EmulatorPlugin, EmulatorInfo]] = []
         for emu_name, installations in detected.items():
             plugin = self._plugins.get_emulator_plugin(emu_name)
             if plugin is None:
                 logger.warning(f"No emulator plugin for '{emu_name}'")
                 continue
+            tasks.extend((plugin, emulator) for emulator in installations)
 
-            for emulator in installations:
-                try:
-                    saves = plugin.scan_saves(emulator)
-                    logger.debug(
-                        f"{plugin.display_name}: found {len(saves)} save(s) "
-                        f"at {emulator.data_path}"
-                    )
-                    all_saves.extend(saves)
-                except Exception as e:
-                    logger.error(
-                        f"Save scan failed for {plugin.display_name} "
-                        f"at {emulator.data_path}: {e}"
-                    )
+        # Installations are independent directory trees: scan them
+        # concurrently, but collect in detection order so dedup is stable.
+        all_saves: list[GameSave] = []
+        if tasks:
+            workers = min(len(tasks), self._SCAN_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(plugin.scan_saves, emu) for plugin, emu in tasks]
+                for (plugin, emulator), future in zip(tasks, futures, strict=True):
+                    try:
+                        saves = future.result()
+                        logger.debug(
+                            f"{plugin.display_name}: found {len(saves)} save(s) "
+                            f"at {emulator.data_path}"
+                        )
+                        all_saves.extend(saves)
+                    except Exception as e:
+                        logger.error(
+                            f"Save scan failed for {plugin.display_name} "
+                            f"at {emulator.data_path}: {e}"
+                        )
 
         # Deduplicate
         all_saves = EmulatorPlugin.deduplicate(all_saves)
@@ -95,9 +108,9 @@ class Scanner:
 
         Groups saves by platform and delegates to the matching game plugin.
         """
-        by_platform: dict[str, list[GameSave]] = {}
+        by_platform: defaultdict[str, list[GameSave]] = defaultdict(list)
         for save in saves:
-            by_platform.setdefault(save.platform, []).append(save)
+            by_platform[save.platform].append(save)
 
         for platform, platform_saves in by_platform.items():
             game_plugin = self._plugins.get_game_plugin(platform)
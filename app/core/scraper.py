@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -13,10 +15,15 @@ if TYPE_CHECKING:
     from app.data.scrape_cache import ScrapeCache
     from app.scrapers.base import ScraperProvider
 
+_FIELD_NAMES: tuple[str, ...] = tuple(f.value for f in MetadataField)
+
 
 class Scraper:
     """Multi-source metadata scraper with Playnite-style per-field priority merge."""
 
+    # Overall wait for providers in one scrape(), on top of their HTTP timeouts
+    _PROVIDER_TIMEOUT = 60.0
+
     def __init__(self, config: Config, cache: ScrapeCache) -> None:
         self._config = config
         self._cache = cache
@@ -40,7 +47,8 @@ class Scraper:
         """
         Scrape metadata from all providers and merge by field priority.
 
-        Returns cached merged result if available (unless force=True).
+        Returns cached merged result if available.  ``force=True`` ignores
+        both that and any recent "not found" and asks every provider again.
         """
         # Check cache first
         if not force:
@@ -48,25 +56,51 @@ class Scraper:
             if cached:
                 return cached
 
-        # Scrape from all providers
+        # Scrape from all providers concurrently — each is one or two
+        # independent HTTP round trips, so wall time is the slowest one
         results: dict[str, ScrapeResult] = {}
         search_query = query or game_id
-
-        for name, provider in self._providers.items():
-            if not provider.supports_platform(platform):
-                continue
+        known_missing = (
+            set() if force else self._cache.missing_providers(platform, game_id, search_query)
+        )
+        providers = {
+            name: provider
+            for name, provider in self._providers.items()
+            if provider.supports_platform(platform) and name not in known_missing
+        }
+        if known_missing:
+            logger.debug(f"Skipping {sorted(known_missing)} for {search_query}: recently not found")
+        if providers:
+            pool = ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix="scrape")
             try:
-                result = provider.search(search_query, platform)
-                if result:
-                    result.game_id = game_id
-                    result.platform = platform
-                    results[name] = result
-                    self._cache.save_result(result)
-                    logger.info(f"Scraped {name} for {search_query}: found")
-                else:
-                    logger.debug(f"Scraped {name} for {search_query}: not found")
-            except Exception as e:
-                logger.error(f"Scraper {name} failed for {search_query}: {e}")
+                futures = {
+                    name: pool.submit(provider.search, search_query, platform)
+                    for name, provider in providers.items()
+                }
+                deadline = time.monotonic() + self._PROVIDER_TIMEOUT
+                # Collected in registration order (the default merge priority);
+                # cache writes stay on this thread since they share one file.
+                for name, future in futures.items():
+                    try:
+                        result = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                    except TimeoutError:
+                        logger.error(f"Scraper {name} timed out for {search_query}")
+                        continue
+                    except Exception as e:
+                        logger.error(f"Scraper {name} failed for {search_query}: {e}")
+                        continue
+                    if result:
+                        result.game_id = game_id
+                        result.platform = platform
+                        results[name] = result
+                        self._cache.save_result(result)
+                        logger.info(f"Scraped {name} for {search_query}: found")
+                    else:
+                        self._cache.mark_missing(name, platform, game_id, search_query)
+                        logger.debug(f"Scraped {name} for {search_query}: not found")
+            finally:
+                # Don't wait on a provider that timed out
+                pool.shutdown(wait=False, cancel_futures=True)
 
         # Merge results
         merged = self._merge_results(results, platform)
@@ -81,19 +115,29 @@ class Scraper:
         game_id: str,
         platform: str,
         query: str = "",
+        force: bool = False,
     ) -> ScrapeResult | None:
-        """Scrape from a single provider."""
+        """Scrape from a single provider (``force=True`` ignores a recent "not found")."""
         provider = self._providers.get(provider_name)
         if not provider:
             logger.error(f"Provider not found: {provider_name}")
             return None
 
+        search_query = query or game_id
+        if not force and provider_name in self._cache.missing_providers(
+            platform, game_id, search_query
+        ):
+            logger.debug(f"Skipping {provider_name} for {search_query}: recently not found")
+            return None
+
         try:
-            result = provider.search(query or game_id, platform)
+            result = provider.search(search_query, platform)
             if result:
                 result.game_id = game_id
                 result.platform = platform
                 self._cache.save_result(result)
+            else:
+                self._cache.mark_missing(provider_name, platform, game_id, search_query)
             return result
         except Exception as e:
             logger.error(f"Scraper {provider_name} failed: {e}")
@@ -105,18 +149,13 @@ class Scraper:
         """Merge results from multiple providers using field-level priority."""
         merged = MergedMetadata()
         field_priority = self._config.field_priority
-
-        for field_enum in MetadataField:
-            field_name = field_enum.value
-            # Get priority order for this field, default to provider registration order
-            priority = field_priority.get(
-                field_name, list(results.keys())
-            )
-
-            for provider_name in priority:
-                if provider_name not in results:
+        # Default priority is provider registration order
+        default_priority = list(results)
+        for field_name in _FIELD_NAMES:
+            for provider_name in field_priority.get(field_name, default_priority):
+                result = results.get(provider_name)
+                if result is None:
                     continue
-                result = results[provider_name]
                 value = getattr(result, field_name, None)
                 if value is not None and value != "" and value != []:
                     merged.fields[field_name] = value
@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
+import os
 import shutil
-from dataclasses import dataclass, field
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from app.utils import atomic_write_bytes, json_dumps_bytes, json_loads, sha256_file
+
 if TYPE_CHECKING:
     from app.config import Config
     from app.core.backup import BackupQueryProtocol
 
+# copy2 keeps mtimes, but FAT/exFAT sync drives round them to 2 s
+_MTIME_SLACK_NS = 2_000_000_000
+
 
-@dataclass
+@dataclass(slots=True)
 class SyncManifestEntry:
     """Tracks per-game sync state."""
 
@@ -29,7 +36,7 @@ class SyncManifestEntry:
     crc32: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ConflictInfo:
     """Information about a sync conflict."""
 
@@ -50,7 +57,7 @@ class ConflictResolution:
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Result of a sync operation."""
 
@@ -71,6 +78,10 @@ class SyncManager:
       {sync_folder}/emulator-save-manager/sync_manifest.json
     """
 
+    # Push/pull are I/O bound (local disk and the synced folder), so this is
+    # not tied to the CPU count
+    _SYNC_WORKERS = 8
+
     def __init__(self, config: Config, backup_query: BackupQueryProtocol) -> None:
         self._config = config
         self._backup_query = backup_query
@@ -98,8 +109,7 @@ class SyncManager:
         if path is None or not path.exists():
             return {}
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_loads(path.read_bytes())
             return {
                 key: SyncManifestEntry(**entry) for key, entry in data.items()
             }
@@ -113,26 +123,54 @@ class SyncManager:
         if path is None:
             return
         path.parent.mkdir(parents=True, exist_ok=True)
-        from dataclasses import asdict
-
         data = {key: asdict(entry) for key, entry in entries.items()}
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # Other machines read this file through the sync client: never
+            # leave it half-written
+            atomic_write_bytes(path, json_dumps_bytes(data))
         except OSError as e:
             logger.error(f"Failed to write sync manifest: {e}")
 
     @staticmethod
     def _file_hash(path: Path) -> str:
         """Compute SHA-256 hash of a file."""
-        h = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
-
-    def push(self, emulator: str, game_id: str) -> SyncResult:
-        """Push local backups to sync folder."""
+        return sha256_file(path)
+
+    @staticmethod
+    def _same_stat(a: os.stat_result, b: os.stat_result) -> bool:
+        """Size and mtime match: copy2 preserves both, so the copy is intact."""
+        return a.st_size == b.st_size and abs(a.st_mtime_ns - b.st_mtime_ns) <= _MTIME_SLACK_NS
+
+    @classmethod
+    def _copy_verified(cls, src: Path, dst: Path) -> None:
+        """Copy *src* to *dst* through a temp file that only becomes *dst* once it matches.
+
+        An interrupted or corrupt copy never shows up under *dst*; the temp
+        file is hidden and removed on failure.
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=".part")
+        os.close(fd)
+        tmp = Path(tmp_name)
+        try:
+            shutil.copy2(src, tmp)
+            if cls._file_hash(tmp) != cls._file_hash(src):
+                raise OSError(f"Copy of '{src.name}' does not match the sync folder")
+            os.replace(tmp, dst)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def push(
+        self,
+        emulator: str,
+        game_id: str,
+        manifest: dict[str, SyncManifestEntry] | None = None,
+    ) -> SyncResult:
+        """Push local backups to sync folder.
+
+        When *manifest* is given it is updated in place and the caller is
+        responsible for writing it back; otherwise it is read and written here.
+        """
         result = SyncResult()
         root = self.sync_root
         if root is None:
@@ -154,23 +192,39 @@ class SyncManager:
         if src_zip.exists():
             dst_zip = sync_dir / src_zip.name
             dst_meta = sync_dir / src_meta.name
-            if not dst_zip.exists() or self._file_hash(src_zip) != self._file_hash(dst_zip):
-                shutil.copy2(src_zip, dst_zip)
-                if src_meta.exists():
-                    shutil.copy2(src_meta, dst_meta)
-                result.pushed += 1
-
-                # Update manifest
+            key = f"{emulator}:{game_id}"
+            owns_manifest = manifest is None
+            if manifest is None:
                 manifest = self._read_manifest()
-                key = f"{emulator}:{game_id}"
-                manifest[key] = SyncManifestEntry(
-                    emulator=emulator,
-                    game_id=game_id,
-                    last_sync=datetime.now(tz=timezone.utc).isoformat(),
-                    source_machine=self._config.machine_id,
-                    file_hash=self._file_hash(dst_zip),
-                    crc32=newest.crc32,
-                )
+            recorded = manifest.get(key)
+            # Backups are never modified after creation: an earlier push of
+            # this very file left a copy with the same size and mtime
+            if (
+                recorded is not None
+                and dst_zip.exists()
+                and self._same_stat(src_zip.stat(), dst_zip.stat())
+            ):
+                return result
+            # The manifest already holds the hash of what was last pushed, so
+            # only the source needs hashing — once — to detect a change
+            src_hash = self._file_hash(src_zip)
+            if dst_zip.exists() and recorded is not None and recorded.file_hash == src_hash:
+                return result
+
+            shutil.copy2(src_zip, dst_zip)
+            if src_meta.exists():
+                shutil.copy2(src_meta, dst_meta)
+            result.pushed += 1
+
+            manifest[key] = SyncManifestEntry(
+                emulator=emulator,
+                game_id=game_id,
+                last_sync=datetime.now(tz=timezone.utc).isoformat(),
+                source_machine=self._config.machine_id,
+                file_hash=src_hash,
+                crc32=newest.crc32,
+            )
+            if owns_manifest:
                 self._write_manifest(manifest)
 
         return result
@@ -195,15 +249,28 @@ class SyncManager:
         local_dir = backup_root / emulator / game_id
         local_dir.mkdir(parents=True, exist_ok=True)
 
-        for zip_file in sorted(sync_dir.glob("*.zip"), reverse=True):
-            local_zip = local_dir / zip_file.name
-            if not local_zip.exists():
-                shutil.copy2(zip_file, local_zip)
-                meta_file = zip_file.with_suffix(".json")
-                if meta_file.exists():
-                    shutil.copy2(meta_file, local_dir / meta_file.name)
-                result.pulled += 1
-                break  # Only pull the newest
+        # Backups are named by timestamp: the newest is the greatest name
+        with os.scandir(sync_dir) as it:
+            newest = max(
+                (e for e in it if e.name.endswith(".zip") and e.is_file()),
+                key=lambda e: e.name,
+                default=None,
+            )
+        if newest is None:
+            return result
+
+        zip_file = Path(newest.path)
+        local_zip = local_dir / newest.name
+        if local_zip.exists():
+            # Never replace a local backup: the remote may be partial or a placeholder
+            return result
+
+        self._copy_verified(zip_file, local_zip)
+        meta_file = zip_file.with_suffix(".json")
+        if meta_file.exists():
+            # The sidecar describes this zip: keep the two in step
+            shutil.copy2(meta_file, local_dir / meta_file.name)
+        result.pulled += 1
 
         return result
 
@@ -214,31 +281,58 @@ class SyncManager:
             result.errors.append("Sync folder not configured")
             return result
 
+        # One manifest read/write for the whole run instead of one per game.
+        # Each push only touches its own "emulator:game_id" key, so the
+        # workers can share the dict without further locking.
+        manifest = self._read_manifest()
         all_backups = self._backup_query.list_all_backups()
-        for emulator, games in all_backups.items():
-            for game_id in games:
+        push_tasks = [
+            (emulator, game_id)
+            for emulator, games in all_backups.items()
+            for game_id in games
+        ]
+
+        # Hashing and copying release the GIL, so games sync in parallel;
+        # results are collected in task order to keep error lists stable
+        with ThreadPoolExecutor(max_workers=self._SYNC_WORKERS) as pool:
+            futures = [
+                pool.submit(self.push, emulator, game_id, manifest)
+                for emulator, game_id in push_tasks
+            ]
+            for (emulator, game_id), future in zip(push_tasks, futures, strict=True):
                 try:
-                    push_result = self.push(emulator, game_id)
+                    push_result = future.result()
                     result.pushed += push_result.pushed
                     result.conflicts.extend(push_result.conflicts)
                 except Exception as e:
                     result.errors.append(f"Push {emulator}/{game_id}: {e}")
+            if result.pushed:
+                self._write_manifest(manifest)
 
-        # Also pull anything in sync folder that we don't have locally
-        root = self.sync_root
-        if root and root.exists():
-            for emu_dir in root.iterdir():
-                if not emu_dir.is_dir() or emu_dir.name == "sync_manifest.json":
-                    continue
-                for game_dir in emu_dir.iterdir():
-                    if not game_dir.is_dir():
-                        continue
-                    try:
-                        pull_result = self.pull(emu_dir.name, game_dir.name)
-                        result.pulled += pull_result.pulled
-                    except Exception as e:
-                        result.errors.append(
-                            f"Pull {emu_dir.name}/{game_dir.name}: {e}"
-                        )
+            # Also pull anything in sync folder that we don't have locally
+            root = self.sync_root
+            pull_tasks: list[tuple[str, str]] = []
+            if root and root.exists():
+                # scandir answers is_dir() from the directory listing itself,
+                # sparing a stat() per entry on cloud-backed sync folders
+                with os.scandir(root) as emu_dirs:
+                    for emu_dir in emu_dirs:
+                        if not emu_dir.is_dir():
+                            continue
+                        with os.scandir(emu_dir.path) as game_dirs:
+                            pull_tasks.extend(
+                                (emu_dir.name, game_dir.name)
+                                for game_dir in game_dirs
+                                if game_dir.is_dir()
+                            )
+            futures = [
+                pool.submit(self.pull, emulator, game_id)
+                for emulator, game_id in pull_tasks
+            ]
+            for (emulator, game_id), future in zip(pull_tasks, futures, strict=True):
+                try:
+                    result.pulled += future.result().pulled
+                except Exception as e:
+                    result.errors.append(f"Pull {emulator}/{game_id}: {e}")
 
         return result
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -11,21 +15,45 @@ from typing import Any
 from loguru import logger
 
 from app.models.rom_entry import RomEntry, RomInfo
+from app.utils import atomic_write_bytes, json_dumps_bytes, json_loads, shallow_asdict
 
 
 def _rom_entry_from_dict(data: dict[str, Any]) -> RomEntry:
     """Reconstruct a RomEntry from a dict (loaded from JSON)."""
     rom_info_data = data.pop("rom_info", None)
     rom_info = RomInfo(**rom_info_data) if isinstance(rom_info_data, dict) else None
+    added_at = data.get("added_at")
+    if isinstance(added_at, str):  # libraries saved before added_at was epoch ns
+        data["added_at"] = _iso_to_ns(added_at)
     return RomEntry(**data, rom_info=rom_info)
 
 
+def _iso_to_ns(stamp: str) -> int:
+    try:
+        parsed = datetime.fromisoformat(stamp)
+    except ValueError:
+        return 0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp()) * 1_000_000_000 + parsed.microsecond * 1_000
+
+
+def _unindex(index: dict[str, dict[str, RomEntry]], value: str, key: str) -> None:
+    bucket = index.get(value)
+    if bucket is not None:
+        bucket.pop(key, None)
+        if not bucket:
+            del index[value]
+
+
 def _rom_entry_to_dict(entry: RomEntry) -> dict[str, Any]:
     """Convert a RomEntry to a serializable dict."""
-    d = asdict(entry)
+    d = shallow_asdict(entry)
     # Clean up None rom_info
-    if d.get("rom_info") is None:
-        d.pop("rom_info", None)
+    if entry.rom_info is None:
+        del d["rom_info"]
+    else:
+        d["rom_info"] = shallow_asdict(entry.rom_info)
     return d
 
 
@@ -34,46 +62,139 @@ class RomLibrary:
     ROM index manager — reads/writes rom_library.json.
 
     Key format: "{platform}:{game_id}"
+
+    Also keeps a CRC32 cache (``crc_cache.json``) keyed by absolute ROM path
+    and validated by ``(size, mtime_ns)`` so unchanged files are not rehashed.
+    Scan workers read and fill that cache from pool threads, so every access
+    to it goes through ``_crc_lock``; the ROM index itself is only touched
+    from the calling thread.
     """
 
     def __init__(self, data_dir: Path) -> None:
         self._data_dir = data_dir
         self._path = data_dir / "rom_library.json"
         self._roms: dict[str, RomEntry] = {}
+        # Secondary indexes over the fields fixed at insertion: value → {key: entry}
+        self._by_platform: dict[str, dict[str, RomEntry]] = {}
+        self._by_emulator: dict[str, dict[str, RomEntry]] = {}
+        # crc32 → {key: entry}; hashed entries only, kept in step by set_crc32()
+        self._by_crc32: dict[str, dict[str, RomEntry]] = {}
+        # rom_path → (platform, game_id); paths only change through update_path()
+        self._by_path: dict[str, tuple[str, str]] = {}
         self._version = 1
+        self._crc_path = data_dir / "crc_cache.json"
+        self._crc_cache: dict[str, tuple[int, int, str]] = {}
+        self._crc_dirty = False
+        self._crc_lock = threading.Lock()
+        # Orders concurrent saves so an older snapshot never lands last
+        self._crc_save_lock = threading.Lock()
+        self._batch_depth = 0
+        self._dirty = False
 
     def load(self) -> None:
         """Load ROM index from disk."""
-        self._roms.clear()
+        self._load_crc_cache()
+        self.clear()
         if not self._path.exists():
             return
         try:
-            with open(self._path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_loads(self._path.read_bytes())
             self._version = data.get("version", 1)
             for key, rom_data in data.get("roms", {}).items():
                 try:
-                    self._roms[key] = _rom_entry_from_dict(rom_data)
+                    self._put(key, _rom_entry_from_dict(rom_data))
                 except (TypeError, KeyError) as e:
                     logger.warning(f"Skipping malformed ROM entry '{key}': {e}")
         except (json.JSONDecodeError, OSError) as e:
             logger.error(f"Failed to load ROM library: {e}")
 
     def save(self) -> None:
-        """Persist ROM index to disk."""
+        """Persist ROM index to disk (deferred while inside :meth:`batched`)."""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._dirty = False
         self._data_dir.mkdir(parents=True, exist_ok=True)
         data = {
             "version": self._version,
             "roms": {key: _rom_entry_to_dict(entry) for key, entry in self._roms.items()},
         }
-        tmp = self._path.with_suffix(".tmp")
         try:
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            tmp.replace(self._path)
+            atomic_write_bytes(self._path, json_dumps_bytes(data))
         except OSError as e:
             logger.error(f"Failed to save ROM library: {e}")
-            tmp.unlink(missing_ok=True)
+        self._save_crc_cache()
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Coalesce every :meth:`save` inside the block into one write at exit.
+
+        Single-entry operations save immediately; callers touching many
+        entries should wrap the loop in this instead of saving per item.
+        Nested batches are folded into the outermost one.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save()
+
+    # ── CRC cache ──
+
+    def _load_crc_cache(self) -> None:
+        cache: dict[str, tuple[int, int, str]] = {}
+        if self._crc_path.exists():
+            try:
+                raw = json_loads(self._crc_path.read_bytes())
+                cache = {
+                    path: (int(size), int(mtime_ns), str(crc))
+                    for path, (size, mtime_ns, crc) in raw.items()
+                }
+            except (json.JSONDecodeError, OSError, TypeError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable CRC cache: {e}")
+                cache = {}
+        with self._crc_lock:
+            self._crc_cache = cache
+            self._crc_dirty = False
+
+    def _save_crc_cache(self) -> None:
+        with self._crc_save_lock:
+            with self._crc_lock:
+                if not self._crc_dirty:
+                    return
+                payload = json_dumps_bytes(self._crc_cache)
+                self._crc_dirty = False
+            try:
+                atomic_write_bytes(self._crc_path, payload)
+            except OSError as e:
+                logger.error(f"Failed to save CRC cache: {e}")
+                with self._crc_lock:
+                    self._crc_dirty = True
+
+    def cached_crc(self, path: str, size: int, mtime_ns: int) -> str | None:
+        """Return the cached CRC32 for *path* if its size and mtime still match."""
+        with self._crc_lock:
+            hit = self._crc_cache.get(path)
+        if hit is not None and hit[0] == size and hit[1] == mtime_ns:
+            return hit[2]
+        return None
+
+    def store_crc(self, path: str, size: int, mtime_ns: int, crc: str) -> None:
+        """Cache *crc* for *path*; safe to call from scan worker threads."""
+        with self._crc_lock:
+            self._crc_cache[path] = (size, mtime_ns, crc)
+            self._crc_dirty = True
+
+    def prune_crc_cache(self, keep: set[str]) -> None:
+        """Drop cached CRCs for paths not in *keep* (e.g. files gone since the last scan)."""
+        with self._crc_lock:
+            stale = self._crc_cache.keys() - keep
+            for path in stale:
+                del self._crc_cache[path]
+            if stale:
+                self._crc_dirty = True
 
     @staticmethod
     def make_key(platform: str, game_id: str) -> str:
@@ -82,17 +203,68 @@ class RomLibrary:
     def clear(self) -> None:
         """Remove all entries."""
         self._roms.clear()
+        self._by_platform.clear()
+        self._by_emulator.clear()
+        self._by_crc32.clear()
+        self._by_path.clear()
+
+    def _put(self, key: str, entry: RomEntry) -> None:
+        """Store *entry* under *key* and keep the secondary indexes in step."""
+        old = self._roms.get(key)
+        if old is not None:
+            if old.emulator != entry.emulator:
+                _unindex(self._by_emulator, old.emulator, key)
+            if old.hash_crc32 and old.hash_crc32 != entry.hash_crc32:
+                _unindex(self._by_crc32, old.hash_crc32, key)
+            if old.rom_path != entry.rom_path:
+                self._unindex_path(old)
+        self._roms[key] = entry
+        self._by_platform.setdefault(entry.platform, {})[key] = entry
+        self._by_emulator.setdefault(entry.emulator, {})[key] = entry
+        if entry.hash_crc32:
+            self._by_crc32.setdefault(entry.hash_crc32, {})[key] = entry
+        self._by_path[entry.rom_path] = (entry.platform, entry.game_id)
+
+    def _unindex_path(self, entry: RomEntry) -> None:
+        if self._by_path.get(entry.rom_path) == (entry.platform, entry.game_id):
+            del self._by_path[entry.rom_path]
+
+    def set_crc32(self, entry: RomEntry, crc32: str) -> None:
+        """Set *entry*'s CRC32 and keep the CRC index in step.
+
+        Use this instead of assigning ``hash_crc32`` on a stored entry.
+        """
+        key = self.make_key(entry.platform, entry.game_id)
+        indexed = self._roms.get(key) is entry
+        if indexed and entry.hash_crc32:
+            _unindex(self._by_crc32, entry.hash_crc32, key)
+        entry.hash_crc32 = crc32
+        if indexed and crc32:
+            self._by_crc32.setdefault(crc32, {})[key] = entry
 
     def add(self, entry: RomEntry) -> None:
         """Add or update a ROM entry."""
         if not entry.added_at:
-            entry.added_at = datetime.now(tz=timezone.utc).isoformat()
-        key = self.make_key(entry.platform, entry.game_id)
-        self._roms[key] = entry
+            entry.added_at = time.time_ns()
+        self._put(self.make_key(entry.platform, entry.game_id), entry)
+
+    def add_many(self, entries: Iterable[RomEntry]) -> None:
+        """Add or update several entries sharing one timestamp (later duplicates win)."""
+        now = time.time_ns()
+        for entry in entries:
+            if not entry.added_at:
+                entry.added_at = now
+            self._put(self.make_key(entry.platform, entry.game_id), entry)
 
     def remove(self, platform: str, game_id: str) -> None:
         key = self.make_key(platform, game_id)
-        self._roms.pop(key, None)
+        entry = self._roms.pop(key, None)
+        if entry is not None:
+            _unindex(self._by_platform, entry.platform, key)
+            _unindex(self._by_emulator, entry.emulator, key)
+            if entry.hash_crc32:
+                _unindex(self._by_crc32, entry.hash_crc32, key)
+            self._unindex_path(entry)
 
     def get(self, platform: str, game_id: str) -> RomEntry | None:
         key = self.make_key(platform, game_id)
@@ -100,34 +272,42 @@ class RomLibrary:
 
     def find_by_hash(self, crc32: str) -> list[RomEntry]:
         """Find ROM entries by CRC32 hash."""
-        return [e for e in self._roms.values() if e.hash_crc32 == crc32]
+        return list(self._by_crc32.get(crc32, {}).values())
 
     def all_entries(self) -> list[RomEntry]:
         return list(self._roms.values())
 
     def entries_by_platform(self, platform: str) -> list[RomEntry]:
-        return [e for e in self._roms.values() if e.platform == platform]
+        return list(self._by_platform.get(platform, {}).values())
 
     def entries_by_emulator(self, emulator: str) -> list[RomEntry]:
-        return [e for e in self._roms.values() if e.emulator == emulator]
+        return list(self._by_emulator.get(emulator, {}).values())
 
     def update_path(self, old_path: str, new_path: str) -> None:
         """Update ROM path after rename."""
-        for entry in self._roms.values():
-            if entry.rom_path == old_path:
-                entry.rom_path = new_path
-                return
+        with self._crc_lock:
+            cached = self._crc_cache.pop(old_path, None)
+            if cached is not None:
+                self._crc_cache[new_path] = cached
+                self._crc_dirty = True
+        ident = self._by_path.pop(old_path, None)
+        if ident is None:
+            return
+        entry = self._roms[self.make_key(*ident)]
+        entry.rom_path = new_path
+        self._by_path[new_path] = ident
 
     def find_duplicates(self) -> list[list[RomEntry]]:
         """Find duplicate ROMs based on (platform, game_id) hash or identical hash."""
-        hash_groups: dict[str, list[RomEntry]] = {}
-        for entry in self._roms.values():
-            if entry.hash_crc32:
-                hk = f"{entry.platform}:{entry.hash_crc32}"
-                if hk not in hash_groups:
-                    hash_groups[hk] = []
-                hash_groups[hk].append(entry)
-        return [group for group in hash_groups.values() if len(group) > 1]
+        groups: list[list[RomEntry]] = []
+        for bucket in self._by_crc32.values():
+            if len(bucket) < 2:
+                continue
+            by_platform: defaultdict[str, list[RomEntry]] = defaultdict(list)
+            for entry in bucket.values():
+                by_platform[entry.platform].append(entry)
+            groups.extend(group for group in by_platform.values() if len(group) > 1)
+        return groups
 
     @property
     def count(self) -> int:
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import copy
 import json
-from dataclasses import asdict
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
 from app.models.scrape_result import MergedMetadata, ScrapeResult
+from app.utils import atomic_write_bytes, json_dumps_bytes, json_loads, shallow_asdict
 
 
 class ScrapeCache:
@@ -25,45 +31,97 @@ class ScrapeCache:
         "providers": {
             "igdb": { ... ScrapeResult ... },
             "screenscraper": { ... ScrapeResult ... }
+        },
+        "missing": {
+            "igdb": {"query": "...", "expires": 1700000000.0}
         }
     }
+
+    ``missing`` is a negative cache: providers that found nothing for that
+    query, not asked again until ``expires`` (epoch seconds).
     """
 
+    MISSING_TTL = 24 * 60 * 60  # seconds
+    _FILE_MEMO_SIZE = 512
+
     def __init__(self, cache_dir: Path) -> None:
         self._cache_dir = cache_dir
+        # In-memory LRU of parsed cache files ({} = no file yet), so the
+        # getters and the read-modify-write savers share one parse per game.
+        # Memoized dicts are never mutated: _editing() works on a copy and
+        # only replaces the memo once the file is written.
+        self._file_memo: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._memo_lock = threading.Lock()
+        # One lock per cache file, held across each read-modify-write
+        self._file_locks: dict[tuple[str, str], threading.Lock] = {}
 
     def _cache_path(self, platform: str, game_id: str) -> Path:
         return self._cache_dir / platform / f"{game_id}.json"
 
     def _load_cache_file(self, platform: str, game_id: str) -> dict[str, Any]:
+        """Parsed cache file, from the LRU when possible (shared: read only)."""
+        key = (platform, game_id)
+        with self._memo_lock:
+            data = self._file_memo.get(key)
+            if data is not None:
+                self._file_memo.move_to_end(key)
+                return data
+        data = self._read_cache_file(platform, game_id)
+        self._remember(key, data)
+        return data
+
+    def _read_cache_file(self, platform: str, game_id: str) -> dict[str, Any]:
         path = self._cache_path(platform, game_id)
         if not path.exists():
             return {}
         try:
-            with open(path, encoding="utf-8") as f:
-                return json.load(f)
+            return json_loads(path.read_bytes())
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(f"Failed to load scrape cache for {platform}:{game_id}: {e}")
             return {}
 
-    def _save_cache_file(self, platform: str, game_id: str, data: dict[str, Any]) -> None:
+    def _file_lock(self, key: tuple[str, str]) -> threading.Lock:
+        with self._memo_lock:
+            return self._file_locks.setdefault(key, threading.Lock())
+
+    @contextmanager
+    def _editing(self, platform: str, game_id: str) -> Iterator[dict[str, Any]]:
+        """Yield a private copy of the cache file and write it back at exit.
+
+        Concurrent edits of the same game are serialized, so none is lost.
+        The memo only picks up the copy once it is safely on disk.
+        """
+        key = (platform, game_id)
+        with self._file_lock(key):
+            current = self._load_cache_file(platform, game_id)
+            # Edits replace per-provider records, never mutate them: two levels suffice
+            data = {k: dict(v) if isinstance(v, dict) else v for k, v in current.items()}
+            yield data
+            if self._save_cache_file(platform, game_id, data):
+                self._remember(key, data)
+
+    def _save_cache_file(self, platform: str, game_id: str, data: dict[str, Any]) -> bool:
         path = self._cache_path(platform, game_id)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = path.with_suffix(".tmp")
         try:
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            tmp.replace(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(path, json_dumps_bytes(data))
         except OSError as e:
             logger.error(f"Failed to save scrape cache for {platform}:{game_id}: {e}")
-            tmp.unlink(missing_ok=True)
+            return False
+        return True
+
+    def _remember(self, key: tuple[str, str], data: dict[str, Any]) -> None:
+        with self._memo_lock:
+            self._file_memo[key] = data
+            self._file_memo.move_to_end(key)
+            if len(self._file_memo) > self._FILE_MEMO_SIZE:
+                self._file_memo.popitem(last=False)
 
     def get_merged(self, platform: str, game_id: str) -> MergedMetadata | None:
         data = self._load_cache_file(platform, game_id)
         merged_data = data.get("merged")
-        if not merged_data:
-            return None
-        return MergedMetadata(**merged_data)
+        # Deep-copy the one record: its fields/sources dicts live in the shared memo
+        return MergedMetadata(**copy.deepcopy(merged_data)) if merged_data else None
 
     def get_provider(self, platform: str, game_id: str, provider: str) -> ScrapeResult | None:
         data = self._load_cache_file(platform, game_id)
@@ -71,26 +129,50 @@ class ScrapeCache:
         provider_data = providers.get(provider)
         if not provider_data:
             return None
-        return ScrapeResult(**provider_data)
+        return ScrapeResult(**copy.deepcopy(provider_data))
 
     def save_result(self, result: ScrapeResult) -> None:
         """Save a single provider's scrape result."""
-        data = self._load_cache_file(result.platform, result.game_id)
-        if "providers" not in data:
-            data["providers"] = {}
-        data["providers"][result.provider] = asdict(result)
-        self._save_cache_file(result.platform, result.game_id, data)
+        with self._editing(result.platform, result.game_id) as data:
+            data.setdefault("providers", {})[result.provider] = shallow_asdict(result)
+            data.get("missing", {}).pop(result.provider, None)
+
+    def mark_missing(
+        self,
+        provider: str,
+        platform: str,
+        game_id: str,
+        query: str,
+        ttl: float = MISSING_TTL,
+    ) -> None:
+        """Remember that *provider* found nothing for *query* for *ttl* seconds."""
+        with self._editing(platform, game_id) as data:
+            data.setdefault("missing", {})[provider] = {
+                "query": query,
+                "expires": time.time() + ttl,
+            }
+
+    def missing_providers(self, platform: str, game_id: str, query: str) -> set[str]:
+        """Providers with an unexpired "not found" for exactly this *query*."""
+        missing = self._load_cache_file(platform, game_id).get("missing", {})
+        now = time.time()
+        return {
+            provider
+            for provider, miss in missing.items()
+            if miss.get("query") == query and miss.get("expires", 0) > now
+        }
 
     def save_merged(self, merged: MergedMetadata) -> None:
         """Save the merged metadata result."""
-        data = self._load_cache_file(merged.platform, merged.game_id)
-        data["merged"] = asdict(merged)
-        self._save_cache_file(merged.platform, merged.game_id, data)
+        with self._editing(merged.platform, merged.game_id) as data:
+            data["merged"] = shallow_asdict(merged)
 
     def is_cached(self, platform: str, game_id: str) -> bool:
         return self._cache_path(platform, game_id).exists()
 
     def invalidate(self, platform: str, game_id: str) -> None:
-        path = self._cache_path(platform, game_id)
-        if path.exists():
-            path.unlink()
+        key = (platform, game_id)
+        with self._file_lock(key):
+            with self._memo_lock:
+                self._file_memo.pop(key, None)
+            self._cache_path(platform, game_id).unlink(missing_ok=True)
@@ -13,6 +13,9 @@ _I18N_DIR = Path(__file__).parent
 # Lazy-loaded translation cache: lang → dict
 _cache: dict[str, dict[str, str]] = {}
 
+# Per-language table with the zh_CN fallback merged in: lang → dict
+_merged: dict[str, dict[str, str]] = {}
+
 
 def _load(lang: str) -> dict[str, str]:
     """Load and cache a language JSON file."""
@@ -26,6 +29,14 @@ def _load(lang: str) -> dict[str, str]:
     return _cache[lang]
 
 
+def _table(lang: str) -> dict[str, str]:
+    """Return *lang*'s translations layered over zh_CN, built once."""
+    table = _merged.get(lang)
+    if table is None:
+        table = _merged[lang] = {**_load("zh_CN"), **_load(lang)}
+    return table
+
+
 def set_language(lang: str) -> None:
     """Set the active language.  Falls back to zh_CN if unsupported."""
     global _current_lang
@@ -42,7 +53,7 @@ def supported_languages() -> tuple[str, ...]:
     return _SUPPORTED
 
 
-def t(key: str, **kwargs: Any) -> str:
+def t(key: str, /, **kwargs: Any) -> str:
     """Translate *key* to the current language.
 
     Supports ``{name}``-style placeholders via keyword arguments::
@@ -51,14 +62,11 @@ def t(key: str, **kwargs: Any) -> str:
         # → "共 42 个游戏" (zh_CN)
         # → "Found 42 game(s)" (en_US)
     """
-    table = _load(_current_lang)
-    text = table.get(key)
-    if text is None:
-        # Fall back to zh_CN, then raw key
-        text = _load("zh_CN").get(key, key)
+    # Falls back to zh_CN, then the raw key
+    text = _table(_current_lang).get(key, key)
     if kwargs:
         try:
-            text = text.format(**kwargs)
+            text = text.format_map(kwargs)
         except (KeyError, IndexError):
             pass
     return text
@@ -20,14 +20,18 @@ def setup_logger(log_dir: Path | None = None) -> None:
         colorize=True,
     )
 
-    # File
+    # File — DEBUG records are formatted and written on loguru's queue thread
+    # so per-ROM scan logging stays off the scanning threads
     if log_dir:
         log_dir.mkdir(parents=True, exist_ok=True)
         logger.add(
             str(log_dir / "emulator-manager.log"),
             level="DEBUG",
             format="{time:YYYY-MM-DD HH:mm:ss} | {level:<7} | {name}:{line} | {message}",
-            rotation="5 MB",
+            rotation="10 MB",
             retention="7 days",
             encoding="utf-8",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
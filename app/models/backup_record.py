@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupPathInfo:
     """Information about a single backed-up file within a ZIP."""
 
@@ -16,7 +17,7 @@ class BackupPathInfo:
     is_dir: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupInfo:
     """Sidecar metadata for a backup ZIP (written as JSON)."""
 
@@ -29,7 +30,7 @@ class BackupInfo:
     backup_paths: list[BackupPathInfo] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupRecord:
     """In-memory representation of a discovered backup."""
 
@@ -46,3 +47,29 @@ class BackupRecord:
     is_pinned: bool = False
     pin_label: str = ""
     source_machine: str = ""
+
+    @classmethod
+    def from_meta(
+        cls,
+        meta: dict[str, Any],
+        *,
+        zip_path: str,
+        meta_path: str,
+        size: int,
+        emulator: str = "",
+        game_id: str = "",
+    ) -> BackupRecord:
+        """Build a record from a parsed sidecar dict (*emulator*/*game_id* are fallbacks)."""
+        return cls(
+            zip_path=zip_path,
+            meta_path=meta_path,
+            emulator=meta.get("emulator", emulator),
+            game_id=meta.get("game_id", game_id),
+            game_name=meta.get("game_name", ""),
+            platform=meta.get("platform", ""),
+            crc32=meta.get("crc32", ""),
+            size=size,
+            is_pinned=bool(meta.get("is_pinned", False)),
+            pin_label=meta.get("pin_label", ""),
+            source_machine=meta.get("source_machine", ""),
+        )
@@ -17,7 +17,7 @@ class SaveType(StrEnum):
     FILE = "file"
 
 
-@dataclass
+@dataclass(slots=True)
 class SaveFile:
     """Individual save file."""
 
@@ -27,7 +27,7 @@ class SaveFile:
     modified_time: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GameSave:
     """Collection of save files for one game under one emulator."""
 
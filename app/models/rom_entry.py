@@ -3,7 +3,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import StrEnum
+from operator import attrgetter
+
+# display_name language preference by lowercased ROM region; each getter
+# returns the RomInfo title fields in the order they should be tried
+_JA_FIRST = attrgetter("title_name_ja", "title_name_en", "title_name_zh", "title_name")
+_ZH_FIRST = attrgetter("title_name_zh", "title_name_en", "title_name_ja", "title_name")
+# USA, Europe, Germany, France, Spain, Italy, Australia, unknown
+_DEFAULT_TITLE_ORDER = attrgetter("title_name_en", "title_name_zh", "title_name_ja", "title_name")
+_TITLE_ORDER: dict[str, attrgetter] = {
+    "japan": _JA_FIRST,
+    "china": _ZH_FIRST,
+    "taiwan": _ZH_FIRST,
+    "hong kong": _ZH_FIRST,
+    "asia": _ZH_FIRST,
+}
 
 
 class RomFileType(StrEnum):
@@ -26,7 +42,7 @@ class ContentType(StrEnum):
     RAW = "raw"
 
 
-@dataclass
+@dataclass(slots=True)
 class RomInfo:
     """ROM embedded metadata — extracted by plugin.parse_rom_info()."""
 
@@ -50,7 +66,7 @@ class RomInfo:
     dat_id: int = -1  # Numeric ID from No-Intro DAT (-1 if unmatched or non-numeric)
 
 
-@dataclass
+@dataclass(slots=True)
 class RomEntry:
     """ROM file index record — stored in rom_library.json."""
 
@@ -61,39 +77,26 @@ class RomEntry:
     file_size: int = 0
     hash_crc32: str = ""
     hash_sha1: str = ""
-    added_at: str = ""
+    added_at: int = 0  # ns since the epoch (time.time_ns()); 0 = unknown
     rom_info: RomInfo | None = None
     scrape_status: str = "none"  # none / partial / done
 
+    @property
+    def added_at_iso(self) -> str:
+        """``added_at`` as a UTC ISO-8601 string, or ``""`` if unknown."""
+        if not self.added_at:
+            return ""
+        seconds, ns = divmod(self.added_at, 1_000_000_000)
+        stamp = datetime.fromtimestamp(seconds, tz=UTC)
+        return stamp.replace(microsecond=ns // 1_000).isoformat()
+
     @property
     def display_name(self) -> str:
         """Best available display name, using region to pick language."""
-        if self.rom_info:
-            # Determine preferred language order based on ROM region
-            region = (self.rom_info.region or "").lower()
-            if region in ("japan",):
-                order = (
-                    self.rom_info.title_name_ja,
-                    self.rom_info.title_name_en,
-                    self.rom_info.title_name_zh,
-                    self.rom_info.title_name,
-                )
-            elif region in ("china", "taiwan", "hong kong", "asia"):
-                order = (
-                    self.rom_info.title_name_zh,
-                    self.rom_info.title_name_en,
-                    self.rom_info.title_name_ja,
-                    self.rom_info.title_name,
-                )
-            else:
-                # USA, Europe, Germany, France, Spain, Italy, Australia, unknown
-                order = (
-                    self.rom_info.title_name_en,
-                    self.rom_info.title_name_zh,
-                    self.rom_info.title_name_ja,
-                    self.rom_info.title_name,
-                )
-            for name in order:
+        info = self.rom_info
+        if info:
+            titles = _TITLE_ORDER.get((info.region or "").lower(), _DEFAULT_TITLE_ORDER)
+            for name in titles(info):
                 if name:
                     return name
         return self.game_id
@@ -28,7 +28,7 @@ class MetadataField(StrEnum):
     SCREENSHOTS = "screenshots"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeResult:
     """Single provider scrape result."""
 
@@ -60,7 +60,7 @@ class ScrapeResult:
     scraped_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MergedMetadata:
     """Per-field merged result — records which provider each field came from."""
 
@@ -6,8 +6,12 @@ GamePlugin      → ROM/game management (parse ROMs, resolve names, scraping con
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -16,6 +20,38 @@ if TYPE_CHECKING:
     from app.models.game_save import GameSave
     from app.models.rom_entry import RomInfo
 
+    _Detect = Callable[["EmulatorPlugin", list[str] | None], list[EmulatorInfo]]
+
+
+# (plugin class, extra paths) → (monotonic time, installations)
+_detect_cache: dict[tuple[type, tuple[str, ...]], tuple[float, list[EmulatorInfo]]] = {}
+
+
+def ttl_cache(seconds: float = 5.0) -> Callable[[_Detect], _Detect]:
+    """
+    Memoize ``detect_installation`` per plugin class and extra paths.
+
+    Detection only probes a handful of well-known paths, but the UI asks
+    again on every refresh.  Results are reused for *seconds*;
+    ``EmulatorPlugin.invalidate_cache()`` forces the next call to re-probe.
+    """
+    def decorate(method: _Detect) -> _Detect:
+        @functools.wraps(method)
+        def wrapper(
+            self: EmulatorPlugin, extra_paths: list[str] | None = None
+        ) -> list[EmulatorInfo]:
+            key = (type(self), tuple(extra_paths or ()))
+            now = time.monotonic()
+            hit = _detect_cache.get(key)
+            if hit is None or now - hit[0] >= seconds:
+                hit = (now, method(self, extra_paths))
+                _detect_cache[key] = hit
+            return list(hit[1])
+
+        return wrapper
+
+    return decorate
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  EmulatorPlugin — serves the save-management module
@@ -73,13 +109,19 @@ class EmulatorPlugin(ABC):
 
     # ── Helpers ──
 
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget cached detection results for this plugin class (and subclasses)."""
+        for key in [k for k in _detect_cache if issubclass(k[0], cls)]:
+            _detect_cache.pop(key, None)
+
     @staticmethod
     def deduplicate(saves: list[GameSave]) -> list[GameSave]:
         """Remove duplicate saves based on (game_id, emulator) key."""
-        seen: set[str] = set()
+        seen: set[tuple[str, str]] = set()
         unique: list[GameSave] = []
         for s in saves:
-            key = f"{s.emulator}:{s.game_id}"
+            key = (s.emulator, s.game_id)
             if key not in seen:
                 seen.add(key)
                 unique.append(s)
@@ -91,7 +133,7 @@ class EmulatorPlugin(ABC):
         seen: set[str] = set()
         unique: list[EmulatorInfo] = []
         for info in installations:
-            key = str(info.data_path)
+            key = os.fspath(info.data_path)
             if key not in seen:
                 seen.add(key)
                 unique.append(info)
@@ -115,7 +157,8 @@ class GamePlugin(ABC):
       • Provide platform context for scrapers
     """
 
-    _display_name_table: dict[str, dict[str, str]] = {}
+    # game ID → preferred display name, loaded on first use (None = not yet)
+    _name_table: dict[str, str] | None = None
 
     # ── Required interface ──
 
@@ -167,17 +210,10 @@ class GamePlugin(ABC):
         Uses the plugin's ``game_names.json`` file.  Subclasses may also query
         ROM-embedded NACP/header data or online sources.
         """
-        if not self._display_name_table:
-            self._load_display_name_table()
-        names = self._display_name_table.get(game_id, {})
-        if names:
-            return (
-                names.get("zh_CN")
-                or names.get("en_US")
-                or names.get("ja_JP")
-                or None
-            )
-        return None
+        table = self._name_table
+        if table is None:
+            table = self._load_display_name_table()
+        return table.get(game_id)
 
     def resolve_display_names(self, saves: list[GameSave]) -> None:
         """Batch-resolve game IDs to display names on save objects."""
@@ -205,13 +241,26 @@ class GamePlugin(ABC):
 
     # ── Internal ──
 
-    def _load_display_name_table(self) -> None:
-        """Load ``game_names.json`` from the plugin's directory."""
-        plugin_dir = Path(__file__).parent / self.name
-        names_file = plugin_dir / "game_names.json"
+    def _load_display_name_table(self) -> dict[str, str]:
+        """Load ``game_names.json`` from the plugin's directory.
+
+        Each entry is flattened to its preferred name (zh_CN → en_US → ja_JP)
+        once here, and a missing or unreadable file is remembered as an
+        empty table instead of being probed again on every lookup.
+        """
+        names_file = Path(__file__).parent / self.name / "game_names.json"
+        raw: dict[str, dict[str, str]] = {}
         if names_file.exists():
             try:
                 with open(names_file, encoding="utf-8") as f:
-                    self._display_name_table = json.load(f)
+                    raw = json.load(f)
             except (json.JSONDecodeError, OSError):
-                self._display_name_table = {}
+                raw = {}
+        # Build fully before publishing — scans call this from worker threads.
+        table: dict[str, str] = {}
+        for game_id, names in raw.items():
+            name = names.get("zh_CN") or names.get("en_US") or names.get("ja_JP")
+            if name:
+                table[game_id] = name
+        self._name_table = table
+        return table
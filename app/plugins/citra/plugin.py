@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from app.models.emulator import EmulatorInfo
 from app.models.game_save import GameSave, SaveFile, SaveType
-from app.plugins.base import EmulatorPlugin
+from app.plugins.base import EmulatorPlugin, ttl_cache
+from app.utils import dir_size
+
+_TITLE_ID_RE = re.compile(r"[0-9A-F]+")
+
+
+def _subdirs(path: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """Subdirectories of *path* as scandir entries; nothing if it is missing."""
+    try:
+        with os.scandir(path) as it:
+            yield from (entry for entry in it if entry.is_dir())
+    except OSError:
+        return
 
 
 class CitraPlugin(EmulatorPlugin):
@@ -23,6 +37,7 @@ class CitraPlugin(EmulatorPlugin):
     def supported_platforms(self) -> list[str]:
         return ["3ds"]
 
+    @ttl_cache()
     def detect_installation(
         self, extra_paths: list[str] | None = None
     ) -> list[EmulatorInfo]:
@@ -56,30 +71,23 @@ class CitraPlugin(EmulatorPlugin):
         # Citra saves: sdmc/Nintendo 3DS/<id>/<id>/title/<high>/<low>/data/
         sdmc = Path(emulator.data_path) / "sdmc" / "Nintendo 3DS"
         if sdmc.exists():
-            for title_dir in sdmc.rglob("title"):
-                if not title_dir.is_dir():
-                    continue
-                for high_dir in title_dir.iterdir():
-                    if not high_dir.is_dir():
-                        continue
-                    for low_dir in high_dir.iterdir():
-                        if not low_dir.is_dir():
-                            continue
-                        data_dir = low_dir / "data" / "00000001"
-                        if data_dir.exists():
+            for id0_dir in _subdirs(sdmc):
+                for id1_dir in _subdirs(id0_dir.path):
+                    title_root = os.path.join(id1_dir.path, "title")
+                    for high_dir in _subdirs(title_root):
+                        for low_dir in _subdirs(high_dir.path):
                             title_id = f"{high_dir.name}{low_dir.name}".upper()
-                            if not re.match(r'^[0-9A-F]+$', title_id):
+                            if not _TITLE_ID_RE.fullmatch(title_id):
+                                continue
+                            data_dir = Path(low_dir.path, "data", "00000001")
+                            if not data_dir.exists():
                                 continue
 
                             files = [
                                 SaveFile(
                                     path=data_dir,
                                     save_type=SaveType.FOLDER,
-                                    size=sum(
-                                        f.stat().st_size
-                                        for f in data_dir.rglob("*")
-                                        if f.is_file()
-                                    ),
+                                    size=dir_size(data_dir),
                                 )
                             ]
                             saves.append(
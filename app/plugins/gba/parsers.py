@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 
 from loguru import logger
 
+from app.utils import crc32_fd, crc32_file, memoized_crc32, prime_crc32
+
 # GBA ROM header layout (offsets from 0x00)
 # 0x00 - 0x03 : ARM branch instruction (entry point)
 # 0x04 - 0x9F : Nintendo logo (compressed bitmap)
@@ -22,6 +27,11 @@ from loguru import logger
 
 _HEADER_SIZE = 0xC0  # minimum bytes needed
 
+# (path, mtime_ns, size) → parsed header, most recently used last
+_HEADER_MEMO_SIZE = 4096
+_header_memo: OrderedDict[tuple[str, int, int], GBAHeaderInfo | None] = OrderedDict()
+_header_lock = threading.Lock()
+
 # Game code last character → region mapping
 # Sources: devkitPro/ndstool ndscodes.cpp (J/E/P/D/F/I/S/H/K/X)
 #          + well-known GBA additions (U=Australia, C=China/iQue)
@@ -65,7 +75,7 @@ _MAKER_MAP: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GBAHeaderInfo:
     """Parsed GBA ROM header data."""
 
@@ -103,20 +113,80 @@ def parse_gba_header(path: Path) -> GBAHeaderInfo | None:
     Parse the GBA ROM header from a ``.gba`` file.
 
     Returns ``None`` if the file is too small or doesn't look like a GBA ROM.
+    Results are cached per ``(path, mtime, size)``, so the plugin's
+    ``parse_rom_info`` and ``extract_game_id`` read each header once.
     """
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        logger.debug(f"Failed to read GBA ROM '{path.name}': {e}")
+        return None
+    if st.st_size < _HEADER_SIZE:
+        return None
+    key = (os.fspath(path), st.st_mtime_ns, st.st_size)
+    with _header_lock:
+        if key in _header_memo:
+            _header_memo.move_to_end(key)
+            return _header_memo[key]
+    info = _read_gba_header(Path(path))
+    _remember_header(key, info)
+    return info
+
+
+def parse_gba_header_and_crc(path: Path, max_size: int) -> tuple[GBAHeaderInfo | None, str]:
+    """
+    Parse the header and CRC32 the whole ROM from a single ``open()``.
+
+    The CRC is ``""`` for files over *max_size*.  A CRC already in the
+    active ``crc32_memo()`` is reused rather than rehashed; one computed
+    here is recorded there, and the header goes into the
+    :func:`parse_gba_header` cache.
+    """
+    if memoized_crc32(path) is not None:
+        return parse_gba_header(path), crc32_file(path, max_size)
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size < _HEADER_SIZE:
+                return None, ""
+            header = f.read(_HEADER_SIZE)
+            crc = crc32_fd(f.fileno(), st.st_size) if st.st_size <= max_size else ""
+    except (OSError, ValueError) as e:
+        logger.debug(f"Failed to read GBA ROM '{path.name}': {e}")
+        return None, ""
+    if crc:
+        prime_crc32(path, st.st_size, crc)
+    info = _decode_gba_header(header, path.name)
+    _remember_header((os.fspath(path), st.st_mtime_ns, st.st_size), info)
+    return info, crc
+
+
+def _remember_header(key: tuple[str, int, int], info: GBAHeaderInfo | None) -> None:
+    # mtime_ns and size are only part of the key: a changed file misses
+    with _header_lock:
+        _header_memo[key] = info
+        _header_memo.move_to_end(key)
+        if len(_header_memo) > _HEADER_MEMO_SIZE:
+            _header_memo.popitem(last=False)
+
+
+def _read_gba_header(path: Path) -> GBAHeaderInfo | None:
     try:
         with open(path, "rb") as f:
             header = f.read(_HEADER_SIZE)
     except OSError as e:
         logger.debug(f"Failed to read GBA ROM '{path.name}': {e}")
         return None
+    return _decode_gba_header(header, path.name)
+
 
+def _decode_gba_header(header: bytes, name: str) -> GBAHeaderInfo | None:
     if len(header) < _HEADER_SIZE:
         return None
 
     # Validate fixed byte at 0xB2 (should be 0x96)
     if header[0xB2] != 0x96:
-        logger.debug(f"GBA header validation failed for '{path.name}': "
+        logger.debug(f"GBA header validation failed for '{name}': "
                       f"byte 0xB2 = {header[0xB2]:#04x}, expected 0x96")
         # Don't return None — some homebrew ROMs lack this, still try to parse
 
@@ -137,9 +207,7 @@ def parse_gba_header(path: Path) -> GBAHeaderInfo | None:
 
     # Complement check: header[0xBD]
     # checksum = -(sum of bytes 0xA0..0xBC) - 0x19, truncated to 8 bits
-    chk_sum = 0
-    for i in range(0xA0, 0xBD):
-        chk_sum += header[i]
+    chk_sum = sum(memoryview(header)[0xA0:0xBD])
     expected = (-(chk_sum + 0x19)) & 0xFF
     valid_checksum = header[0xBD] == expected
 
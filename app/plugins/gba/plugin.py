@@ -2,52 +2,51 @@
 
 from __future__ import annotations
 
+import functools
 import json
-import zlib
+from collections.abc import Mapping
 from pathlib import Path
-
+from types import MappingProxyType
 from typing import Any
 
 from app.models.rom_entry import RomInfo
 from app.plugins.base import GamePlugin
-from app.plugins.gba.parsers import parse_gba_header
-
-_games_db: dict[str, dict[str, Any]] | None = None
-_custom_db: dict[str, dict[str, str]] | None = None
-
-
-def _load_games_db() -> dict[str, dict[str, Any]]:
-    """Lazy-load the CRC32 → {name, id} mapping from games.json."""
-    global _games_db
-    if _games_db is None:
-        db_path = Path(__file__).parent / "games.json"
-        if db_path.exists():
-            with open(db_path, encoding="utf-8") as f:
-                raw = json.load(f)
-            _games_db = {}
-            for crc, val in raw.items():
-                if isinstance(val, str):
-                    _games_db[crc] = {"name": val, "id": -1}
-                else:
-                    _games_db[crc] = {"name": val.get("name", ""), "id": val.get("id", -1)}
-        else:
-            _games_db = {}
-    assert _games_db is not None
-    return _games_db
-
-
-def _load_custom_db() -> dict[str, dict[str, str]]:
-    """Lazy-load the CRC32 → {name, region} mapping from games_custom.json."""
-    global _custom_db
-    if _custom_db is None:
-        db_path = Path(__file__).parent / "games_custom.json"
-        if db_path.exists():
-            with open(db_path, encoding="utf-8") as f:
-                _custom_db = json.load(f)
+from app.plugins.gba.parsers import parse_gba_header, parse_gba_header_and_crc
+from app.utils import crc32_file
+
+_DB_DIR = Path(__file__).parent
+
+# Larger files are not GBA ROMs (32 MiB max); don't hash them
+_MAX_CRC_SIZE = 64 * 1024 * 1024
+
+
+def _read_db(filename: str) -> dict[str, Any]:
+    db_path = _DB_DIR / filename
+    if not db_path.exists():
+        return {}
+    with open(db_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@functools.cache
+def _crc_db() -> Mapping[str, tuple[str, str | None, int]]:
+    """CRC32 → (name, region or None, DAT id), loaded on first use.
+
+    ``games.json`` (the official DB) overlaid with ``games_custom.json``
+    (fan translations etc.), so one lookup applies the custom-first
+    priority.  Built fully before publishing — scans call this from
+    worker threads.
+    """
+    db: dict[str, tuple[str, str | None, int]] = {}
+    for crc, val in _read_db("games.json").items():
+        if isinstance(val, str):
+            db[crc] = (val, None, -1)
         else:
-            _custom_db = {}
-    assert _custom_db is not None
-    return _custom_db
+            db[crc] = (val.get("name", ""), None, val.get("id", -1))
+    for crc, val in _read_db("games_custom.json").items():
+        if val.get("name"):
+            db[crc] = (val["name"], val.get("region"), -1)
+    return MappingProxyType(db)
 
 
 class GBAGamePlugin(GamePlugin):
@@ -73,34 +72,23 @@ class GBAGamePlugin(GamePlugin):
     # ── ROM parsing ──
 
     def parse_rom_info(self, rom_path: Path) -> RomInfo | None:
-        header = parse_gba_header(rom_path)
+        # Header and CRC32 from one open of the file
+        header, crc = parse_gba_header_and_crc(rom_path, _MAX_CRC_SIZE)
         if header is None:
             return None
 
         title_name = ""
         region = header.region
         dat_crc32: list[str] | None = None
-
-        # Compute CRC32 first
-        crc = self._compute_crc32(rom_path)
-
         dat_id = -1
 
-        # Priority 1: custom DB (fan translations etc.) keyed by CRC32
-        if crc:
-            custom = _load_custom_db().get(crc)
-            if custom:
-                title_name = custom["name"]
-                region = custom.get("region", region)
-                dat_crc32 = [crc]
-
-        # Priority 2: official games DB keyed by CRC32
-        if not title_name and crc:
-            db_entry = _load_games_db().get(crc)
-            if db_entry:
-                title_name = db_entry["name"]
-                dat_id = db_entry.get("id", -1)
-                dat_crc32 = [crc]
+        # Priority 1: custom DB, 2: official DB — both keyed by CRC32
+        hit = _crc_db().get(crc) if crc else None
+        if hit:
+            title_name, hit_region, dat_id = hit
+            if hit_region is not None:
+                region = hit_region
+            dat_crc32 = [crc]
 
         # Priority 3: ROM header embedded name
         if not title_name:
@@ -150,15 +138,6 @@ class GBAGamePlugin(GamePlugin):
     # ── Helpers ──
 
     @staticmethod
-    def _compute_crc32(path: Path, max_size: int = 64 * 1024 * 1024) -> str:
+    def _compute_crc32(path: Path, max_size: int = _MAX_CRC_SIZE) -> str:
         """Compute CRC32 for the ROM file (skip files > max_size)."""
-        if path.stat().st_size > max_size:
-            return ""
-        crc = 0
-        with open(path, "rb") as f:
-            while True:
-                chunk = f.read(65536)
-                if not chunk:
-                    break
-                crc = zlib.crc32(chunk, crc)
-        return f"{crc & 0xFFFFFFFF:08X}"
+        return crc32_file(path, max_size)
@@ -6,7 +6,8 @@ from pathlib import Path
 
 from app.models.emulator import EmulatorInfo
 from app.models.game_save import GameSave, SaveFile, SaveType
-from app.plugins.base import EmulatorPlugin
+from app.plugins.base import EmulatorPlugin, ttl_cache
+from app.utils import scan_files
 
 
 class MesenPlugin(EmulatorPlugin):
@@ -22,6 +23,7 @@ class MesenPlugin(EmulatorPlugin):
     def supported_platforms(self) -> list[str]:
         return ["nes", "snes", "gb", "gbc", "gba"]
 
+    @ttl_cache()
     def detect_installation(
         self, extra_paths: list[str] | None = None
     ) -> list[EmulatorInfo]:
@@ -55,49 +57,52 @@ class MesenPlugin(EmulatorPlugin):
 
         # Battery saves (.sav)
         saves_dir = Path(emulator.data_path) / "Saves"
-        if saves_dir.exists():
-            for sav in saves_dir.glob("*.sav"):
-                saves.append(
-                    GameSave(
-                        game_id=sav.stem,
-                        game_name=sav.stem,
-                        emulator=self.name,
-                        platform=self._guess_platform(sav),
-                        files=[
-                            SaveFile(
-                                path=sav,
-                                save_type=SaveType.BATTERY,
-                                size=sav.stat().st_size,
-                            )
-                        ],
-                    )
+        # Every file shares the folder, so the platform guess is made once
+        platform = self._guess_platform(saves_dir.name)
+        for entry in scan_files(saves_dir):
+            if not entry.name.lower().endswith(".sav"):
+                continue
+            stem = entry.name[:-4]
+            saves.append(
+                GameSave(
+                    game_id=stem,
+                    game_name=stem,
+                    emulator=self.name,
+                    platform=platform,
+                    files=[
+                        SaveFile(
+                            path=Path(entry.path),
+                            save_type=SaveType.BATTERY,
+                            size=entry.stat().st_size,
+                        )
+                    ],
                 )
+            )
 
         # Save states
         states_dir = Path(emulator.data_path) / "SaveStates"
-        if states_dir.exists():
-            grouped: dict[str, list[Path]] = {}
-            for ss in states_dir.glob("*.mss"):
-                grouped.setdefault(ss.stem.rsplit("_", 1)[0], []).append(ss)
-
-            for game_name, files in grouped.items():
-                save_files = [
-                    SaveFile(
-                        path=f,
-                        save_type=SaveType.SAVESTATE,
-                        size=f.stat().st_size,
-                    )
-                    for f in files
-                ]
-                saves.append(
-                    GameSave(
-                        game_id=game_name,
-                        game_name=game_name,
-                        emulator=self.name,
-                        platform="nes",
-                        files=save_files,
-                    )
+        grouped: dict[str, list[SaveFile]] = {}
+        for entry in scan_files(states_dir):
+            if not entry.name.lower().endswith(".mss"):
+                continue
+            grouped.setdefault(entry.name[:-4].rsplit("_", 1)[0], []).append(
+                SaveFile(
+                    path=Path(entry.path),
+                    save_type=SaveType.SAVESTATE,
+                    size=entry.stat().st_size,
+                )
+            )
+
+        for game_name, save_files in grouped.items():
+            saves.append(
+                GameSave(
+                    game_id=game_name,
+                    game_name=game_name,
+                    emulator=self.name,
+                    platform="nes",
+                    files=save_files,
                 )
+            )
 
         return self.deduplicate(saves)
 
@@ -110,9 +115,9 @@ class MesenPlugin(EmulatorPlugin):
         return dirs
 
     @staticmethod
-    def _guess_platform(path: Path) -> str:
-        """Try to guess platform from parent directory or file patterns."""
-        parent = path.parent.name.lower()
+    def _guess_platform(folder_name: str) -> str:
+        """Try to guess platform from the name of the folder holding the saves."""
+        parent = folder_name.lower()
         if "snes" in parent or "sfc" in parent:
             return "snes"
         if "gb" in parent:
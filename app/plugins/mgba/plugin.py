@@ -6,7 +6,8 @@ from pathlib import Path
 
 from app.models.emulator import EmulatorInfo
 from app.models.game_save import GameSave, SaveFile, SaveType
-from app.plugins.base import EmulatorPlugin
+from app.plugins.base import EmulatorPlugin, ttl_cache
+from app.utils import scan_files
 
 
 class MGBAPlugin(EmulatorPlugin):
@@ -26,6 +27,7 @@ class MGBAPlugin(EmulatorPlugin):
 
     # ── Detection ──
 
+    @ttl_cache()
     def detect_installation(
         self, extra_paths: list[str] | None = None
     ) -> list[EmulatorInfo]:
@@ -63,19 +65,13 @@ class MGBAPlugin(EmulatorPlugin):
         data_path = Path(emulator.data_path)
 
         # Battery saves (.sav) — mGBA saves alongside the ROM or in a savedir
-        saves_dir = data_path / "saves"
-        if saves_dir.exists():
-            self._scan_battery_saves(saves_dir, saves)
+        self._scan_battery_saves(data_path / "saves", saves)
 
         # Also check a common "savegames" folder
-        savegames_dir = data_path / "savegames"
-        if savegames_dir.exists():
-            self._scan_battery_saves(savegames_dir, saves)
+        self._scan_battery_saves(data_path / "savegames", saves)
 
         # Save states (.ss0 .. .ss9, or .State1 .. .State9)
-        states_dir = data_path / "states"
-        if states_dir.exists():
-            self._scan_save_states(states_dir, saves)
+        self._scan_save_states(data_path / "states", saves)
 
         # If the user specified custom paths, scan those too
         if custom_paths:
@@ -88,18 +84,21 @@ class MGBAPlugin(EmulatorPlugin):
 
     def _scan_battery_saves(self, directory: Path, saves: list[GameSave]) -> None:
         """Scan a directory for .sav battery save files."""
-        for sav in directory.glob("*.sav"):
+        for entry in scan_files(directory):
+            if not entry.name.lower().endswith(".sav"):
+                continue
+            stem = entry.name[:-4]
             saves.append(
                 GameSave(
-                    game_id=sav.stem,
-                    game_name=sav.stem,
+                    game_id=stem,
+                    game_name=stem,
                     emulator=self.name,
                     platform="gba",
                     files=[
                         SaveFile(
-                            path=sav,
+                            path=Path(entry.path),
                             save_type=SaveType.BATTERY,
-                            size=sav.stat().st_size,
+                            size=entry.stat().st_size,
                         )
                     ],
                 )
@@ -107,23 +106,20 @@ class MGBAPlugin(EmulatorPlugin):
 
     def _scan_save_states(self, directory: Path, saves: list[GameSave]) -> None:
         """Scan a directory for mGBA save state files (.ss0-.ss9)."""
-        grouped: dict[str, list[Path]] = {}
-        for ss in directory.iterdir():
-            if not ss.is_file():
-                continue
+        grouped: dict[str, list[SaveFile]] = {}
+        for entry in scan_files(directory):
             # mGBA save states: <romname>.ss0 .. .ss9
-            if ss.suffix.lower().startswith(".ss") and len(ss.suffix) == 4:
-                grouped.setdefault(ss.stem, []).append(ss)
-
-        for game_name, files in grouped.items():
-            save_files = [
-                SaveFile(
-                    path=f,
-                    save_type=SaveType.SAVESTATE,
-                    size=f.stat().st_size,
+            name = entry.name
+            if len(name) > 4 and name[-4:-1].lower() == ".ss" and name[-1].isdigit():
+                grouped.setdefault(name[:-4], []).append(
+                    SaveFile(
+                        path=Path(entry.path),
+                        save_type=SaveType.SAVESTATE,
+                        size=entry.stat().st_size,
+                    )
                 )
-                for f in files
-            ]
+
+        for game_name, save_files in grouped.items():
             saves.append(
                 GameSave(
                     game_id=game_name,
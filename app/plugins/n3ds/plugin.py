@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import json
-import zlib
 from pathlib import Path
 from typing import Any
 
 from app.models.rom_entry import RomInfo
 from app.plugins.base import GamePlugin
 from app.plugins.n3ds.parsers import parse_n3ds_rom
+from app.utils import crc32_file
 
 _games_db: dict[str, dict[str, Any]] | None = None
 _custom_db: dict[str, dict[str, str]] | None = None
@@ -23,12 +23,13 @@ def _load_games_db() -> dict[str, dict[str, Any]]:
         if db_path.exists():
             with open(db_path, encoding="utf-8") as f:
                 raw = json.load(f)
-            _games_db = {}
+            db: dict[str, dict[str, Any]] = {}
             for crc, val in raw.items():
                 if isinstance(val, str):
-                    _games_db[crc] = {"name": val, "id": -1}
+                    db[crc] = {"name": val, "id": -1}
                 else:
-                    _games_db[crc] = {"name": val.get("name", ""), "id": val.get("id", -1)}
+                    db[crc] = {"name": val.get("name", ""), "id": val.get("id", -1)}
+            _games_db = db
         else:
             _games_db = {}
     assert _games_db is not None
@@ -158,16 +159,4 @@ class N3DSGamePlugin(GamePlugin):
     @staticmethod
     def _compute_crc32(path: Path, max_size: int = 4 * 1024 * 1024 * 1024) -> str:
         """Compute CRC32 for the ROM file (skip files > max_size)."""
-        try:
-            if path.stat().st_size > max_size:
-                return ""
-            crc = 0
-            with open(path, "rb") as f:
-                while True:
-                    chunk = f.read(65536)
-                    if not chunk:
-                        break
-                    crc = zlib.crc32(chunk, crc)
-            return f"{crc & 0xFFFFFFFF:08X}"
-        except OSError:
-            return ""
+        return crc32_file(path, max_size)
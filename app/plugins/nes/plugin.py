@@ -5,7 +5,6 @@ from __future__ import annotations
 import json
 import re
 import tempfile
-import zlib
 from pathlib import Path
 
 from typing import Any
@@ -15,6 +14,7 @@ from loguru import logger
 from app.models.rom_entry import RomInfo
 from app.plugins.base import GamePlugin
 from app.plugins.nes.parsers import parse_nes_header
+from app.utils import crc32_bytes, crc32_file, forget_crc32
 
 _games_db: dict[str, dict[str, Any]] | None = None
 _dat_headers: list[bytes] | None = None
@@ -29,12 +29,13 @@ def _load_games_db() -> dict[str, dict[str, Any]]:
         if db_path.exists():
             with open(db_path, encoding="utf-8") as f:
                 raw = json.load(f)
-            _games_db = {}
+            db: dict[str, dict[str, Any]] = {}
             for crc, val in raw.items():
                 if isinstance(val, str):
-                    _games_db[crc] = {"name": val, "id": -1}
+                    db[crc] = {"name": val, "id": -1}
                 else:
-                    _games_db[crc] = {"name": val.get("name", ""), "id": val.get("id", -1)}
+                    db[crc] = {"name": val.get("name", ""), "id": val.get("id", -1)}
+            _games_db = db
         else:
             _games_db = {}
     assert _games_db is not None
@@ -108,15 +109,25 @@ _REGION_TAGS: dict[str, str] = {
     "J": "Japan", "E": "Europe",
 }
 
+# One left-to-right pass: step over plain text, whole bracket groups and
+# stray openers until the first group with a comma-separated part that is
+# exactly a tag.  Same result as splitting every group on commas.
+_REGION_RE = re.compile(
+    r"(?:[^(\[]|[(\[][^)\]]+[)\]]|[(\[](?![^)\]]+[)\]]))*?"
+    r"[(\[](?:[^)\],]*,)*?\s*(" + "|".join(map(re.escape, _REGION_TAGS)) + r")\s*"
+    r"(?=[,)\]])[^)\]]*[)\]]"
+)
+_BETA_RE = re.compile(r"\(Beta(?:\s+(\d+))?\)", re.IGNORECASE)
+_VC_RE = re.compile(r"\(Virtual Console\)", re.IGNORECASE)
+_SAMPLE_RE = re.compile(r"\(Sample\)", re.IGNORECASE)
+_REV_RE = re.compile(r"\(Rev\s+([\d.]+)\)", re.IGNORECASE)
+_BRACKET_VER_RE = re.compile(r"\[1\.(\d+)\]")
+
 
 def _extract_region_from_filename(stem: str) -> str:
     """Extract region from filename brackets, e.g. '(Japan)', '(USA, Europe)', or '[US]'."""
-    for m in re.finditer(r"[\(\[]([^)\]]+)[\)\]]", stem):
-        parts = [p.strip() for p in m.group(1).split(",")]
-        for part in parts:
-            if part in _REGION_TAGS:
-                return _REGION_TAGS[part]
-    return ""
+    m = _REGION_RE.match(stem)
+    return _REGION_TAGS[m.group(1)] if m else ""
 
 
 def _extract_version_from_filename(stem: str) -> str:
@@ -134,21 +145,21 @@ def _extract_version_from_filename(stem: str) -> str:
     - No match → ``""``
     """
     # Special versions take priority — ignore numeric version
-    beta_m = re.search(r"\(Beta(?:\s+(\d+))?\)", stem, re.IGNORECASE)
+    beta_m = _BETA_RE.search(stem)
     if beta_m:
         return f"beta {beta_m.group(1)}" if beta_m.group(1) else "beta"
-    if re.search(r"\(Virtual Console\)", stem, re.IGNORECASE):
+    if _VC_RE.search(stem):
         return "vc"
-    if re.search(r"\(Sample\)", stem, re.IGNORECASE):
+    if _SAMPLE_RE.search(stem):
         return "sample"
 
     # Match (Rev N) or (Rev X.Y) where N is a digit or decimal
-    m = re.search(r"\(Rev\s+([\d.]+)\)", stem, re.IGNORECASE)
+    m = _REV_RE.search(stem)
     if m:
         return m.group(1)
 
     # Match [1.N] where N is a digit
-    m = re.search(r"\[1\.(\d+)\]", stem)
+    m = _BRACKET_VER_RE.search(stem)
     if m:
         return m.group(1)
 
@@ -256,19 +267,7 @@ class NESGamePlugin(GamePlugin):
     @staticmethod
     def _compute_crc32(path: Path, max_size: int = 64 * 1024 * 1024) -> str:
         """Compute CRC32 for the ROM file (skip files > max_size)."""
-        try:
-            if path.stat().st_size > max_size:
-                return ""
-            crc = 0
-            with open(path, "rb") as f:
-                while True:
-                    chunk = f.read(65536)
-                    if not chunk:
-                        break
-                    crc = zlib.crc32(chunk, crc)
-            return f"{crc & 0xFFFFFFFF:08X}"
-        except OSError:
-            return ""
+        return crc32_file(path, max_size)
 
     @staticmethod
     def _match_with_dat_header(
@@ -289,11 +288,10 @@ class NESGamePlugin(GamePlugin):
                 data = f.read()
             if data[:4] != b"NES\x1a":
                 return ""
-            body = data[16:]
+            body = memoryview(data)[16:]
             games = _load_games_db()
             for hdr in headers:
-                crc = zlib.crc32(hdr + body) & 0xFFFFFFFF
-                crc_str = f"{crc:08X}"
+                crc_str = crc32_bytes(hdr, body)
                 if crc_str in games:
                     _fix_nes_header(path, data, hdr)
                     return crc_str
@@ -323,4 +321,5 @@ def _fix_nes_header(path: Path, original_data: bytes, correct_header: bytes) ->
 
     with open(path, "wb") as f:
         f.write(correct_header + original_data[16:])
+    forget_crc32(path)
     logger.info(f"Fixed iNES header: {path.name}")
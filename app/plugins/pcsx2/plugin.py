@@ -7,7 +7,7 @@ from pathlib import Path
 
 from app.models.emulator import EmulatorInfo
 from app.models.game_save import GameSave, SaveFile, SaveType
-from app.plugins.base import EmulatorPlugin
+from app.plugins.base import EmulatorPlugin, ttl_cache
 
 
 class PCSX2Plugin(EmulatorPlugin):
@@ -23,6 +23,7 @@ class PCSX2Plugin(EmulatorPlugin):
     def supported_platforms(self) -> list[str]:
         return ["ps2"]
 
+    @ttl_cache()
     def detect_installation(
         self, extra_paths: list[str] | None = None
     ) -> list[EmulatorInfo]:
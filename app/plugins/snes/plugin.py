@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import zlib
 from pathlib import Path
 
 from typing import Any
@@ -11,6 +10,7 @@ from typing import Any
 from app.models.rom_entry import RomInfo
 from app.plugins.base import GamePlugin
 from app.plugins.snes.parsers import SNESHeaderInfo, parse_snes_header
+from app.utils import crc32_bytes, crc32_file
 
 _games_db: dict[str, dict[str, Any]] | None = None
 _custom_db: dict[str, dict[str, str]] | None = None
@@ -24,12 +24,13 @@ def _load_games_db() -> dict[str, dict[str, Any]]:
         if db_path.exists():
             with open(db_path, encoding="utf-8") as f:
                 raw = json.load(f)
-            _games_db = {}
+            db: dict[str, dict[str, Any]] = {}
             for crc, val in raw.items():
                 if isinstance(val, str):
-                    _games_db[crc] = {"name": val, "id": -1}
+                    db[crc] = {"name": val, "id": -1}
                 else:
-                    _games_db[crc] = {"name": val.get("name", ""), "id": val.get("id", -1)}
+                    db[crc] = {"name": val.get("name", ""), "id": val.get("id", -1)}
+            _games_db = db
         else:
             _games_db = {}
     assert _games_db is not None
@@ -162,19 +163,7 @@ class SNESGamePlugin(GamePlugin):
     @staticmethod
     def _compute_crc32_raw(path: Path, max_size: int = 64 * 1024 * 1024) -> str:
         """Compute CRC32 for the entire file."""
-        try:
-            if path.stat().st_size > max_size:
-                return ""
-            crc = 0
-            with open(path, "rb") as f:
-                while True:
-                    chunk = f.read(65536)
-                    if not chunk:
-                        break
-                    crc = zlib.crc32(chunk, crc)
-            return f"{crc & 0xFFFFFFFF:08X}"
-        except OSError:
-            return ""
+        return crc32_file(path, max_size)
 
     @staticmethod
     def _compute_crc32_pair(
@@ -190,12 +179,14 @@ class SNESGamePlugin(GamePlugin):
             size = path.stat().st_size
             if size > max_size:
                 return ("", "")
-            with open(path, "rb") as f:
-                data = f.read()
-            crc_full = f"{zlib.crc32(data) & 0xFFFFFFFF:08X}"
+            crc_full = crc32_file(path, max_size)
+            if not crc_full:
+                return ("", "")
             has_copier = header.has_copier_header if header else (size % 1024 == 512)
-            if has_copier and len(data) > 512:
-                crc_nocopier = f"{zlib.crc32(data[512:]) & 0xFFFFFFFF:08X}"
+            if has_copier and size > 512:
+                with open(path, "rb") as f:
+                    f.seek(512)
+                    crc_nocopier = crc32_bytes(f.read())
             else:
                 crc_nocopier = crc_full
             return (crc_full, crc_nocopier)
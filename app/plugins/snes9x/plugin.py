@@ -6,7 +6,7 @@ from pathlib import Path
 
 from app.models.emulator import EmulatorInfo
 from app.models.game_save import GameSave, SaveFile, SaveType
-from app.plugins.base import EmulatorPlugin
+from app.plugins.base import EmulatorPlugin, ttl_cache
 
 
 class Snes9xPlugin(EmulatorPlugin):
@@ -22,6 +22,7 @@ class Snes9xPlugin(EmulatorPlugin):
     def supported_platforms(self) -> list[str]:
         return ["snes"]
 
+    @ttl_cache()
     def detect_installation(
         self, extra_paths: list[str] | None = None
     ) -> list[EmulatorInfo]:
@@ -7,7 +7,7 @@ from pathlib import Path
 
 from app.models.emulator import EmulatorInfo
 from app.models.game_save import GameSave, SaveFile, SaveType
-from app.plugins.base import EmulatorPlugin
+from app.plugins.base import EmulatorPlugin, ttl_cache
 
 
 class YuzuPlugin(EmulatorPlugin):
@@ -27,6 +27,7 @@ class YuzuPlugin(EmulatorPlugin):
 
     # ── Detection ──
 
+    @ttl_cache()
     def detect_installation(
         self, extra_paths: list[str] | None = None
     ) -> list[EmulatorInfo]:
@@ -31,6 +31,7 @@ if TYPE_CHECKING:
     from app.models.scrape_result import ScrapeResult
 
 from app.i18n import t
+from app.ui.utils import CRC_PENDING, CrcWorker
 
 
 class RomDetailDialog(MessageBoxBase):
@@ -96,8 +97,16 @@ class RomDetailDialog(MessageBoxBase):
         rom_form.addRow(t("detail.file_size"), self._val_label(self._format_size(entry.file_size)))
         if entry.hash_crc32:
             rom_form.addRow("CRC32:", self._val_label(entry.hash_crc32))
+        elif self._ctx.rom_manager:
+            # Skipped by the scan: hash in the background, not while opening
+            self._crc_label = self._val_label(CRC_PENDING)
+            rom_form.addRow("CRC32:", self._crc_label)
+            worker = CrcWorker(self._ctx.rom_manager, [entry], parent)
+            worker.hashed.connect(self._on_crc_hashed)
+            worker.finished.connect(worker.deleteLater)
+            worker.start()
         if entry.added_at:
-            rom_form.addRow(t("detail.added_time"), self._val_label(entry.added_at[:19].replace("T", " ")))
+            rom_form.addRow(t("detail.added_time"), self._val_label(entry.added_at_iso[:19].replace("T", " ")))
 
         status_text = {"none": t("detail.status_none"), "partial": t("detail.status_partial"), "done": t("detail.status_done")}.get(
             entry.scrape_status, entry.scrape_status
@@ -206,6 +215,9 @@ class RomDetailDialog(MessageBoxBase):
 
         self.viewLayout.addLayout(layout)
 
+    def _on_crc_hashed(self) -> None:
+        self._crc_label.setText(self._entry.hash_crc32 or "-")
+
     def _load_icon(self) -> None:
         """Try to load the game icon from cache."""
         icon_path = self._ctx.icon_provider.get_icon_path(
@@ -341,15 +341,16 @@ class SettingsPage(ScrollArea):
 
     def _save_scraper_config(self) -> None:
         """Persist all scraper credentials to config."""
-        scraper = self._ctx.config.get("scraper", {})
-        scraper["proxy_protocol"] = self._proxy_protocol.currentText()
-        scraper["proxy_host"] = self._proxy_host.text().strip()
-        scraper["proxy_port"] = self._proxy_port.text().strip()
-        scraper["igdb_client_id"] = self._igdb_client_id_card.text
-        scraper["igdb_client_secret"] = self._igdb_client_secret_card.text
-        scraper["screenscraper_dev_id"] = self._ss_dev_id_card.text
-        scraper["screenscraper_dev_password"] = self._ss_dev_password_card.text
-        scraper["screenscraper_username"] = self._ss_username_card.text
-        scraper["screenscraper_password"] = self._ss_password_card.text
-        with self._ctx.config.batch_update():
-            self._ctx.config.set("scraper", scraper)
+        self._ctx.config.set_many(
+            {
+                "scraper.proxy_protocol": self._proxy_protocol.currentText(),
+                "scraper.proxy_host": self._proxy_host.text().strip(),
+                "scraper.proxy_port": self._proxy_port.text().strip(),
+                "scraper.igdb_client_id": self._igdb_client_id_card.text,
+                "scraper.igdb_client_secret": self._igdb_client_secret_card.text,
+                "scraper.screenscraper_dev_id": self._ss_dev_id_card.text,
+                "scraper.screenscraper_dev_password": self._ss_dev_password_card.text,
+                "scraper.screenscraper_username": self._ss_username_card.text,
+                "scraper.screenscraper_password": self._ss_password_card.text,
+            }
+        )
@@ -277,25 +277,29 @@ class RomRenameTab(QWidget):
         if not template or not self._entries:
             return
 
-        for row in range(self._table.rowCount()):
-            cb = self._table.cellWidget(row, 0)
-            if not isinstance(cb, QCheckBox):
-                continue
-
-            if cb.isChecked() and row < len(self._entries):
-                entry = self._entries[row]
-                tokens = self._ctx.rom_manager._build_rename_tokens(entry)
-                new_stem = self._ctx.rename_engine.preview(template, tokens)
-                old_path = Path(entry.rom_path)
-                new_name = new_stem + old_path.suffix if not new_stem.endswith(old_path.suffix) else new_stem
+        needed = self._ctx.rename_engine.referenced_keys(template)
+        render = self._ctx.rename_engine.compile(template)
+        # {crc32} may hash ROMs the scan skipped: persist them in one write
+        with self._ctx.rom_library.batched():
+            for row in range(self._table.rowCount()):
+                cb = self._table.cellWidget(row, 0)
+                if not isinstance(cb, QCheckBox):
+                    continue
 
-                self._table.setItem(row, 2, QTableWidgetItem("→"))
-                new_item = QTableWidgetItem(new_name)
-                new_item.setForeground(QColor("#2ecc71"))
-                self._table.setItem(row, 3, new_item)
-            else:
-                self._table.setItem(row, 2, QTableWidgetItem(""))
-                self._table.setItem(row, 3, QTableWidgetItem(""))
+                if cb.isChecked() and row < len(self._entries):
+                    entry = self._entries[row]
+                    tokens = self._ctx.rom_manager._build_rename_tokens(entry, needed)
+                    new_stem = render(tokens)
+                    old_path = Path(entry.rom_path)
+                    new_name = new_stem + old_path.suffix if not new_stem.endswith(old_path.suffix) else new_stem
+
+                    self._table.setItem(row, 2, QTableWidgetItem("→"))
+                    new_item = QTableWidgetItem(new_name)
+                    new_item.setForeground(QColor("#2ecc71"))
+                    self._table.setItem(row, 3, new_item)
+                else:
+                    self._table.setItem(row, 2, QTableWidgetItem(""))
+                    self._table.setItem(row, 3, QTableWidgetItem(""))
 
     def _on_rename(self) -> None:
         """Execute batch rename / copy for selected entries only."""
@@ -332,7 +336,7 @@ class RomRenameTab(QWidget):
                 try:
                     if mode == "move":
                         shutil.move(str(src), dst)
-                        entry.rom_path = str(dst)
+                        self._ctx.rom_library.update_path(str(src), str(dst))
                     else:
                         shutil.copy2(src, dst)
                     count += 1
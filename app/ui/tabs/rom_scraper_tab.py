@@ -28,7 +28,7 @@ from qfluentwidgets import FluentIcon as FIF
 from pathlib import Path
 
 from app.models.scrape_result import ScrapeResult
-from app.ui.utils import show_success, show_error
+from app.ui.utils import CRC_PENDING, CrcWorker, show_success, show_error
 from app.i18n import t
 
 if TYPE_CHECKING:
@@ -218,6 +218,7 @@ class RomScraperTab(QWidget):
         self._loaded = False
         self._search_results: list[ScrapeResult] = []
         self._search_worker: SearchWorker | None = None
+        self._crc_worker: CrcWorker | None = None
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
@@ -230,6 +231,17 @@ class RomScraperTab(QWidget):
         """Load ROM entries from the library, sorted by dat_id ascending, and refresh the table."""
         self._entries = list(self._ctx.rom_library.all_entries())
         self._entries.sort(key=lambda e: e.rom_info.dat_id if e.rom_info else -1)
+        unhashed = [e for e in self._entries if not e.hash_crc32]
+        if self._ctx.rom_manager and unhashed and self._crc_worker is None:
+            # The CRC32 column verifies against the DAT: hash any ROM the scan
+            # skipped off the GUI thread, and redraw the column when done
+            self._crc_worker = CrcWorker(self._ctx.rom_manager, unhashed, self)
+            self._crc_worker.hashed.connect(self._on_crc_hashed)
+            self._crc_worker.start()
+        self._refresh_rom_table()
+
+    def _on_crc_hashed(self) -> None:
+        self._crc_worker = None
         self._refresh_rom_table()
 
     def _refresh_rom_table(self) -> None:
@@ -251,7 +263,8 @@ class RomScraperTab(QWidget):
             self._rom_table.setItem(row, 3, QTableWidgetItem(entry.display_name))
 
             # CRC32 cell with color coding
-            crc_item = QTableWidgetItem(entry.hash_crc32)
+            pending = not entry.hash_crc32 and self._crc_worker is not None
+            crc_item = QTableWidgetItem(CRC_PENDING if pending else entry.hash_crc32)
             dat_crcs = entry.rom_info.dat_crc32 if entry.rom_info else None
             if entry.hash_crc32 and dat_crcs:
                 if entry.hash_crc32.upper() in [c.upper() for c in dat_crcs]:
@@ -461,23 +474,25 @@ class RomScraperTab(QWidget):
             if result.publisher and not ri.publisher:
                 ri.publisher = result.publisher
 
-            # 2. Download icon/boxart
+            # 2. Download icon/boxart (boxart separately if different from icon)
             icon_url = result.icon_url or result.boxart_url
+            want_boxart = bool(result.boxart_url and result.boxart_url != result.icon_url)
+            downloads: list[tuple[str, str, str]] = []
             if icon_url:
-                icon_path = self._ctx.icon_provider.download_icon(
-                    entry.platform, entry.game_id, icon_url
-                )
-                if icon_path:
-                    ri.icon_path = str(icon_path)
-                    result.icon_local = str(icon_path)
-
-            # Download boxart separately if different from icon
-            if result.boxart_url and result.boxart_url != result.icon_url:
-                boxart_path = self._ctx.icon_provider.download_icon(
-                    entry.platform, f"{entry.game_id}_boxart", result.boxart_url
+                downloads.append((entry.platform, entry.game_id, icon_url))
+            if want_boxart:
+                downloads.append(
+                    (entry.platform, f"{entry.game_id}_boxart", result.boxart_url)
                 )
-                if boxart_path:
-                    result.boxart_local = str(boxart_path)
+            paths = self._ctx.icon_provider.download_icons(downloads)
+
+            icon_path = paths[0] if icon_url else None
+            if icon_path:
+                ri.icon_path = str(icon_path)
+                result.icon_local = str(icon_path)
+            boxart_path = paths[-1] if want_boxart else None
+            if boxart_path:
+                result.boxart_local = str(boxart_path)
 
             # 3. Save scrape result to cache
             self._ctx.scrape_cache.save_result(result)
@@ -67,9 +67,9 @@ class RomToolsTab(QWidget):
         layout.addStretch(1)
 
     def _on_find_duplicates(self) -> None:
-        if not self._ctx.rom_library:
+        if not self._ctx.rom_manager:
             return
-        dups = self._ctx.rom_library.find_duplicates()
+        dups = self._ctx.rom_manager.find_duplicates()
         show_info(self, t("tools.dup_result"), t("tools.dup_result_msg", count=len(dups)))
 
     def _on_verify(self) -> None:
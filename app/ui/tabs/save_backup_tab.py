@@ -109,8 +109,12 @@ class SaveBackupTab(QWidget):
         """Refresh save list from scanner in a background thread."""
         if not self._ctx.scanner:
             return
+        from app.plugins.base import EmulatorPlugin
         from app.ui.tabs.save_library_tab import SaveScanWorker
 
+        # Explicit refresh: re-probe installation paths too
+        EmulatorPlugin.invalidate_cache()
+
         self._refresh_worker = SaveScanWorker(self._ctx, self)
         self._refresh_worker.finished.connect(self._on_refresh_finished)
         self._refresh_worker.start()
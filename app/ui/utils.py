@@ -2,9 +2,36 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QObject, QThread, Signal
 from PySide6.QtWidgets import QWidget
 from qfluentwidgets import InfoBar, InfoBarPosition
 
+if TYPE_CHECKING:
+    from app.core.rom_manager import RomManager
+    from app.models.rom_entry import RomEntry
+
+# Shown in place of a CRC32 that CrcWorker is still computing
+CRC_PENDING = "…"
+
+
+class CrcWorker(QThread):
+    """Background worker filling in CRC32s the ROM scan skipped (``eager_crc32`` off)."""
+
+    hashed = Signal()
+
+    def __init__(
+        self, rom_manager: RomManager, entries: list[RomEntry], parent: QObject | None = None
+    ) -> None:
+        super().__init__(parent)
+        self._rom_manager = rom_manager
+        self._entries = entries
+
+    def run(self) -> None:
+        self._rom_manager.ensure_crc32_many(self._entries)
+        self.hashed.emit()
+
 
 def show_success(parent: QWidget, title: str, content: str = "") -> None:
     """Show a success InfoBar."""
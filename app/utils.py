@@ -2,13 +2,45 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+import hashlib
+import json
+import mmap
 import os
 import platform
+import re
 import subprocess
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any
+
+try:  # Optional C-accelerated JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:  # Optional ISA-L CRC32 (PCLMULQDQ folding), same results as zlib.crc32
+    from isal.isal_zlib import crc32 as _crc32
+except ImportError:  # pragma: no cover - depends on environment
+    from zlib import crc32 as _crc32
+
+# madvise() hint for one front-to-back pass; absent on Windows
+_MADV_SEQUENTIAL: int | None = getattr(mmap, "MADV_SEQUENTIAL", None)
+# Whole files above this are digested through mmap (one C call, no copies)
+_MMAP_DIGEST_MIN = 64 * 1024 * 1024
 
 ILLEGAL_FILENAME_CHARS = '<>:"/\\|?*'
 
+# Anything sanitize_filename would change: illegal chars, line breaks,
+# doubled spaces/underscores, or leading/trailing whitespace and dots
+_NEEDS_SANITIZE = re.compile(
+    "[" + re.escape(ILLEGAL_FILENAME_CHARS) + r"\r\n]|  |__|^[\s.]|[\s.]$"
+)
+
 
 def format_size(size_bytes: int) -> str:
     """Format byte count to human-readable string."""
@@ -38,6 +70,8 @@ def open_folder(path: str | Path) -> None:
 
 def sanitize_filename(name: str) -> str:
     """Remove or replace illegal filename characters."""
+    if not _NEEDS_SANITIZE.search(name):
+        return name
     for ch in ILLEGAL_FILENAME_CHARS:
         name = name.replace(ch, "_")
     name = name.replace("\n", " ").replace("\r", "").strip()
@@ -47,3 +81,217 @@ def sanitize_filename(name: str) -> str:
     while "__" in name:
         name = name.replace("__", "_")
     return name.strip(". ")
+
+
+def dir_size(path: str | os.PathLike[str]) -> int:
+    """Total size in bytes of the regular files below *path* (0 if unreadable).
+
+    Walks with ``os.scandir`` so directory/file checks come from the listing;
+    symlinked directories are not descended into.
+    """
+    total = 0
+    pending = [os.fspath(path)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def scan_files(path: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """Regular files directly in *path* as scandir entries; nothing if it is missing.
+
+    ``entry.stat()`` reuses the listing where the OS provides it, so scanners
+    get sizes without a second lookup per file.
+    """
+    try:
+        with os.scandir(path) as it:
+            yield from (entry for entry in it if entry.is_file())
+    except OSError:
+        return
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Crash-safe write: unique temp file in the same dir, fsync, rename, fsync dir.
+
+    Raises ``OSError`` on failure; the temp file is removed in that case.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Persist the rename itself — directories can't be opened on Windows
+    if os.name != "nt":
+        dir_fd = os.open(path.parent, os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def json_dumps_bytes(data: Any) -> bytes:  # noqa: ANN401
+    """Serialize *data* to 2-space indented UTF-8 JSON (via ``orjson`` when installed)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def json_loads(raw: bytes | str) -> Any:  # noqa: ANN401
+    """Parse JSON text or UTF-8 bytes; raises ``json.JSONDecodeError`` on bad input."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
+def shallow_asdict(obj: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Dataclass fields as a dict, one level deep (works with ``slots=True``).
+
+    Unlike :func:`dataclasses.asdict` nothing is deep-copied: nested
+    dataclasses, lists and dicts are the instance's own objects.
+    """
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+
+def crc32_bytes(*chunks: bytes | memoryview) -> str:
+    """CRC32 of in-memory buffers, as if concatenated, as 8 uppercase hex digits.
+
+    Each chunk is hashed in one call, so ``crc32_bytes(header, body)`` costs
+    no ``header + body`` copy.
+    """
+    crc = 0
+    for chunk in chunks:
+        crc = _crc32(chunk, crc)
+    return f"{crc & 0xFFFFFFFF:08X}"
+
+
+# (path) → (size, crc) for the innermost crc32_memo() block, if any.
+_crc_memo: ContextVar[dict[str, tuple[int, str]] | None] = ContextVar("_crc_memo", default=None)
+
+
+@contextmanager
+def crc32_memo() -> Iterator[None]:
+    """Hash each file at most once inside this block.
+
+    Lets a caller and the plugins it invokes share one CRC pass over a ROM.
+    The memo is context-local, so worker threads never see each other's
+    entries.  Code that rewrites a file inside the block must call
+    :func:`forget_crc32` for it.
+    """
+    token = _crc_memo.set({})
+    try:
+        yield
+    finally:
+        _crc_memo.reset(token)
+
+
+def prime_crc32(path: Path, size: int, crc: str) -> None:
+    """Seed the active :func:`crc32_memo` with an already-known CRC for *path*."""
+    memo = _crc_memo.get()
+    if memo is not None:
+        memo[os.fspath(path)] = (size, crc)
+
+
+def memoized_crc32(path: Path) -> str | None:
+    """CRC for *path* already in the active :func:`crc32_memo`, without hashing."""
+    memo = _crc_memo.get()
+    if memo is None:
+        return None
+    hit = memo.get(os.fspath(path))
+    return hit[1] if hit is not None else None
+
+
+def forget_crc32(path: Path) -> None:
+    """Drop *path* from the active :func:`crc32_memo`, if any."""
+    memo = _crc_memo.get()
+    if memo is not None:
+        memo.pop(os.fspath(path), None)
+
+
+def crc32_file(path: Path, max_size: int | None = None) -> str:
+    """CRC32 of a whole file as 8 uppercase hex digits.
+
+    The file is memory-mapped and hashed in a single call.  Returns ``""`` if
+    the file is larger than *max_size* or cannot be read.
+    """
+    memo = _crc_memo.get()
+    key = os.fspath(path)
+    if memo is not None and key in memo:
+        size, crc_str = memo[key]
+        return "" if max_size is not None and size > max_size else crc_str
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if max_size is not None and size > max_size:
+                return ""
+            crc_str = crc32_fd(f.fileno(), size)
+    except (OSError, ValueError):
+        return ""
+    if memo is not None:
+        memo[key] = (size, crc_str)
+    return crc_str
+
+
+def crc32_fd(fd: int, size: int) -> str:
+    """CRC32 of the *size*-byte file open as *fd*, as 8 uppercase hex digits.
+
+    For callers that already hold the file open (e.g. to read a header);
+    the whole file is memory-mapped regardless of the current position.
+    Raises ``OSError``/``ValueError`` if it cannot be mapped.
+    """
+    if size == 0:
+        crc = _crc32(b"")
+    else:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            if _MADV_SEQUENTIAL is not None:  # widen kernel read-ahead
+                mm.madvise(_MADV_SEQUENTIAL)
+            crc = _crc32(mm)
+    return f"{crc & 0xFFFFFFFF:08X}"
+
+
+def sha256_file(path: Path, max_bytes: int | None = None) -> str:
+    """SHA-256 hex digest of *path*, or of only its first *max_bytes*.
+
+    Large files and prefixes are hashed straight from a memory map; small
+    whole files, and files that cannot be mapped (some network
+    filesystems), go through ``hashlib.file_digest``'s C read loop.
+    """
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        length = size if max_bytes is None else min(size, max_bytes)
+        if length < size or size > _MMAP_DIGEST_MIN:
+            try:
+                with (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                    memoryview(mm) as view,
+                ):
+                    if _MADV_SEQUENTIAL is not None:  # widen kernel read-ahead
+                        mm.madvise(_MADV_SEQUENTIAL, 0, length)
+                    return hashlib.sha256(view[:length]).hexdigest()
+            except (OSError, ValueError):
+                pass  # cannot be mapped: read instead
+        if length == size:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while length and (chunk := f.read(min(length, 1024 * 1024))):
+            digest.update(chunk)
+            length -= len(chunk)
+        return digest.hexdigest()
@@ -39,7 +39,8 @@ def create_context() -> AppContext:
     # Core services
     scanner = Scanner(plugin_manager, config)
     backup_manager = BackupManager(config)
-    restore_manager = RestoreManager()
+    restore_manager = RestoreManager(config.data_dir / "restore_staging")
+    restore_manager.cleanup_staging()
     sync_manager = SyncManager(config, backup_manager)
     icon_provider = GameIconProvider(config.data_dir / "icons")
 
@@ -105,6 +106,7 @@ def main() -> int:
 
     # Wire services
     ctx = create_context()
+    app.aboutToQuit.connect(ctx.icon_provider.close)
 
     # Initialize i18n from config
     set_language(ctx.config.get("language", "zh_CN"))
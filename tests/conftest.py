@@ -0,0 +1,39 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import Callable
+
+import pytest
+
+
+@pytest.fixture
+def spy(monkeypatch: pytest.MonkeyPatch) -> Callable[..., list]:
+    """Patch ``target.name`` to record each call, then call through.
+
+    ``calls = spy(SyncManager, "_file_hash")`` returns the list the calls are
+    appended to: their positional args, or ``record(*args, **kwargs)`` when a
+    *record* callable is given (e.g. to keep ``len(data)`` of a buffer that
+    is gone once the call returns).  Methods patched on a class see ``self``
+    as their first argument; static methods stay static.
+    """
+
+    def install(
+        target: object, name: str, record: Callable[..., object] | None = None
+    ) -> list:
+        calls: list = []
+        raw = inspect.getattr_static(target, name)
+        static = isinstance(raw, staticmethod)
+        real = raw.__func__ if static else raw
+
+        @functools.wraps(real)
+        def recording(*args: object, **kwargs: object) -> object:
+            calls.append(args if record is None else record(*args, **kwargs))
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(target, name, staticmethod(recording) if static else recording)
+        return calls
+
+    return install
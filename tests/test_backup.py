@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import tempfile
+import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -59,8 +60,6 @@ class TestBackupCreation:
         assert Path(record.meta_path).exists()
 
     def test_zip_contains_save_file(self, manager: BackupManager, sample_save: GameSave) -> None:
-        import zipfile
-
         record = manager.create_backup(sample_save)
         with zipfile.ZipFile(record.zip_path) as zf:
             names = zf.namelist()
@@ -73,12 +72,42 @@ class TestBackupCreation:
         assert meta["game_name"] == "Test Game"
         assert meta["emulator"] == "test_emu"
 
+    def test_zip_contains_folder_save(self, manager: BackupManager, tmp_path: Path) -> None:
+        save_dir = tmp_path / "folder_save"
+        save_dir.mkdir()
+        for i in range(20):
+            (save_dir / f"slot{i}.bin").write_bytes(bytes([i]) * 100)
+        game_save = GameSave(
+            game_id="GAME002",
+            game_name="Folder Game",
+            emulator="test_emu",
+            platform="switch",
+            files=[SaveFile(path=str(save_dir), save_type=SaveType.FOLDER)],
+        )
+
+        record = manager.create_backup(game_save)
+        with zipfile.ZipFile(record.zip_path) as zf:
+            assert zf.read("folder/folder_save/slot7.bin") == bytes([7]) * 100
+            assert len(zf.namelist()) == 20
+
 
 class TestBackupListing:
     def test_list_empty(self, manager: BackupManager) -> None:
         result = manager.list_backups("nonexistent", "game1")
         assert result == []
 
+    def test_list_does_not_create_dirs(
+        self, manager: BackupManager, tmp_config: MagicMock
+    ) -> None:
+        manager.list_backups("nonexistent", "game1")
+        assert not (tmp_config.backup_path / "nonexistent").exists()
+
+    def test_list_all_after_backup(self, manager: BackupManager, sample_save: GameSave) -> None:
+        manager.create_backup(sample_save)
+        result = manager.list_all_backups()
+        assert list(result) == ["test_emu"]
+        assert result["test_emu"]["GAME001"][0].game_name == "Test Game"
+
     def test_list_after_backup(self, manager: BackupManager, sample_save: GameSave) -> None:
         manager.create_backup(sample_save)
         result = manager.list_backups("test_emu", "GAME001")
@@ -94,3 +123,32 @@ class TestBackupListing:
         # Newest first, version numbers: oldest=1, newest=3
         assert result[0].version == 3
         assert result[2].version == 1
+
+
+class TestPinning:
+    def test_pinned_backup_listed_as_pinned(
+        self, manager: BackupManager, sample_save: GameSave
+    ) -> None:
+        record = manager.create_backup(sample_save)
+        manager.pin_backup(record, "before boss")
+        (listed,) = manager.list_backups("test_emu", "GAME001")
+        assert listed.is_pinned
+        assert listed.pin_label == "before boss"
+
+
+class TestRotation:
+    def test_rotates_beyond_limit(
+        self, manager: BackupManager, sample_save: GameSave, tmp_config: MagicMock
+    ) -> None:
+        tmp_config.max_backups = 2
+        backup_dir = tmp_config.backup_path / "test_emu" / "GAME001"
+        backup_dir.mkdir(parents=True)
+        for stamp in ("2020-01-01_00-00-00", "2020-01-02_00-00-00"):
+            (backup_dir / f"{stamp}.zip").write_bytes(b"")
+            (backup_dir / f"{stamp}.json").write_text("{}", encoding="utf-8")
+
+        manager.create_backup(sample_save)
+
+        remaining = sorted(p.name for p in backup_dir.glob("*.json"))
+        assert len(remaining) == 2
+        assert "2020-01-01_00-00-00.json" not in remaining
@@ -0,0 +1,30 @@
+"""Tests for the Citra emulator plugin."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.models.emulator import EmulatorInfo
+from app.plugins.citra.plugin import CitraPlugin
+
+
+def _save(root: Path, high: str, low: str, size: int) -> Path:
+    data_dir = root / "title" / high / low / "data" / "00000001"
+    (data_dir / "sub").mkdir(parents=True)
+    (data_dir / "main").write_bytes(b"\0" * size)
+    (data_dir / "sub" / "extra").write_bytes(b"\0" * 2)
+    return data_dir
+
+
+def test_scan_saves_walks_title_tree(tmp_path: Path) -> None:
+    ids = tmp_path / "sdmc" / "Nintendo 3DS" / ("0" * 32) / ("1" * 32)
+    data_dir = _save(ids, "00040000", "00055d00", 10)
+    _save(ids, "00040000", "not-hex!", 1)
+    (ids / "title" / "00040000" / "00066e00").mkdir()  # no data dir
+
+    emulator = EmulatorInfo(name="Citra", install_path=tmp_path, data_path=tmp_path)
+    saves = CitraPlugin().scan_saves(emulator)
+
+    assert [(s.game_id, s.files[0].path, s.files[0].size) for s in saves] == [
+        ("0004000000055D00", data_dir, 12)
+    ]
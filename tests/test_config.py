@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from app import config as config_module
 from app.config import Config, reset_config
 
 
@@ -44,3 +46,44 @@ class TestConfig:
         with config.batch_update():
             config.set("rom_directories", ["/roms/switch", "/roms/ps2"])
         assert len(config.rom_directories) == 2
+
+
+class TestSetMany:
+    def test_single_write(self, tmp_path: Path, spy: Callable[..., list]) -> None:
+        cfg = Config(config_dir=tmp_path)
+        writes = spy(config_module, "atomic_write_bytes")
+        cfg.set_many({"scraper.proxy_host": "127.0.0.1", "scraper.proxy_port": "8080"})
+
+        assert len(writes) == 1
+        reloaded = Config(config_dir=tmp_path)
+        assert reloaded.get("scraper.proxy_host") == "127.0.0.1"
+        assert reloaded.get("scraper.proxy_port") == "8080"
+
+    def test_nested_batches_write_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cfg = Config(config_dir=tmp_path)
+        writes: list[Path] = []
+        monkeypatch.setattr(config_module, "atomic_write_bytes", lambda p, d: writes.append(p))
+        with cfg.batch_update():
+            cfg.set("theme", "dark")
+            with cfg.batch_update():
+                cfg.set("language", "en_US")
+            assert writes == []
+        assert len(writes) == 1
+
+
+class TestSnapshot:
+    def test_set_does_not_mutate_previous_snapshot(self, tmp_path: Path) -> None:
+        cfg = Config(config_dir=tmp_path)
+        before = cfg.scraper_config
+        cfg.set("scraper.proxy_host", "10.0.0.1")
+        assert before.get("proxy_host") == ""
+        assert cfg.scraper_config["proxy_host"] == "10.0.0.1"
+
+    def test_typed_view_follows_writes(self, tmp_path: Path) -> None:
+        cfg = Config(config_dir=tmp_path)
+        assert cfg.backup_path is None
+        cfg.backup_path = tmp_path / "backups"
+        assert cfg.backup_path == tmp_path / "backups"
+        assert cfg.artwork_dir == tmp_path / "artwork"
@@ -0,0 +1,119 @@
+"""Tests for the GBA header parser and game plugin."""
+
+from __future__ import annotations
+
+import builtins
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from app.plugins import base
+from app.plugins.gba import parsers
+from app.plugins.gba import plugin as gba_plugin
+from app.plugins.gba.parsers import parse_gba_header
+from app.utils import crc32_bytes, crc32_memo, memoized_crc32
+
+
+def _rom(path: Path, title: bytes = b"POKEMON RUBY", code: bytes = b"AXVE") -> Path:
+    header = bytearray(0xC0)
+    header[0xA0:0xAC] = title.ljust(12, b"\0")
+    header[0xAC:0xB0] = code
+    header[0xB0:0xB2] = b"01"
+    header[0xB2] = 0x96
+    header[0xBD] = (-(sum(header[0xA0:0xBD]) + 0x19)) & 0xFF
+    path.write_bytes(bytes(header))
+    return path
+
+
+def test_header_is_read_once_until_the_file_changes(
+    tmp_path: Path, spy: Callable[..., list]
+) -> None:
+    reads = spy(parsers, "_read_gba_header", lambda path: path.name)
+    rom = _rom(tmp_path / "ruby.gba")
+
+    first = parse_gba_header(rom)
+    assert parse_gba_header(rom) is first
+    assert first.full_game_id == "AGB-AXVE"
+    assert first.valid_checksum
+    assert reads == ["ruby.gba"]
+
+    _rom(rom, code=b"AXPE")
+    st = rom.stat()
+    os.utime(rom, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert parse_gba_header(rom).game_code == "AXPE"
+    assert reads == ["ruby.gba"] * 2
+
+
+def test_short_or_missing_file_is_not_a_header(tmp_path: Path) -> None:
+    short = tmp_path / "short.gba"
+    short.write_bytes(b"\0" * 0x10)
+    assert parse_gba_header(short) is None
+    assert parse_gba_header(tmp_path / "missing.gba") is None
+
+
+def test_display_names_are_flattened_and_loaded_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    names = {
+        "AGB-AXVE": {"en_US": "Pokemon Ruby", "zh_CN": ""},
+        "AGB-BPEE": {"ja_JP": "ポケモン エメラルド"},
+        "AGB-NONE": {},
+    }
+    (tmp_path / "gba").mkdir()
+    (tmp_path / "gba" / "game_names.json").write_text(json.dumps(names), encoding="utf-8")
+    monkeypatch.setattr(base, "__file__", str(tmp_path / "base.py"))
+    plugin = gba_plugin.GBAGamePlugin()
+
+    assert plugin.resolve_game_name("AGB-AXVE") == "Pokemon Ruby"
+    (tmp_path / "gba" / "game_names.json").unlink()
+    assert plugin.resolve_game_name("AGB-BPEE") == "ポケモン エメラルド"
+    assert plugin.resolve_game_name("AGB-NONE") is None
+
+
+def test_custom_db_overrides_official_in_one_lookup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ruby = _rom(tmp_path / "ruby.gba")
+    emerald = _rom(tmp_path / "emerald.gba", b"POKEMON EMER", b"BPEE")
+    ruby_crc, emerald_crc = crc32_bytes(ruby.read_bytes()), crc32_bytes(emerald.read_bytes())
+    official = {ruby_crc: {"name": "Pokemon Ruby", "id": 7}, emerald_crc: "Pokemon Emerald"}
+    custom = {ruby_crc: {"name": "Ruby (Translated)", "region": "CHN"}}
+    (tmp_path / "games.json").write_text(json.dumps(official), encoding="utf-8")
+    (tmp_path / "games_custom.json").write_text(json.dumps(custom), encoding="utf-8")
+    monkeypatch.setattr(gba_plugin, "_DB_DIR", tmp_path)
+    gba_plugin._crc_db.cache_clear()
+    try:
+        plugin = gba_plugin.GBAGamePlugin()
+        ruby_info = plugin.parse_rom_info(ruby)
+        emerald_info = plugin.parse_rom_info(emerald)
+    finally:
+        gba_plugin._crc_db.cache_clear()
+
+    assert (ruby_info.title_name, ruby_info.region, ruby_info.dat_id) == (
+        "Ruby (Translated)", "CHN", -1
+    )
+    assert ruby_info.dat_crc32 == [ruby_crc]
+    assert (emerald_info.title_name, emerald_info.dat_crc32) == ("Pokemon Emerald", [emerald_crc])
+
+
+def test_scan_opens_each_rom_once_for_header_and_crc(
+    tmp_path: Path, spy: Callable[..., list]
+) -> None:
+    rom = _rom(tmp_path / "ruby.gba")
+    with rom.open("ab") as f:
+        f.write(b"\xff" * 4096)
+    gba_plugin._crc_db()  # the name DB is loaded once per process, not per ROM
+    opened = spy(builtins, "open", lambda file, *_, **__: Path(file).name)
+    plugin = gba_plugin.GBAGamePlugin()
+
+    with crc32_memo():  # as RomManager does per ROM
+        info = plugin.parse_rom_info(rom)
+        game_id = plugin.extract_game_id(rom)
+        crc = memoized_crc32(rom)
+
+    assert opened == ["ruby.gba"]
+    assert (info.title_name, game_id) == ("POKEMON RUBY", "AGB-AXVE")
+    assert crc == crc32_bytes(rom.read_bytes())
@@ -0,0 +1,35 @@
+"""Tests for the i18n lookup helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from app import i18n
+
+
+@pytest.fixture(autouse=True)
+def _tables(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(i18n, "_cache", {
+        "zh_CN": {"hello": "你好 {name}", "only_zh": "仅中文"},
+        "en_US": {"hello": "Hello {name}", "with_key": "{key}!"},
+    })
+    monkeypatch.setattr(i18n, "_merged", {})
+    yield
+    i18n.set_language("zh_CN")
+
+
+def test_missing_keys_fall_back_to_zh_cn_then_key() -> None:
+    i18n.set_language("en_US")
+
+    assert i18n.t("hello", name="Ann") == "Hello Ann"
+    assert i18n.t("only_zh") == "仅中文"
+    assert i18n.t("nope") == "nope"
+
+
+def test_key_is_usable_as_placeholder_and_bad_format_is_ignored() -> None:
+    i18n.set_language("en_US")
+
+    assert i18n.t("with_key", key="k") == "k!"
+    assert i18n.t("hello", other=1) == "Hello {name}"
@@ -0,0 +1,36 @@
+"""Tests for the Mesen emulator plugin."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.plugins.base import EmulatorPlugin
+from app.plugins.mesen.plugin import MesenPlugin
+
+
+def test_detection_is_reused_until_invalidated(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(Path, "home", staticmethod(lambda: tmp_path))
+    (tmp_path / "Documents" / "Mesen2").mkdir(parents=True)
+    extra = tmp_path / "portable"
+    MesenPlugin.invalidate_cache()
+    plugin = MesenPlugin()
+
+    try:
+        assert len(plugin.detect_installation()) == 1
+        (tmp_path / "Documents" / "Mesen2").rmdir()
+        found = plugin.detect_installation()
+        assert [i.data_path.name for i in found] == ["Mesen2"]
+        found.clear()  # callers get their own list
+        assert len(plugin.detect_installation()) == 1
+
+        extra.mkdir()  # different extra paths are a different entry
+        assert len(plugin.detect_installation([str(extra)])) == 1
+
+        EmulatorPlugin.invalidate_cache()
+        assert plugin.detect_installation() == []
+    finally:
+        EmulatorPlugin.invalidate_cache()
@@ -0,0 +1,36 @@
+"""Tests for the mGBA emulator plugin."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.models.emulator import EmulatorInfo
+from app.models.game_save import GameSave, SaveType
+from app.plugins.mgba.plugin import MGBAPlugin
+
+
+def test_battery_saves_and_states_are_found_by_name(tmp_path: Path) -> None:
+    (tmp_path / "saves").mkdir()
+    (tmp_path / "saves" / "Ruby.sav").write_bytes(b"x" * 128)
+    (tmp_path / "saves" / "notes.txt").write_text("-")
+    (tmp_path / "saves" / "dir.sav").mkdir()
+    emulator = EmulatorInfo(name="mGBA", install_path=tmp_path, data_path=tmp_path)
+
+    saves = MGBAPlugin().scan_saves(emulator)
+
+    assert [(s.game_id, s.files[0].save_type, s.total_size) for s in saves] == [
+        ("Ruby", SaveType.BATTERY, 128)
+    ]
+
+    for name in ("Ruby.ss0", "Ruby.ss1", "Ruby.ssx", "Emerald.SS2"):
+        (tmp_path / name).write_bytes(b"s" * 4)
+    states: list[GameSave] = []
+    MGBAPlugin()._scan_save_states(tmp_path, states)
+
+    grouped = {s.game_id: sorted(f.path.name for f in s.files) for s in states}
+    assert grouped == {"Ruby": ["Ruby.ss0", "Ruby.ss1"], "Emerald": ["Emerald.SS2"]}
+
+
+def test_scan_tolerates_missing_folders(tmp_path: Path) -> None:
+    emulator = EmulatorInfo(name="mGBA", install_path=tmp_path, data_path=tmp_path)
+    assert MGBAPlugin().scan_saves(emulator, [str(tmp_path / "gone")]) == []
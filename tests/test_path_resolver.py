@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from app.core.path_resolver import from_portable_path, to_portable_path
+from app.core.path_resolver import from_portable_path, invalidate_cache, to_portable_path
 
 
 class TestPortablePaths:
@@ -30,3 +30,14 @@ class TestPortablePaths:
     def test_from_portable_unknown(self) -> None:
         result = from_portable_path("C:\\absolute\\path")
         assert isinstance(result, Path)
+
+    def test_invalidate_cache_picks_up_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+        invalidate_cache()
+        try:
+            assert from_portable_path("${LOCALAPPDATA}/x.sav") == tmp_path / "x.sav"
+        finally:
+            monkeypatch.undo()
+            invalidate_cache()
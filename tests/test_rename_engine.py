@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from app.core.rename_engine import RenameEngine
+from app.core.rename_engine import RenameEngine, _compile_template, _Cond, _Fallback, _Literal
 
 
 @pytest.fixture
@@ -86,3 +86,27 @@ class TestConflictDetection:
         conflicts = engine.detect_conflicts("{title_en}", tokens_list)
         assert "Same" in conflicts
         assert len(conflicts["Same"]) == 2
+
+
+class TestCompiledTemplate:
+    def test_fallback_keys_split_at_compile_time(self) -> None:
+        assert _compile_template("{title_zh|title_en}") == (_Fallback(("title_zh", "title_en")),)
+
+    def test_conditional_body_compiled_once(self) -> None:
+        (op,) = _compile_template("{?version:v{version|build}}")
+        assert op == _Cond("version", (_Literal("v"), _Fallback(("version", "build"))))
+
+    def test_unbalanced_brace_is_literal(self, engine: RenameEngine) -> None:
+        assert engine.preview("{title_en} {oops", {"title_en": "Zelda"}) == "Zelda {oops"
+
+    def test_referenced_keys_include_conditional_bodies(self) -> None:
+        template = "{title_zh|title_en} {?version:v{version|build}} {seq:3}"
+        keys = RenameEngine.referenced_keys(template)
+        assert keys == {"title_zh", "title_en", "version", "build"}
+
+    def test_compiled_template_matches_preview(self, engine: RenameEngine) -> None:
+        template = "{title_zh|title_en} {?version:v{version}} {seq:2}"
+        ctx = {"title_en": "Zelda: Link", "version": "1.1"}
+        render = engine.compile(template)
+        assert render(ctx) == engine.preview(template, ctx)
+        assert render(ctx, 7) == engine.preview(template, ctx, 7)
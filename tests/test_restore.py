@@ -0,0 +1,165 @@
+"""Tests for the RestoreManager."""
+
+from __future__ import annotations
+
+import errno
+import json
+import os
+import stat
+import zipfile
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from app.core.restore import RestoreManager
+from app.models.backup_record import BackupRecord
+
+
+def _make_backup(tmp_path: Path, files: dict[str, bytes], dest_dir: Path) -> BackupRecord:
+    zip_path = tmp_path / "backup.zip"
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in files.items():
+            zf.writestr(f"file/saves/{name}", data)
+    meta_path = tmp_path / "backup.json"
+    meta_path.write_text(
+        json.dumps({
+            "backup_paths": [
+                {"source": str(dest_dir), "zip_path": "file/saves", "is_dir": True}
+            ]
+        }),
+        encoding="utf-8",
+    )
+    return BackupRecord(
+        zip_path=str(zip_path),
+        meta_path=str(meta_path),
+        emulator="test",
+        game_id="game",
+        created_at=datetime.now(tz=UTC),
+    )
+
+
+def _created_ns(record: BackupRecord) -> int:
+    created = record.created_at
+    return int(created.timestamp()) * 1_000_000_000 + created.microsecond * 1_000
+
+
+class TestRestoreBackup:
+    @pytest.mark.parametrize("count", [3, 40])
+    def test_restores_directory_tree(
+        self, tmp_path: Path, count: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(RestoreManager, "_EXTRACT_WORKERS", 4)
+        files = {f"slot{i}/data{i}.sav": bytes([i]) * (i + 1) for i in range(count)}
+        dest = tmp_path / "restored" / "saves"
+        record = _make_backup(tmp_path, files, dest)
+
+        result = RestoreManager().restore_backup(record, force=True)
+
+        assert result.success, result.error
+        for name, data in files.items():
+            assert (dest / name).read_bytes() == data
+
+    def test_corrupt_zip_reports_error(self, tmp_path: Path) -> None:
+        dest = tmp_path / "restored"
+        record = _make_backup(tmp_path, {"a.sav": b"x"}, dest)
+        Path(record.zip_path).write_bytes(b"not a zip")
+
+        result = RestoreManager().restore_backup(record, force=True)
+
+        assert not result.success
+        assert "Corrupt" in result.error
+
+    def test_stages_in_app_dir_not_save_folder(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        dest = tmp_path / "restored" / "saves"
+        staging = tmp_path / "app" / "restore_staging"
+        manager = RestoreManager(staging)
+        assert manager._staging_dir([dest]) == str(staging)
+        assert manager._staging_dir([]) is None
+        assert RestoreManager()._staging_dir([dest]) is None
+
+        real_stat = os.stat
+
+        def other_volume(path: str | Path, **kwargs: bool) -> os.stat_result:
+            st = list(real_stat(path, **kwargs))
+            if Path(path) == staging:
+                st[stat.ST_DEV] += 1
+            return os.stat_result(st)
+
+        monkeypatch.setattr(os, "stat", other_volume)
+        assert manager._staging_dir([dest]) is None  # falls back to the system temp dir
+
+    def test_restore_leaves_no_staging_behind(self, tmp_path: Path) -> None:
+        dest = tmp_path / "restored" / "saves"
+        staging = tmp_path / "app" / "restore_staging"
+        record = _make_backup(tmp_path, {"a.sav": b"x"}, dest)
+        (staging / ".emu_restore_crashed" / "file").mkdir(parents=True)
+        manager = RestoreManager(staging)
+
+        manager.cleanup_staging()
+        assert manager.restore_backup(record, force=True).success
+        assert (dest / "a.sav").read_bytes() == b"x"
+        assert list(staging.iterdir()) == []
+        assert [p.name for p in (tmp_path / "restored").iterdir()] == ["saves"]
+
+
+class TestMoveIntoPlace:
+    def test_replaces_existing_file(self, tmp_path: Path) -> None:
+        src = tmp_path / "new.sav"
+        src.write_bytes(b"new")
+        dest = tmp_path / "game.sav"
+        dest.write_bytes(b"old")
+
+        RestoreManager._move_into_place(src, dest, is_dir=False)
+
+        assert dest.read_bytes() == b"new"
+        assert not src.exists()
+
+    def test_falls_back_to_copy_across_filesystems(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def cross_device(*_args: object) -> None:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "replace", cross_device)
+        monkeypatch.setattr(os, "rename", cross_device)
+        src_dir = tmp_path / "extracted"
+        (src_dir / "sub").mkdir(parents=True)
+        (src_dir / "sub" / "a.sav").write_bytes(b"a")
+        dest_dir = tmp_path / "dest"
+        (dest_dir / "stale").mkdir(parents=True)
+
+        RestoreManager._move_into_place(src_dir, dest_dir, is_dir=True)
+
+        assert (dest_dir / "sub" / "a.sav").read_bytes() == b"a"
+        assert not (dest_dir / "stale").exists()
+
+
+class TestPreviewRestore:
+    def test_flags_existing_and_newer_local_files(self, tmp_path: Path) -> None:
+        dest = tmp_path / "saves"
+        record = _make_backup(tmp_path, {"a.sav": b"x"}, dest)
+        assert RestoreManager().preview_restore(record)[0].exists_locally is False
+
+        dest.write_bytes(b"local")
+        future = record.created_at.timestamp() + 60
+        os.utime(dest, (future, future))
+        change = RestoreManager().preview_restore(record)[0]
+        assert change.exists_locally
+        assert change.is_newer_locally
+        assert change.local_modified == os.stat(dest).st_mtime_ns
+        assert change.backup_modified == _created_ns(record)
+
+    def test_sub_second_newer_local_file_is_skipped(self, tmp_path: Path) -> None:
+        dest = tmp_path / "saves"
+        record = _make_backup(tmp_path, {"a.sav": b"x"}, dest)
+        dest.write_bytes(b"local")
+        backup_ns = _created_ns(record)
+        os.utime(dest, ns=(backup_ns + 1, backup_ns + 1))
+
+        result = RestoreManager().restore_backup(record)
+
+        assert result.skipped_files == [str(dest)]
+        assert dest.read_bytes() == b"local"
@@ -0,0 +1,33 @@
+"""Tests for the RomEntry model."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.models.rom_entry import RomEntry, RomInfo
+
+
+@pytest.mark.parametrize(
+    ("region", "expected"),
+    [
+        ("Japan", "ja"),
+        ("Hong Kong", "zh"),
+        ("USA", "en"),
+        ("", "en"),
+    ],
+)
+def test_display_name_prefers_region_language(region: str, expected: str) -> None:
+    info = RomInfo(title_name="raw", title_name_zh="zh", title_name_en="en", title_name_ja="ja")
+    info.region = region
+    entry = RomEntry(rom_path="/r", platform="gba", emulator="", game_id="ID", rom_info=info)
+    assert entry.display_name == expected
+
+
+def test_display_name_falls_back_to_raw_title_then_game_id() -> None:
+    entry = RomEntry(rom_path="/r", platform="gba", emulator="", game_id="ID")
+    assert entry.display_name == "ID"
+    entry.rom_info = RomInfo(title_name="raw")
+    entry.rom_info.region = "Japan"
+    assert entry.display_name == "raw"
+    entry.rom_info = RomInfo()
+    assert entry.display_name == "ID"
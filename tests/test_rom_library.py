@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from app.data.rom_library import RomLibrary
-from app.models.rom_entry import RomEntry
+from app.models.rom_entry import RomEntry, RomInfo
 
 
 @pytest.fixture
@@ -57,3 +60,202 @@ class TestRomLibrary:
         lib2 = RomLibrary(path)
         result = lib2.get("0100509005AF0000", "switch")
         assert result is not None
+
+
+class TestCrcCache:
+    def test_hit_requires_matching_size_and_mtime(self, tmp_path: Path) -> None:
+        lib = RomLibrary(tmp_path)
+        lib.store_crc("/roms/a.gba", 10, 123, "DEADBEEF")
+        assert lib.cached_crc("/roms/a.gba", 10, 123) == "DEADBEEF"
+        assert lib.cached_crc("/roms/a.gba", 11, 123) is None
+        assert lib.cached_crc("/roms/a.gba", 10, 124) is None
+        assert lib.cached_crc("/roms/b.gba", 10, 123) is None
+
+    def test_persists_across_load(self, tmp_path: Path) -> None:
+        lib = RomLibrary(tmp_path)
+        lib.store_crc("/roms/a.gba", 10, 123, "DEADBEEF")
+        lib.save()
+
+        reloaded = RomLibrary(tmp_path)
+        reloaded.load()
+        assert reloaded.cached_crc("/roms/a.gba", 10, 123) == "DEADBEEF"
+
+    def test_survives_clear_and_follows_rename(self, tmp_path: Path) -> None:
+        lib = RomLibrary(tmp_path)
+        lib.store_crc("/roms/a.gba", 10, 123, "DEADBEEF")
+        lib.clear()
+        lib.update_path("/roms/a.gba", "/roms/b.gba")
+        assert lib.cached_crc("/roms/a.gba", 10, 123) is None
+        assert lib.cached_crc("/roms/b.gba", 10, 123) == "DEADBEEF"
+
+    def test_prune(self, tmp_path: Path) -> None:
+        lib = RomLibrary(tmp_path)
+        lib.store_crc("/roms/a.gba", 10, 123, "AAAAAAAA")
+        lib.store_crc("/roms/b.gba", 10, 123, "BBBBBBBB")
+        lib.prune_crc_cache({"/roms/b.gba"})
+        assert lib.cached_crc("/roms/a.gba", 10, 123) is None
+        assert lib.cached_crc("/roms/b.gba", 10, 123) == "BBBBBBBB"
+
+
+class TestBatched:
+    def test_saves_once_at_outermost_exit(self, tmp_path: Path, spy: Callable[..., list]) -> None:
+        lib = RomLibrary(tmp_path)
+        writes = spy(RomLibrary, "_save_crc_cache")
+        with lib.batched():
+            lib.save()
+            with lib.batched():
+                lib.save()
+            lib.save()
+            assert writes == []
+            assert not (tmp_path / "rom_library.json").exists()
+        assert len(writes) == 1
+        assert (tmp_path / "rom_library.json").exists()
+
+    def test_no_write_without_save(self, tmp_path: Path) -> None:
+        lib = RomLibrary(tmp_path)
+        with lib.batched():
+            pass
+        assert not (tmp_path / "rom_library.json").exists()
+
+
+def test_add_many_keys_like_add(tmp_path: Path) -> None:
+    lib = RomLibrary(tmp_path)
+    first = RomEntry(rom_path="/roms/a.gba", platform="gba", emulator="", game_id="A")
+    second = RomEntry(rom_path="/roms/b.gba", platform="gba", emulator="", game_id="B")
+    again = RomEntry(rom_path="/roms/a2.gba", platform="gba", emulator="", game_id="A")
+    lib.add_many([first, second, again])
+    assert lib.count == 2
+    assert lib.get("gba", "A") is again
+    assert first.added_at and first.added_at == second.added_at
+
+
+def test_added_at_is_epoch_ns_and_migrates_iso_strings(tmp_path: Path) -> None:
+    legacy = {
+        "version": 1,
+        "roms": {
+            "gba:A": {
+                "rom_path": "/roms/a.gba",
+                "platform": "gba",
+                "emulator": "",
+                "game_id": "A",
+                "added_at": "2024-05-01T12:30:45.123456+00:00",
+            }
+        },
+    }
+    (tmp_path / "rom_library.json").write_text(json.dumps(legacy), encoding="utf-8")
+    lib = RomLibrary(tmp_path)
+    lib.load()
+
+    entry = lib.get("gba", "A")
+    assert entry is not None
+    assert entry.added_at == 1714566645_123456_000
+    assert entry.added_at_iso == "2024-05-01T12:30:45.123456+00:00"
+
+    lib.save()
+    saved = json.loads((tmp_path / "rom_library.json").read_text(encoding="utf-8"))
+    assert saved["roms"]["gba:A"]["added_at"] == 1714566645_123456_000
+
+
+def test_platform_and_emulator_indexes_follow_updates(tmp_path: Path) -> None:
+    lib = RomLibrary(tmp_path)
+    a = RomEntry(rom_path="/roms/a.gba", platform="gba", emulator="mgba", game_id="A")
+    b = RomEntry(rom_path="/roms/b.nes", platform="nes", emulator="mesen", game_id="B")
+    lib.add_many([a, b])
+    moved = RomEntry(rom_path="/roms/a.gba", platform="gba", emulator="other", game_id="A")
+    lib.add(moved)
+
+    assert lib.entries_by_platform("gba") == [moved]
+    assert lib.entries_by_emulator("mgba") == []
+    assert lib.entries_by_emulator("other") == [moved]
+
+    lib.remove("nes", "B")
+    assert lib.entries_by_platform("nes") == []
+    assert lib.entries_by_emulator("mesen") == []
+
+    lib.save()
+    reloaded = RomLibrary(tmp_path)
+    reloaded.load()
+    assert [e.game_id for e in reloaded.entries_by_emulator("other")] == ["A"]
+
+
+def test_crc_index_tracks_late_crcs_and_removal(tmp_path: Path) -> None:
+    lib = RomLibrary(tmp_path)
+    a = RomEntry(rom_path="/a.gba", platform="gba", emulator="", game_id="A", hash_crc32="AAAA")
+    b = RomEntry(rom_path="/b.gba", platform="gba", emulator="", game_id="B")
+    c = RomEntry(rom_path="/c.nes", platform="nes", emulator="", game_id="C", hash_crc32="AAAA")
+    lib.add_many([a, b, c])
+    assert lib.find_by_hash("AAAA") == [a, c]
+
+    lib.set_crc32(b, "AAAA")
+    assert lib.find_by_hash("AAAA") == [a, c, b]
+
+    lib.remove("gba", "A")
+    lib.add(RomEntry(rom_path="/c", platform="nes", emulator="", game_id="C", hash_crc32="BBBB"))
+    assert lib.find_by_hash("AAAA") == [b]
+    assert [e.rom_path for e in lib.find_by_hash("BBBB")] == ["/c"]
+
+
+def test_rom_info_round_trips(tmp_path: Path) -> None:
+    lib = RomLibrary(tmp_path)
+    info = RomInfo(title_name="Zelda", dat_crc32=["DEADBEEF"], signature_valid=True)
+    lib.add(RomEntry(rom_path="/z.gba", platform="gba", emulator="", game_id="Z", rom_info=info))
+    lib.add(RomEntry(rom_path="/y.gba", platform="gba", emulator="", game_id="Y"))
+    lib.save()
+
+    reloaded = RomLibrary(tmp_path)
+    reloaded.load()
+    assert reloaded.get("gba", "Z").rom_info == info
+    assert reloaded.get("gba", "Y").rom_info is None
+
+
+def test_find_duplicates_only_pairs_same_platform(tmp_path: Path) -> None:
+    lib = RomLibrary(tmp_path)
+    a = RomEntry(rom_path="/a.gba", platform="gba", emulator="", game_id="A", hash_crc32="AAAA")
+    b = RomEntry(rom_path="/b.gba", platform="gba", emulator="", game_id="B")
+    c = RomEntry(rom_path="/c.nes", platform="nes", emulator="", game_id="C", hash_crc32="AAAA")
+    lib.add_many([a, b, c])
+    assert lib.find_duplicates() == []
+
+    lib.set_crc32(b, "AAAA")
+    assert lib.find_duplicates() == [[a, b]]
+
+    lib.remove("gba", "A")
+    assert lib.find_duplicates() == []
+    lib.add(RomEntry(rom_path="/a", platform="gba", emulator="", game_id="A", hash_crc32="BBBB"))
+    assert lib.find_duplicates() == []
+
+
+def test_crc_cache_accepts_stores_from_worker_threads(tmp_path: Path) -> None:
+    lib = RomLibrary(tmp_path)
+
+    def store(i: int) -> None:
+        lib.store_crc(f"/roms/{i}.rom", i, i, f"{i:08x}")
+        if i % 100 == 0:
+            lib.save()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(store, range(2000)))
+    lib.save()
+
+    reloaded = RomLibrary(tmp_path)
+    reloaded.load()
+    assert all(reloaded.cached_crc(f"/roms/{i}.rom", i, i) == f"{i:08x}" for i in range(2000))
+
+
+def test_update_path_follows_the_path_index(tmp_path: Path) -> None:
+    lib = RomLibrary(tmp_path)
+    a = RomEntry(rom_path="/roms/a.gba", platform="gba", emulator="", game_id="A")
+    b = RomEntry(rom_path="/roms/b.gba", platform="gba", emulator="", game_id="B")
+    lib.add_many([a, b])
+
+    lib.update_path("/roms/a.gba", "/roms/renamed.gba")
+    lib.update_path("/roms/a.gba", "/roms/again.gba")  # old path is gone: no-op
+    assert (a.rom_path, b.rom_path) == ("/roms/renamed.gba", "/roms/b.gba")
+
+    lib.add(RomEntry(rom_path="/roms/moved.gba", platform="gba", emulator="", game_id="B"))
+    lib.update_path("/roms/b.gba", "/roms/stale.gba")
+    assert lib.get("gba", "B").rom_path == "/roms/moved.gba"
+
+    lib.remove("gba", "A")
+    lib.update_path("/roms/renamed.gba", "/roms/x.gba")
+    assert a.rom_path == "/roms/renamed.gba"
@@ -0,0 +1,428 @@
+"""Tests for RomManager directory scanning."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import zipfile
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app import utils
+from app.core import rom_manager
+from app.core.rename_engine import RenameEngine
+from app.core.rom_manager import (
+    RomManager,
+    _auto_ext_map,
+    _plugin_extensions,
+    _plugin_rom_extensions,
+    _suffix,
+)
+from app.data import rom_library
+from app.data.rom_library import RomLibrary
+from app.models.rom_entry import RomEntry, RomInfo
+from app.plugins.base import GamePlugin
+from app.utils import crc32_file
+
+
+class FakePlugin(GamePlugin):
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    @property
+    def display_name(self) -> str:
+        return "Fake"
+
+    @property
+    def platform(self) -> str:
+        return "fake"
+
+    def get_rom_extensions(self) -> list[str]:
+        return [".rom"]
+
+    def parse_rom_info(self, rom_path: Path) -> RomInfo | None:
+        return None
+
+    def extract_game_id(self, rom_path: Path) -> str:
+        crc32_file(rom_path)  # like the real plugins, which hash the ROM too
+        return rom_path.stem
+
+
+@pytest.fixture
+def rom_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "roms"
+    (root / "sub" / "deeper").mkdir(parents=True)
+    for i in range(12):
+        (root / f"game{i:02d}.rom").write_bytes(bytes([i]) * 64)
+    (root / "sub" / "deeper" / "nested.rom").write_bytes(b"nested")
+    (root / "sub" / "readme.txt").write_text("not a rom")
+    return root
+
+
+@pytest.fixture
+def hashed(spy: Callable[..., list]) -> list[int]:
+    """Size of every buffer the CRC32 primitive runs over."""
+    return spy(utils, "_crc32", lambda data, *_: len(data))
+
+
+def _manager(
+    tmp_path: Path, rom_directories: object, **settings: object
+) -> tuple[RomManager, RomLibrary]:
+    settings["rom_directories"] = rom_directories
+    config = MagicMock()
+    config.get.side_effect = lambda key, default=None: settings.get(key, default)
+    plugins = MagicMock()
+    plugins.get_game_plugin.return_value = FakePlugin()
+    plugins.game_plugins = [FakePlugin()]
+    library = RomLibrary(tmp_path / "data")
+    return RomManager(config, library, plugins, MagicMock()), library
+
+
+class TestScan:
+    @pytest.mark.parametrize("layout", ["platform", "auto"])
+    def test_scan_indexes_all_roms(
+        self, tmp_path: Path, rom_dir: Path, layout: str
+    ) -> None:
+        dirs = {"fake": [str(rom_dir)]} if layout == "platform" else [str(rom_dir)]
+        manager, library = _manager(tmp_path, dirs)
+
+        entries = manager.scan_directories()
+
+        ids = [e.game_id for e in entries]
+        assert sorted(ids) == sorted([f"game{i:02d}" for i in range(12)] + ["nested"])
+        assert len(library.all_entries()) == 13
+        assert all(e.hash_crc32 for e in entries)
+        assert len({e.added_at for e in entries}) == 1
+        assert entries[0].added_at
+
+    @pytest.mark.parametrize(("configured", "expected"), [(0, 3), (1, 1)])
+    def test_scan_workers_setting(
+        self,
+        tmp_path: Path,
+        rom_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        spy: Callable[..., list],
+        configured: int,
+        expected: int,
+    ) -> None:
+        pools = spy(rom_manager, "ThreadPoolExecutor", lambda max_workers: max_workers)
+        monkeypatch.setattr(rom_manager, "_SCAN_WORKERS", 3)
+        manager, _ = _manager(tmp_path, [str(rom_dir)], scan_workers=configured)
+
+        assert len(manager.scan_directories()) == 13
+        assert pools == [expected]
+
+    def test_missing_directory_is_skipped(self, tmp_path: Path) -> None:
+        manager, _ = _manager(tmp_path, {"fake": [str(tmp_path / "nope")]})
+        assert manager.scan_directories() == []
+
+    def test_suffix_match_is_case_insensitive(self, tmp_path: Path, rom_dir: Path) -> None:
+        (rom_dir / "LOUD.ROM").write_bytes(b"loud")
+        manager, _ = _manager(tmp_path, [str(rom_dir)])
+        assert "LOUD" in {e.game_id for e in manager.scan_directories()}
+
+    def test_symlinked_directories_are_not_followed(self, tmp_path: Path, rom_dir: Path) -> None:
+        (rom_dir / "loop").symlink_to(rom_dir, target_is_directory=True)
+        manager, _ = _manager(tmp_path, [str(rom_dir)])
+        assert len(manager.scan_directories()) == 13
+
+    def test_walker_filters_by_suffix_and_follows_file_symlinks(
+        self, tmp_path: Path, rom_dir: Path
+    ) -> None:
+        (rom_dir / "linked.ROM").symlink_to(rom_dir / "game00.rom")
+        (rom_dir / "dangling.txt").symlink_to(rom_dir / "missing")
+        (rom_dir / "dangling.rom").symlink_to(rom_dir / "missing")
+
+        found = sorted(
+            (Path(p).name, s) for p, s in RomManager._walk_files([str(rom_dir)], {".rom"})
+        )
+
+        assert ("linked.ROM", ".rom") in found
+        assert len(found) == 14
+        assert all(s == ".rom" for _, s in found)
+
+    def test_each_rom_is_hashed_once_and_not_again_on_rescan(
+        self, tmp_path: Path, rom_dir: Path, hashed: list[int]
+    ) -> None:
+        manager, _ = _manager(tmp_path, [str(rom_dir)])
+
+        manager.scan_directories()
+        assert len(hashed) == 13
+        hashed.clear()
+        manager.scan_directories()
+        assert hashed == []
+
+    def test_zipped_rom_is_hashed_from_memory_once(
+        self, tmp_path: Path, hashed: list[int]
+    ) -> None:
+        root = tmp_path / "roms"
+        root.mkdir()
+        with zipfile.ZipFile(root / "packed.zip", "w") as zf:
+            zf.writestr("packed.rom", b"rom bytes" * 100)
+        manager, _ = _manager(tmp_path, [str(root)])
+
+        entries = manager.scan_directories()
+
+        assert [e.rom_path for e in entries] == [str(root / "packed.zip")]
+        assert entries[0].hash_crc32 == f"{zlib.crc32(b'rom bytes' * 100):08X}"
+        assert hashed == [900]
+
+    def test_zipped_rom_central_directory_parsed_once(
+        self, tmp_path: Path, spy: Callable[..., list]
+    ) -> None:
+        root = tmp_path / "roms"
+        root.mkdir()
+        with zipfile.ZipFile(root / "packed.zip", "w") as zf:
+            zf.writestr("readme.txt", b"not a rom")
+            zf.writestr("packed.rom", b"rom bytes")
+        parses = spy(zipfile.ZipFile, "_RealGetContents", lambda zf: zf.filename)
+        manager, _ = _manager(tmp_path, [str(root)])
+
+        entries = manager.scan_directories()
+
+        assert [e.rom_path for e in entries] == [str(root / "packed.zip")]
+        assert parses == [str(root / "packed.zip")]
+
+
+@pytest.mark.parametrize("name", ["a.GBA", "noext", ".hidden", "a.b.c", "trailing.", "..a"])
+def test_suffix_matches_pathlib(name: str) -> None:
+    assert _suffix(name) == Path(name).suffix.lower()
+
+
+class TestUpdateRomInZip:
+    def test_replaces_rom_and_copies_other_entries_verbatim(self, tmp_path: Path) -> None:
+        class Unseekable(io.RawIOBase):
+            """Forces zipfile to emit data descriptors, like streaming zippers do."""
+
+            def __init__(self) -> None:
+                self.buf = bytearray()
+
+            def writable(self) -> bool:
+                return True
+
+            def write(self, b: bytes) -> int:  # type: ignore[override]
+                self.buf += b
+                return len(b)
+
+        sink = Unseekable()
+        with zipfile.ZipFile(sink, "w") as zf:
+            zf.writestr("readme.txt", b"hello " * 100, zipfile.ZIP_DEFLATED)
+            zf.writestr("game.nes", b"NES\x1a" + b"\x00" * 60, zipfile.ZIP_DEFLATED)
+            zf.writestr("notes/raw.bin", bytes(range(256)), zipfile.ZIP_STORED)
+        zip_path = tmp_path / "game.zip"
+        zip_path.write_bytes(bytes(sink.buf))
+        with zipfile.ZipFile(zip_path) as zf:
+            before = {i.filename: i for i in zf.infolist()}
+        assert before["readme.txt"].flag_bits & 0x08
+
+        RomManager._update_rom_in_zip(zip_path, "game.nes", b"fixed rom")
+
+        assert (tmp_path / "game.zip.bak").exists()
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == ["readme.txt", "game.nes", "notes/raw.bin"]
+            assert zf.read("game.nes") == b"fixed rom"
+            assert zf.read("readme.txt") == b"hello " * 100
+            assert zf.read("notes/raw.bin") == bytes(range(256))
+            after = {i.filename: i for i in zf.infolist()}
+        for name in ("readme.txt", "notes/raw.bin"):
+            assert after[name].compress_type == before[name].compress_type
+            assert after[name].compress_size == before[name].compress_size
+            assert after[name].date_time == before[name].date_time
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+    def test_untouched_entries_are_never_decompressed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        zip_path = tmp_path / "set.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("game.nes", b"rom")
+            for i in range(5):
+                zf.writestr(f"extra{i}.bin", bytes(1000))
+
+        real_open = zipfile.ZipFile.open
+
+        def guarded_open(
+            self: zipfile.ZipFile,
+            name: str | zipfile.ZipInfo,
+            mode: str = "r",
+            *args: object,
+            **kwargs: object,
+        ) -> object:
+            target = name.filename if isinstance(name, zipfile.ZipInfo) else name
+            assert mode == "w" or target == "game.nes", f"decompressed {target}"
+            return real_open(self, name, mode, *args, **kwargs)
+
+        monkeypatch.setattr(zipfile.ZipFile, "open", guarded_open)
+        RomManager._update_rom_in_zip(zip_path, "game.nes", b"fixed")
+        monkeypatch.undo()
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.read("game.nes") == b"fixed"
+            assert all(zf.read(f"extra{i}.bin") == bytes(1000) for i in range(5))
+
+
+def test_compute_hash_covers_only_max_bytes(tmp_path: Path) -> None:
+    data = bytes(range(256)) * 10_000
+    rom = tmp_path / "big.rom"
+    rom.write_bytes(data)
+    assert RomManager._compute_hash(rom) == hashlib.sha256(data).hexdigest()
+    assert RomManager._compute_hash(rom, max_bytes=1000) == hashlib.sha256(data[:1000]).hexdigest()
+
+
+def test_plugin_extensions_are_lowercased_and_cached() -> None:
+    class MixedCase(FakePlugin):
+        calls = 0
+
+        def get_rom_extensions(self) -> list[str]:
+            MixedCase.calls += 1
+            return [".ROM", ".Bin", ".zip"]
+
+    plugin = MixedCase()
+    assert _plugin_extensions(plugin) == {".rom", ".bin", ".zip"}
+    assert _plugin_rom_extensions(plugin) == {".rom", ".bin"}
+    _plugin_extensions(plugin)
+    assert MixedCase.calls == 1
+
+
+def test_auto_ext_map_is_cached_and_later_plugin_wins() -> None:
+    class Other(FakePlugin):
+        def get_rom_extensions(self) -> list[str]:
+            return [".rom", ".oth"]
+
+    fake, other = FakePlugin(), Other()
+    ext_map = _auto_ext_map((fake, other))
+    assert dict(ext_map) == {".rom": other, ".oth": other}
+    assert _auto_ext_map((fake, other)) is ext_map
+
+
+class TestRenameTokens:
+    def test_only_referenced_tokens_are_built(self, tmp_path: Path) -> None:
+        manager, _ = _manager(tmp_path, [])
+        plugin = manager._plugins.get_game_plugin.return_value
+        plugin.resolve_game_name = MagicMock(return_value="塞尔达")
+        entry = RomEntry(rom_path="/roms/zelda.rom", platform="fake", emulator="", game_id="zelda")
+
+        tokens = manager._build_rename_tokens(entry, RenameEngine.referenced_keys("{crc32}"))
+        assert "ext" not in tokens and "title" not in tokens
+        plugin.resolve_game_name.assert_not_called()
+
+        tokens = manager._build_rename_tokens(entry)
+        assert tokens["ext"] == "rom"
+        assert tokens["title_zh"] == "塞尔达"
+
+
+class NoHashPlugin(FakePlugin):
+    def extract_game_id(self, rom_path: Path) -> str:
+        return rom_path.stem
+
+
+class TestLazyCrc:
+    def _scan(self, tmp_path: Path, rom_dir: Path, **settings: object) -> RomManager:
+        manager, _ = _manager(tmp_path, [str(rom_dir)], **settings)
+        manager._plugins.game_plugins = [NoHashPlugin()]
+        manager.scan_directories()
+        return manager
+
+    def test_scan_skips_crc_nobody_needed(
+        self, tmp_path: Path, rom_dir: Path, hashed: list[int]
+    ) -> None:
+        manager = self._scan(tmp_path, rom_dir, eager_crc32=False)
+
+        assert hashed == []
+        entry = manager._library.get("fake", "game03")
+        assert entry is not None and entry.hash_crc32 == ""
+
+        tokens = manager._build_rename_tokens(entry, RenameEngine.referenced_keys("{crc32}"))
+        assert tokens["crc32"] == entry.hash_crc32 == f"{zlib.crc32(bytes([3]) * 64):08X}"
+        assert hashed == [64]
+        assert manager.ensure_crc32(entry) == entry.hash_crc32
+        assert hashed == [64]
+
+    def test_unhashable_rom_is_not_retried_until_it_changes(
+        self,
+        tmp_path: Path,
+        rom_dir: Path,
+        spy: Callable[..., list],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        manager = self._scan(tmp_path, rom_dir, eager_crc32=False)
+        entry = manager._library.get("fake", "game03")
+        attempts = spy(RomManager, "_compute_crc32", lambda path, *_: path.name)
+
+        def unreadable(*_args: object) -> int:
+            raise OSError("I/O error")
+
+        monkeypatch.setattr(utils, "_crc32", unreadable)
+
+        assert manager.ensure_crc32(entry) == ""
+        assert manager.ensure_crc32(entry) == ""
+        assert attempts == ["game03.rom"]
+
+        monkeypatch.undo()
+        Path(entry.rom_path).write_bytes(b"changed")
+        assert manager.ensure_crc32(entry) == f"{zlib.crc32(b'changed'):08X}"
+
+    def test_scan_hashes_eagerly_by_default(
+        self, tmp_path: Path, rom_dir: Path, hashed: list[int]
+    ) -> None:
+        manager = self._scan(tmp_path, rom_dir)
+
+        assert len(hashed) == 13
+        assert all(e.hash_crc32 for e in manager._library.all_entries())
+
+    def test_duplicates_are_found_when_scan_skipped_crcs(
+        self, tmp_path: Path, rom_dir: Path, spy: Callable[..., list]
+    ) -> None:
+        (rom_dir / "copy.rom").write_bytes(bytes([3]) * 64)  # same bytes as game03
+        manager = self._scan(tmp_path, rom_dir, eager_crc32=False)
+        writes = spy(rom_library, "atomic_write_bytes", lambda path, _: path.name)
+
+        dups = manager.find_duplicates()
+
+        assert [sorted(e.game_id for e in group) for group in dups] == [["copy", "game03"]]
+        assert writes.count("rom_library.json") == 1  # every CRC filled in, one write
+        assert [e.game_id for e in manager.find_by_hash(dups[0][0].hash_crc32)] == [
+            e.game_id for e in dups[0]
+        ]
+
+
+def test_batch_rename_keeps_extension(tmp_path: Path) -> None:
+    manager, library = _manager(tmp_path, [])
+    manager._rename = RenameEngine()
+    rom = tmp_path / "old name.rom"
+    rom.write_bytes(b"rom")
+    entry = RomEntry(rom_path=str(rom), platform="fake", emulator="", game_id="zelda")
+    library.add(entry)
+
+    assert manager.batch_rename([entry], "{id}{platform}", dry_run=True) == [
+        ("old name.rom", "fake.rom")
+    ]
+    assert manager.batch_rename([("fake", "zelda")], "{platform}-{ext}.{ext}") == [
+        ("old name.rom", "fake-rom.rom")
+    ]
+    assert (tmp_path / "fake-rom.rom").read_bytes() == b"rom"
+    assert entry.rom_path == str(tmp_path / "fake-rom.rom")
+
+
+def test_rename_moves_crc_cache_entry(tmp_path: Path) -> None:
+    manager, library = _manager(tmp_path, [])
+    manager._rename = RenameEngine()
+    rom = tmp_path / "old name.rom"
+    rom.write_bytes(b"rom")
+    entry = RomEntry(rom_path=str(rom), platform="fake", emulator="", game_id="zelda")
+    library.add(entry)
+    st = rom.stat()
+    library.store_crc(str(rom), st.st_size, st.st_mtime_ns, crc32_file(rom))
+
+    new_path = manager.rename_rom("fake", "zelda", "{platform}.{ext}")
+
+    assert new_path == tmp_path / "fake.rom"
+    assert entry.rom_path == str(new_path)
+    assert library.cached_crc(str(rom), st.st_size, st.st_mtime_ns) is None
+    assert library.cached_crc(str(new_path), st.st_size, st.st_mtime_ns) == crc32_file(new_path)
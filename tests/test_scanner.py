@@ -0,0 +1,60 @@
+"""Tests for the save Scanner."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.scanner import Scanner
+from app.models.emulator import EmulatorInfo
+from app.models.game_save import GameSave
+from app.plugins.base import EmulatorPlugin
+
+
+def _install(name: str, data: str) -> EmulatorInfo:
+    return EmulatorInfo(name=name, install_path=Path(data), data_path=Path(data))
+
+
+def test_installations_are_scanned_concurrently_in_stable_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(Scanner, "_SCAN_WORKERS", 4)
+    # Every scan waits for the other two — deadlocks unless they overlap
+    all_running = threading.Barrier(3, timeout=5)
+
+    def scan_saves(emulator: EmulatorInfo) -> list[GameSave]:
+        all_running.wait()
+        if emulator.data_path.name == "broken":
+            raise OSError("unreadable")
+        return [
+            GameSave(emulator=emulator.name, game_name="", game_id=gid, platform="none")
+            for gid in (emulator.data_path.name, "shared")
+        ]
+
+    plugin = MagicMock(display_name="Fake")
+    plugin.scan_saves.side_effect = scan_saves
+    plugins = MagicMock()
+    plugins.get_emulator_plugin.side_effect = lambda name: plugin if name != "missing" else None
+    plugins.get_game_plugin.return_value = None
+    detected = {
+        "emu": [_install("emu", "/a"), _install("emu", "/broken"), _install("emu", "/b")],
+        "missing": [_install("missing", "/c")],
+    }
+
+    saves = Scanner(plugins, MagicMock()).scan_all_saves(detected)
+
+    assert [s.game_id for s in saves] == ["a", "shared", "b"]
+
+
+def test_deduplicate_keeps_first_of_each_key() -> None:
+    saves = [
+        GameSave(emulator=emu, game_name="", game_id=gid, platform="gba")
+        for emu, gid in [("a", "x"), ("a", "x"), ("a:x", ""), ("b", "x")]
+    ]
+    assert EmulatorPlugin.deduplicate(saves) == [saves[0], saves[2], saves[3]]
+
+    installs = [_install("emu", "/a"), _install("emu", "/b"), _install("other", "/a")]
+    assert EmulatorPlugin.deduplicate_installations(installs) == installs[:2]
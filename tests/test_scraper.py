@@ -0,0 +1,230 @@
+"""Tests for the multi-provider Scraper service."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.scraper import Scraper
+from app.data import scrape_cache
+from app.data.scrape_cache import ScrapeCache
+from app.models.scrape_result import MergedMetadata, ScrapeResult
+from app.scrapers.base import ScraperProvider
+
+
+class FakeProvider(ScraperProvider):
+    def __init__(self, name: str, search: Callable[[], ScrapeResult | None]) -> None:
+        self._name = name
+        self._search = search
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def display_name(self) -> str:
+        return self._name.upper()
+
+    def supports_platform(self, platform: str) -> bool:
+        return platform == "gba"
+
+    def search(self, query: str, platform: str) -> ScrapeResult | None:
+        self.calls += 1
+        return self._search()
+
+    def search_multi(self, query: str, platform: str) -> list[ScrapeResult]:
+        return []
+
+
+def _scraper(tmp_path: Path, *providers: ScraperProvider) -> Scraper:
+    config = MagicMock()
+    config.field_priority = {}
+    scraper = Scraper(config, ScrapeCache(tmp_path / "cache"))
+    for provider in providers:
+        scraper.register_provider(provider)
+    return scraper
+
+
+class TestScrape:
+    def test_providers_run_concurrently_and_merge_in_registration_order(
+        self, tmp_path: Path
+    ) -> None:
+        # Each search blocks until both are in flight — deadlocks if sequential
+        both_running = threading.Barrier(2, timeout=5)
+
+        def found(title: str) -> Callable[[], ScrapeResult]:
+            def search() -> ScrapeResult:
+                both_running.wait()
+                return ScrapeResult(provider=title, title=title, developer=title)
+
+            return search
+
+        scraper = _scraper(tmp_path, FakeProvider("a", found("a")), FakeProvider("b", found("b")))
+
+        merged = scraper.scrape("AGB-TEST", "gba")
+
+        assert merged.fields["title"] == "a"
+        assert set(merged.sources.values()) == {"a"}
+        cache = ScrapeCache(tmp_path / "cache")
+        assert cache.get_provider("gba", "AGB-TEST", "b") is not None
+        assert cache.get_merged("gba", "AGB-TEST") is not None
+
+    def test_slow_or_failing_provider_does_not_block_merge(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Scraper, "_PROVIDER_TIMEOUT", 0.05)
+        release = threading.Event()
+
+        def stuck() -> None:
+            release.wait(5)
+
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        scraper = _scraper(
+            tmp_path,
+            FakeProvider("slow", stuck),
+            FakeProvider("broken", broken),
+            FakeProvider("ok", lambda: ScrapeResult(provider="ok", title="Zelda")),
+        )
+        try:
+            merged = scraper.scrape("AGB-TEST", "gba")
+        finally:
+            release.set()
+
+        assert merged.fields["title"] == "Zelda"
+        assert set(merged.sources.values()) == {"ok"}
+
+    def test_unsupported_platform_is_not_queried(self, tmp_path: Path) -> None:
+        provider = FakeProvider("a", lambda: ScrapeResult(title="x"))
+        scraper = _scraper(tmp_path, provider)
+
+        merged = scraper.scrape("SLUS-00001", "ps2")
+
+        assert provider.calls == 0
+        assert merged.fields == {}
+
+
+def test_merge_follows_field_priority_and_skips_empty(tmp_path: Path) -> None:
+    scraper = _scraper(tmp_path)
+    scraper._config.field_priority = {"title": ["b", "a"], "genre": ["b", "a"]}
+    results = {
+        "a": ScrapeResult(provider="a", title="A", genre="RPG", players=2),
+        "b": ScrapeResult(provider="b", title="B", genre=""),
+    }
+
+    merged = scraper._merge_results(results, "gba")
+
+    assert merged.fields["title"] == "B"
+    assert merged.fields["genre"] == "RPG"
+    assert merged.sources["players"] == "a"  # unconfigured: registration order
+
+
+class TestNegativeCache:
+    def test_not_found_is_not_asked_again_for_same_query(self, tmp_path: Path) -> None:
+        empty = FakeProvider("a", lambda: None)
+        scraper = _scraper(tmp_path, empty)
+
+        assert scraper.scrape_single("a", "AGB-TEST", "gba") is None
+        assert scraper.scrape_single("a", "AGB-TEST", "gba") is None
+        scraper.scrape("AGB-TEST", "gba")
+        assert empty.calls == 1
+
+        assert scraper.scrape_single("a", "AGB-TEST", "gba", query="Zelda") is None
+        assert empty.calls == 2
+
+    def test_force_asks_again_despite_recent_miss(self, tmp_path: Path) -> None:
+        empty = FakeProvider("a", lambda: None)
+        scraper = _scraper(tmp_path, empty)
+        scraper.scrape("AGB-TEST", "gba")
+
+        scraper.scrape("AGB-TEST", "gba", force=True)
+        scraper.scrape_single("a", "AGB-TEST", "gba", force=True)
+        assert empty.calls == 3
+
+    def test_miss_expires_and_is_cleared_by_a_hit(self, tmp_path: Path) -> None:
+        cache = ScrapeCache(tmp_path)
+        cache.mark_missing("a", "gba", "AGB-TEST", "q", ttl=-1)
+        cache.mark_missing("b", "gba", "AGB-TEST", "q")
+        assert cache.missing_providers("gba", "AGB-TEST", "q") == {"b"}
+
+        cache.save_result(ScrapeResult(game_id="AGB-TEST", platform="gba", provider="b"))
+        assert cache.missing_providers("gba", "AGB-TEST", "q") == set()
+
+
+class TestFileMemo:
+    def test_repeat_reads_skip_disk_and_follow_writes(
+        self, tmp_path: Path, spy: Callable[..., list]
+    ) -> None:
+        cache = ScrapeCache(tmp_path)
+        reads = spy(ScrapeCache, "_read_cache_file", lambda _, platform, game_id: game_id)
+
+        assert cache.get_merged("gba", "A") is None
+        assert cache.get_merged("gba", "A") is None
+        assert reads == ["A"]
+
+        cache.save_merged(MergedMetadata(game_id="A", platform="gba", fields={"title": "Z"}))
+        cache.save_result(ScrapeResult(game_id="A", platform="gba", provider="p", title="Z"))
+        assert cache.get_merged("gba", "A").fields == {"title": "Z"}
+        assert cache.get_provider("gba", "A", "p").title == "Z"
+        assert reads == ["A"]
+        on_disk = ScrapeCache(tmp_path)
+        assert on_disk.get_provider("gba", "A", "p").title == "Z"
+        assert on_disk.get_merged("gba", "A").fields == {"title": "Z"}
+
+        cache.invalidate("gba", "A")
+        assert cache.get_merged("gba", "A") is None
+        assert reads == ["A", "A", "A"]  # the fresh instance, then after invalidate
+
+    def test_read_results_do_not_share_the_memo(self, tmp_path: Path) -> None:
+        cache = ScrapeCache(tmp_path)
+        cache.save_merged(MergedMetadata(game_id="A", platform="gba", fields={"title": "Z"}))
+        cache.save_result(ScrapeResult(game_id="A", platform="gba", provider="p", tags=["rpg"]))
+
+        cache.get_merged("gba", "A").fields["title"] = "changed"
+        cache.get_provider("gba", "A", "p").tags.append("changed")
+
+        assert cache.get_merged("gba", "A").fields == {"title": "Z"}
+        assert cache.get_provider("gba", "A", "p").tags == ["rpg"]
+
+    def test_concurrent_saves_of_one_game_keep_every_provider(self, tmp_path: Path) -> None:
+        cache = ScrapeCache(tmp_path)
+        names = [f"p{i}" for i in range(32)]
+
+        def save(name: str) -> None:
+            cache.save_result(ScrapeResult(game_id="A", platform="gba", provider=name))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(save, names))
+
+        for reader in (cache, ScrapeCache(tmp_path)):
+            assert all(reader.get_provider("gba", "A", name) for name in names)
+
+    def test_failed_write_leaves_memo_matching_disk(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = ScrapeCache(tmp_path)
+        cache.save_result(ScrapeResult(game_id="A", platform="gba", provider="p", title="old"))
+
+        def failing(path: Path, payload: bytes) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(scrape_cache, "atomic_write_bytes", failing)
+        cache.save_result(ScrapeResult(game_id="A", platform="gba", provider="p", title="new"))
+        cache.mark_missing("q", "gba", "A", "query")
+
+        assert cache.get_provider("gba", "A", "p").title == "old"
+        assert cache.missing_providers("gba", "A", "query") == set()
+
+    def test_memo_is_bounded(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ScrapeCache, "_FILE_MEMO_SIZE", 2)
+        cache = ScrapeCache(tmp_path)
+        for game_id in ("A", "B", "A", "C"):
+            cache.get_merged("gba", game_id)
+        assert list(cache._file_memo) == [("gba", "A"), ("gba", "C")]
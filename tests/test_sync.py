@@ -0,0 +1,177 @@
+"""Tests for the SyncManager."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.sync import SyncManager
+from app.models.backup_record import BackupRecord
+from app.utils import sha256_file
+
+
+def _backup(backup_root: Path, emulator: str, game_id: str, data: bytes) -> BackupRecord:
+    game_dir = backup_root / emulator / game_id
+    game_dir.mkdir(parents=True, exist_ok=True)
+    zip_path = game_dir / "20240101_000000.zip"
+    zip_path.write_bytes(data)
+    meta_path = zip_path.with_suffix(".json")
+    meta_path.write_text("{}", encoding="utf-8")
+    return BackupRecord(
+        zip_path=str(zip_path), meta_path=str(meta_path), emulator=emulator, game_id=game_id
+    )
+
+
+def _sync(tmp_path: Path, backups: dict[str, dict[str, list[BackupRecord]]]) -> SyncManager:
+    config = MagicMock()
+    config.sync_folder = tmp_path / "cloud"
+    config.sync_folder.mkdir(exist_ok=True)
+    config.machine_id = "pc"
+    query = MagicMock()
+    query.backup_root = tmp_path / "local"
+    query.list_all_backups.return_value = backups
+    query.list_backups.side_effect = lambda emu, gid: backups.get(emu, {}).get(gid, [])
+    return SyncManager(config, query)
+
+
+class TestPush:
+    def test_source_is_hashed_once_and_unchanged_copy_not_at_all(
+        self, tmp_path: Path, spy: Callable[..., list]
+    ) -> None:
+        record = _backup(tmp_path / "local", "emu", "game", b"save-v1")
+        src = Path(record.zip_path)
+        sync = _sync(tmp_path, {"emu": {"game": [record]}})
+        hashed = spy(SyncManager, "_file_hash", lambda path: path.name)
+
+        assert sync.push("emu", "game").pushed == 1
+        assert sync.push("emu", "game").pushed == 0
+        assert hashed == [src.name]
+        manifest = sync._read_manifest()
+        assert manifest["emu:game"].file_hash == sha256_file(src)
+
+        # Same bytes, different mtime (e.g. touched by the sync client): hash decides
+        st = src.stat()
+        os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 10**10))
+        assert sync.push("emu", "game").pushed == 0
+        assert hashed == [src.name] * 2
+
+    def test_changed_source_is_pushed_again(self, tmp_path: Path) -> None:
+        record = _backup(tmp_path / "local", "emu", "game", b"save-v1")
+        sync = _sync(tmp_path, {"emu": {"game": [record]}})
+        sync.push("emu", "game")
+
+        Path(record.zip_path).write_bytes(b"save-v2")
+        st = Path(record.zip_path).stat()
+        os.utime(record.zip_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**10))
+
+        assert sync.push("emu", "game").pushed == 1
+        remote = sync.sync_root / "emu" / "game" / Path(record.zip_path).name
+        assert remote.read_bytes() == b"save-v2"
+
+
+class TestSyncAll:
+    def test_manifest_is_written_once_per_run_and_not_when_unchanged(
+        self, tmp_path: Path, spy: Callable[..., list]
+    ) -> None:
+        local = tmp_path / "local"
+        games = {gid: [_backup(local, "emu", gid, gid.encode())] for gid in ("a", "b", "c")}
+        sync = _sync(tmp_path, {"emu": games})
+        writes = spy(SyncManager, "_write_manifest", lambda _, entries: len(entries))
+
+        assert sync.sync_all().pushed == 3
+        assert writes == [3]
+        assert sorted(sync._read_manifest()) == ["emu:a", "emu:b", "emu:c"]
+
+        assert sync.sync_all().pushed == 0
+        assert writes == [3]
+
+    def test_games_are_pushed_concurrently_with_errors_in_order(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        local = tmp_path / "local"
+        games = {gid: [_backup(local, "emu", gid, gid.encode())] for gid in ("a", "b", "c")}
+        sync = _sync(tmp_path, {"emu": games})
+        # Every push waits for the other two — deadlocks unless they overlap
+        all_running = threading.Barrier(3, timeout=5)
+        real = SyncManager.push
+
+        def push(self: SyncManager, emulator: str, game_id: str, manifest: dict) -> object:
+            all_running.wait()
+            if game_id == "b":
+                raise OSError("drive offline")
+            return real(self, emulator, game_id, manifest)
+
+        monkeypatch.setattr(SyncManager, "push", push)
+
+        result = sync.sync_all()
+
+        assert result.pushed == 2
+        assert result.errors == ["Push emu/b: drive offline"]
+        assert sorted(sync._read_manifest()) == ["emu:a", "emu:c"]
+
+    def test_remote_only_games_are_pulled(self, tmp_path: Path) -> None:
+        sync = _sync(tmp_path, {})
+        remote_dir = sync.sync_root / "emu" / "remote"
+        remote_dir.mkdir(parents=True)
+        (remote_dir / "20240101_000000.zip").write_bytes(b"zip")
+        (sync.sync_root / "emu" / "stray.txt").write_text("x")
+        sync._write_manifest({})
+
+        result = sync.sync_all()
+
+        assert (result.pulled, result.errors) == (1, [])
+        assert (tmp_path / "local" / "emu" / "remote" / "20240101_000000.zip").exists()
+
+
+class TestPull:
+    def _remote(self, sync: SyncManager, name: str, data: bytes) -> Path:
+        remote_dir = sync.sync_root / "emu" / "game"
+        remote_dir.mkdir(parents=True, exist_ok=True)
+        path = remote_dir / name
+        path.write_bytes(data)
+        return path
+
+    def test_only_newest_is_pulled_and_existing_copy_is_left_alone(
+        self, tmp_path: Path, spy: Callable[..., list]
+    ) -> None:
+        sync = _sync(tmp_path, {})
+        self._remote(sync, "20240101_000000.zip", b"old")
+        newest = self._remote(sync, "20240301_000000.zip", b"new")
+        newest.with_suffix(".json").write_text('{"v": 1}')
+        hashed = spy(SyncManager, "_file_hash")
+
+        assert sync.pull("emu", "game").pulled == 1
+        assert sync.pull("emu", "game").pulled == 0
+        local_dir = tmp_path / "local" / "emu" / "game"
+        assert sorted(p.name for p in local_dir.iterdir()) == [
+            "20240301_000000.json",
+            "20240301_000000.zip",
+        ]
+        assert len(hashed) == 2  # the copy was verified once; the rerun hashed nothing
+
+    def test_existing_local_backup_is_never_replaced(self, tmp_path: Path) -> None:
+        sync = _sync(tmp_path, {})
+        remote = self._remote(sync, "20240101_000000.zip", b"trunc")
+        local = tmp_path / "local" / "emu" / "game" / remote.name
+        local.parent.mkdir(parents=True)
+        local.write_bytes(b"complete backup")
+
+        assert sync.pull("emu", "game").pulled == 0
+        assert local.read_bytes() == b"complete backup"
+
+    def test_failed_copy_leaves_no_file_behind(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sync = _sync(tmp_path, {})
+        self._remote(sync, "20240101_000000.zip", b"complete")
+        hashes = iter(["copy", "remote"])
+        monkeypatch.setattr(SyncManager, "_file_hash", staticmethod(lambda p: next(hashes)))
+
+        with pytest.raises(OSError, match="does not match"):
+            sync.pull("emu", "game")
+        assert list((tmp_path / "local" / "emu" / "game").iterdir()) == []
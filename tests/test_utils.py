@@ -0,0 +1,147 @@
+"""Tests for shared utility helpers."""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from app import utils
+from app.utils import (
+    atomic_write_bytes,
+    crc32_bytes,
+    crc32_file,
+    crc32_memo,
+    dir_size,
+    forget_crc32,
+    json_dumps_bytes,
+    json_loads,
+    prime_crc32,
+    sanitize_filename,
+    sha256_file,
+    shallow_asdict,
+)
+
+
+class TestAtomicWrite:
+    def test_writes_and_replaces(self, tmp_path: Path) -> None:
+        target = tmp_path / "data.json"
+        target.write_bytes(b"old")
+        atomic_write_bytes(target, b"new")
+        assert target.read_bytes() == b"new"
+
+    def test_leaves_no_temp_files(self, tmp_path: Path) -> None:
+        target = tmp_path / "data.json"
+        atomic_write_bytes(target, b"{}")
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+class TestJsonCodec:
+    def test_round_trip_keeps_unicode(self) -> None:
+        data = {"game_name": "塞尔达传说", "backup_paths": [{"is_dir": False}]}
+        raw = json_dumps_bytes(data)
+        assert "塞尔达传说".encode() in raw
+        assert json_loads(raw) == data
+
+
+class TestSanitizeFilename:
+    def test_clean_name_unchanged(self) -> None:
+        assert sanitize_filename("Zelda [0100F2C0115B6000].nsp") == "Zelda [0100F2C0115B6000].nsp"
+
+    def test_illegal_chars_and_edges(self) -> None:
+        assert sanitize_filename(" Zelda: Tears  of__Kingdom. ") == "Zelda_ Tears of_Kingdom"
+
+
+class TestCrc32File:
+    def test_matches_zlib(self, tmp_path: Path) -> None:
+        data = bytes(range(256)) * 1000
+        rom = tmp_path / "game.gba"
+        rom.write_bytes(data)
+        assert crc32_file(rom) == f"{zlib.crc32(data):08X}"
+
+    def test_bytes_chunks_match_concatenation(self) -> None:
+        header, body = b"NES\x1a" + bytes(12), bytes(range(256)) * 64
+        assert crc32_bytes(header, memoryview(body)) == f"{zlib.crc32(header + body):08X}"
+        assert crc32_bytes() == "00000000"
+
+    def test_empty_and_oversized(self, tmp_path: Path) -> None:
+        rom = tmp_path / "empty.gba"
+        rom.write_bytes(b"")
+        assert crc32_file(rom) == "00000000"
+        rom.write_bytes(b"x" * 10)
+        assert crc32_file(rom, max_size=5) == ""
+
+    def test_memo_hashes_once_until_forgotten(self, tmp_path: Path) -> None:
+        rom = tmp_path / "game.nes"
+        rom.write_bytes(b"first")
+        with crc32_memo():
+            first = crc32_file(rom)
+            rom.write_bytes(b"other")
+            assert crc32_file(rom) == first
+            assert crc32_file(rom, max_size=2) == ""
+            forget_crc32(rom)
+            assert crc32_file(rom) != first
+        rom.write_bytes(b"first")
+        assert crc32_file(rom) == first
+
+    def test_prime_outside_memo_is_ignored(self, tmp_path: Path) -> None:
+        rom = tmp_path / "game.nes"
+        rom.write_bytes(b"data")
+        prime_crc32(rom, 4, "DEADBEEF")
+        assert crc32_file(rom) != "DEADBEEF"
+        with crc32_memo():
+            prime_crc32(rom, 4, "DEADBEEF")
+            assert crc32_file(rom) == "DEADBEEF"
+
+
+def test_shallow_asdict_reads_slots_without_copying() -> None:
+    @dataclass(slots=True)
+    class Inner:
+        value: int = 1
+
+    @dataclass(slots=True)
+    class Outer:
+        name: str = "x"
+        inner: Inner = field(default_factory=Inner)
+        tags: list[str] = field(default_factory=list)
+
+    obj = Outer()
+    d = shallow_asdict(obj)
+
+    assert list(d) == ["name", "inner", "tags"]
+    assert d["inner"] is obj.inner
+    assert d["tags"] is obj.tags
+
+
+def test_dir_size_sums_nested_files_and_tolerates_missing(tmp_path: Path) -> None:
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.bin").write_bytes(b"x" * 3)
+    (tmp_path / "a" / "b" / "deep.bin").write_bytes(b"x" * 5)
+
+    assert dir_size(tmp_path) == 8
+    assert dir_size(tmp_path / "missing") == 0
+
+
+@pytest.mark.parametrize("mmap_min", [0, 1 << 30])
+@pytest.mark.parametrize("mappable", [True, False])
+def test_sha256_file_matches_hashlib_on_every_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mmap_min: int, mappable: bool
+) -> None:
+    monkeypatch.setattr(utils, "_MMAP_DIGEST_MIN", mmap_min)
+    if not mappable:
+
+        def unmappable(*args: object, **kwargs: object) -> mmap.mmap:
+            raise OSError("no mmap here")
+
+        monkeypatch.setattr(mmap, "mmap", unmappable)
+    path = tmp_path / "backup.zip"
+    data = bytes(range(256)) * 10_000
+    path.write_bytes(data)
+
+    assert sha256_file(path) == hashlib.sha256(data).hexdigest()
+    assert sha256_file(path, 1000) == hashlib.sha256(data[:1000]).hexdigest()
+    assert sha256_file(path, len(data) * 2) == hashlib.sha256(data).hexdigest()
@@ -1,10 +1,11 @@
-"""Tests for _extract_version_from_filename in rom_manager and NES plugin."""
+"""Tests for filename version/region extraction in rom_manager and NES plugin."""
 
 from __future__ import annotations
 
 import pytest
 
 from app.core.rom_manager import RomManager
+from app.plugins.nes.plugin import _extract_region_from_filename as nes_region
 from app.plugins.nes.plugin import _extract_version_from_filename as nes_extract
 
 
@@ -65,3 +66,21 @@ def test_rom_manager_extract_version(stem: str, expected: str) -> None:
 )
 def test_nes_extract_version(stem: str, expected: str) -> None:
     assert nes_extract(stem) == expected
+
+
+@pytest.mark.parametrize(
+    "stem, expected",
+    [
+        ("Game (USA)", "USA"),
+        ("Game (Japan, USA)", "Japan"),
+        ("Game (En,Fr) (Europe)", "Europe"),
+        ("Game [US]", "USA"),
+        ("Game ( U )", "USA"),
+        ("Game (USA Demo)", ""),
+        ("Game (Rev 1)", ""),
+        ("Plain Game Name", ""),
+    ],
+)
+def test_extract_region(stem: str, expected: str) -> None:
+    assert RomManager._extract_region_from_filename(stem) == expected
+    assert nes_region(stem) == expected